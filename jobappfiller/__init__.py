@@ -15,30 +15,46 @@
 """Global package variables for distribution."""
 
 __all__ = (
+        # Provided by the module `__getattr__` below.
+        # pylint: disable=undefined-all-variable
         "__title__",
         "__summary__",
         "__uri__",
         "__version__",
         "__author__",
         "__email__",
+        # pylint: enable=undefined-all-variable
         "__license__",
         "__copyright__",
 )
 
 __copyright__ = "Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>"
+__license__ = "AGPL-3.0"
 
-import email.utils
-import importlib.metadata as importlib_metadata
 
-metadata = importlib_metadata.metadata("jobappfiller")
+def __getattr__(name: str) -> str:  # pylint: disable=invalid-name
+    # The package metadata is read on first use rather than at import time,
+    # which keeps importing the CLI (e.g. for shell completion) cheap.
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__title__ = metadata["name"]
-__summary__ = metadata["summary"]
-__uri__ = next(
-        entry.split(", ")[1]
-        for entry in metadata.get_all("Project-URL", ())
-        if entry.startswith("Homepage")
-)
-__version__ = metadata["version"]
-__author__, __email__ = email.utils.parseaddr(metadata["author-email"])
-__license__ = "AGPL-3.0"
+    import email.utils  # pylint: disable=C0415
+    import importlib.metadata as importlib_metadata  # pylint: disable=C0415
+
+    metadata = importlib_metadata.metadata("jobappfiller")
+    author, author_email = email.utils.parseaddr(metadata["author-email"])
+    values = {
+            "__title__": metadata["name"],
+            "__summary__": metadata["summary"],
+            "__uri__": next(
+                    entry.split(", ")[1]
+                    for entry in metadata.get_all("Project-URL", ())
+                    if entry.startswith("Homepage")
+            ),
+            "__version__": metadata["version"],
+            "__author__": author,
+            "__email__": author_email,
+    }
+    globals().update(values)
+
+    return values[name]
@@ -14,29 +14,95 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """Collects the CLI tools from each module and adds them to the main package."""
 
-import importlib.metadata
-
 import click
 
 from jobappfiller.tools.cli import (
         cli_print_resume_json,
         cli_print_companies,
-        cli_run_gui
+        cli_run_gui,
+        cli_compile_resume,
+        cli_rank_experience,
+        cli_print_history,
+        cli_get_field,
+        cli_print_section,
+        cli_print_tenure,
+        cli_diff_resumes,
+        cli_queue
 )
 
-JAF_VERSION: str = importlib.metadata.version("jobappfiller")
+
+class CliGroup(click.Group):
+    """Reports resume sources in unknown formats as usage errors."""
+
+    def invoke(self, ctx):
+        # Imported here so completion does not load the decompressors.
+        from jobappfiller.tools.resume_source import (  # pylint: disable=C0415
+                ResumeSourceError
+        )
+
+        try:
+            return super().invoke(ctx)
+        except ResumeSourceError as e:
+            raise click.UsageError(str(e), ctx) from e
 
 
-@click.group()
-@click.version_option(version=JAF_VERSION, package_name="jobappfiller")
+@click.group(cls=CliGroup)
+@click.version_option(package_name="jobappfiller")
+@click.option(
+        "--memprofile",
+        is_flag=True,
+        default=False,
+        help="Report peak and retained memory for each loading stage."
+)
+@click.option(
+        "--latency",
+        is_flag=True,
+        default=False,
+        help="Report GUI event-loop lag and handler latency on exit. "
+        "Press F12 in the GUI to report it while running."
+)
 @click.pass_context
-def cli(ctx):  # pylint: disable=W0613
-    pass
+def cli(ctx, memprofile: bool, latency: bool):
+    if memprofile:
+        from jobappfiller.util.memprofile import (  # pylint: disable=C0415
+                MemoryProfiler
+        )
+
+        profiler = MemoryProfiler()
+        profiler.start()
+
+        def report_memory():
+            profiler.stop()
+            click.echo(profiler.report(), err=True)
+
+        ctx.call_on_close(report_memory)
+
+    if latency:
+        from jobappfiller.util.latency import (  # pylint: disable=C0415
+                LatencyMonitor
+        )
+
+        monitor = LatencyMonitor()
+        monitor.start()
+
+        def report_latency():
+            monitor.stop()
+            click.echo(monitor.report(), err=True)
+
+        ctx.call_on_close(report_latency)
 
 
 cli.add_command(cli_print_resume_json, name="print-resume")
 cli.add_command(cli_print_companies, name="print-companies")
 cli.add_command(cli_run_gui, name="gui")
+cli.add_command(cli_compile_resume, name="compile")
+cli.add_command(cli_rank_experience, name="rank")
+cli.add_command(cli_print_history, name="history")
+cli.add_command(cli_get_field, name="get")
+cli.add_command(cli_print_section, name="print-section")
+cli.add_command(cli_print_tenure, name="tenure")
+cli.add_command(cli_diff_resumes, name="diff")
+cli.add_command(cli_queue, name="queue")
 
 if __name__ == "__main__":
     cli()  # pylint: disable=E1120
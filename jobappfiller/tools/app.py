@@ -16,19 +16,42 @@
 the resume configuration to the clipboard in an easy-to-use menu.
 """
 
+import os
 import tkinter as tk
 import tkinter.font as tk_font
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import ttk
 
 import pyperclip
 
-from jobappfiller.tools.resume_data_gen import ResumeDataGen
+from jobappfiller.tools.journal import ApplicationJournal
+from jobappfiller.tools.resume_writer import ResumeWriter, is_editable
+from jobappfiller.tools.resume_data_gen import (
+        DATE_FORMATS,
+        DEFAULT_DATE_FORMAT,
+        ResumeDataGen
+)
+from jobappfiller.tools.tenure import format_interval, format_years
+from jobappfiller.util import latency, memprofile
 from jobappfiller.util.logger import setup_logger
 
 LARGEFONT = ("calibri", 36, tk_font.BOLD)
 SMALLFONT = ("calibri", 14, tk_font.NORMAL)
 logger = setup_logger(log_file=None)
 
+# Fields that can be edited on a `CompanyPage` and saved to the resume.
+EDITABLE_FIELDS: tuple[str, ...] = (
+        "location",
+        "startdate",
+        "enddate",
+        "jobtitle",
+        "description",
+)
+
+# Edits are saved once no field was changed for this many milliseconds.
+SAVE_DELAY_MS: int = 500
+
 
 class ClipboardHandler:
     """Handles clipboard operations for button clicks."""
@@ -36,6 +59,11 @@ class ClipboardHandler:
     @staticmethod
     def copy_attribute(event, attribute: str):
         """Copies specified attribute from the event's widget master."""
+        with latency.measure(f"copy {attribute}"):
+            ClipboardHandler._copy_attribute(event, attribute)
+
+    @staticmethod
+    def _copy_attribute(event, attribute: str):
         value = getattr(event.widget.master, attribute)
         pyperclip.copy(value)
         logger.info(
@@ -45,6 +73,16 @@ class ClipboardHandler:
         )
         logger.info("%s = %s", attribute, value)
 
+        journal = getattr(event.widget.winfo_toplevel(), "journal", None)
+        if journal is not None:
+            page = event.widget.master
+            journal.record(
+                    page.company_name,
+                    attribute,
+                    resume=page.resume_config_file,
+                    profile=page.profile
+            )
+
 
 # Generate all the button click handlers for company info.
 button_click_company_name = lambda event: ClipboardHandler.copy_attribute(
@@ -67,62 +105,398 @@ button_click_description = lambda event: ClipboardHandler.copy_attribute(
 )
 
 
+def load_resume_view_data(
+        resume_config_file: str,
+        date_format: str | None = None,
+        profile: str = "default"
+) -> ResumeDataGen:
+    """Loads a resume along with every column shown by `ResumeView`.
+
+    `ResumeDataGen` computes its columns on first access; reading them here
+    lets a worker thread do the work instead of the Tk main loop.
+
+    Args:
+        resume_config_file (str): Path to resume config file.
+        date_format (str | None, optional): Initial date format. Defaults to
+            "MM/dd/yyyy".
+        profile (str, optional): Profile of the resume to show. Defaults to
+            "default".
+
+    Returns:
+        ResumeDataGen: The loaded resume.
+    """
+    resume_data = ResumeDataGen(
+            resume_config_file,
+            date_format=date_format,
+            profile=profile
+    )
+    for column in (
+            "company_list",
+            "location_list",
+            "jobtitle_list",
+            "description_list",
+            "startdate_formats",
+            "enddate_formats",
+    ):
+        getattr(resume_data, column)
+
+    return resume_data
+
+
+class LiveTabs:
+    """Least recently used set of the tabs whose widgets are built."""
+
+    def __init__(self, capacity: int):
+        """Creates an empty set.
+
+        Args:
+            capacity (int): Number of tabs to keep, at least 1.
+        """
+        self.capacity = max(capacity, 1)
+        self._tabs: OrderedDict[str, object] = OrderedDict()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._tabs
+
+    def __len__(self) -> int:
+        return len(self._tabs)
+
+    def touch(self, key: str, tab) -> list:
+        """Marks a tab as the most recently shown one.
+
+        Args:
+            key (str): Name of the tab.
+            tab: The tab.
+
+        Returns:
+            list: The least recently shown tabs that no longer fit, oldest
+                first. Their widgets should be destroyed.
+        """
+        self._tabs.pop(key, None)
+        self._tabs[key] = tab
+
+        evicted = []
+        while len(self._tabs) > self.capacity:
+            evicted.append(self._tabs.popitem(last=False)[1])
+        return evicted
+
+    def discard(self, key: str) -> None:
+        """Removes a tab if it is in the set."""
+        self._tabs.pop(key, None)
+
+
 class TkinterApp(tk.Tk):
     """
-    Top-level app that serves the purpose of switching frames between each
-        company selected.
+    Top-level app holding one notebook tab per resume configuration file.
+
+    Resumes are loaded and projected concurrently in a thread pool as soon
+        as the app starts, but the widgets of a tab are only built the first
+        time the tab is shown. Only the `max_live_tabs` most recently shown
+        tabs keep their widgets; older ones are destroyed and rebuilt from the
+        loaded resume when they are shown again.
     """
 
     def __init__(
             self,
             *args,
-            resume_config_file: str = "resume.toml",
+            resume_config_file: str | list[str] = "resume.toml",
             date_format: str | None = None,
+            profile: str = "default",
+            journal_file: str | None = None,
+            max_live_tabs: int = 8,
             **kwargs
     ):
         tk.Tk.__init__(self, *args, **kwargs)
-        resume_data = ResumeDataGen(resume_config_file, date_format=date_format)
+        if isinstance(resume_config_file, (list, tuple)):
+            resume_config_files = list(resume_config_file)
+        else:
+            resume_config_files = [resume_config_file]
+
+        self.journal = None
+        if journal_file is not None:
+            self.journal = ApplicationJournal(journal_file)
+
+        self._executor = ThreadPoolExecutor(
+                max_workers=min(len(resume_config_files), os.cpu_count() or 1)
+        )
+        self.live_tabs = LiveTabs(max_live_tabs)
+
+        self.notebook = ttk.Notebook(self)
+        self.notebook.pack(side="top", fill="both", expand=True)
+
+        self.tabs: dict[str, ResumeTab] = {}
+        for resume_file in resume_config_files:
+            tab = ResumeTab(
+                    self.notebook,
+                    resume_config_file=resume_file,
+                    profile=profile,
+                    date_format=date_format,
+                    live_tabs=self.live_tabs,
+                    executor=self._executor,
+                    future=self._executor.submit(
+                            load_resume_view_data,
+                            resume_file,
+                            date_format=date_format,
+                            profile=profile
+                    )
+            )
+            self.notebook.add(tab, text=os.path.basename(str(resume_file)))
+            self.tabs[str(tab)] = tab
+
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event):  # pylint: disable=W0613
+        with latency.measure("tab switch"):
+            self._switch_tab()
+
+    def _switch_tab(self):
+        self.tabs[self.notebook.select()].show()
+
+    def destroy(self):
+        for tab in self.tabs.values():
+            tab.save(reload=False)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        tk.Tk.destroy(self)
+
+
+class ResumeTab(tk.Frame):
+    """Notebook tab of a single resume, building its view lazily."""
+
+    def __init__(
+            self,
+            parent,
+            resume_config_file: str,
+            profile: str,
+            date_format: str | None,
+            live_tabs: LiveTabs,
+            executor: ThreadPoolExecutor,
+            future: Future
+    ):
+        tk.Frame.__init__(self, parent)
+        self.resume_config_file = resume_config_file
+        self.profile = profile
+        self.live_tabs = live_tabs
+        self.future = future
+        # Checked once, as it may read the magic bytes of the file.
+        self.editable = is_editable(resume_config_file)
+        self._executor = executor
+        self._reload: Future | None = None
+        self._reload_id: str | None = None
+        self.view: ResumeView | None = None
+        self._placeholder: ttk.Label | None = None
+        self._writer: ResumeWriter | None = None
+        self._save_id: str | None = None
+        self._show_id: str | None = None
+
+        # Kept with the tab so the selected date format survives unloading.
+        self.date_format = tk.StringVar(
+                self,
+                value=date_format
+                if date_format in DATE_FORMATS else DEFAULT_DATE_FORMAT
+        )
+
+    @property
+    def selected(self) -> bool:
+        """bool: Whether this tab is the selected tab of its notebook."""
+        return self.master.select() == str(self)
+
+    def show(self):
+        """Builds the view of this tab, waiting for its resume to load."""
+        if self.view is not None:
+            self._mark_shown()
+            return
+
+        if not self.future.done():
+            if self._placeholder is None:
+                self._placeholder = ttk.Label(
+                        self,
+                        text="Loading...",
+                        font=SMALLFONT
+                )
+                self._placeholder.pack(expand=True)
+            if self._show_id is None:
+                self._show_id = self.after(50, self._poll)
+            return
+
+        if self._placeholder is not None:
+            self._placeholder.destroy()
+            self._placeholder = None
+
+        error = self.future.exception()
+        if error is not None:
+            logger.error(
+                    "Could not load %s: %s",
+                    self.resume_config_file,
+                    error
+            )
+            self._placeholder = ttk.Label(
+                    self,
+                    text=f"Could not load {self.resume_config_file}:\n{error}",
+                    font=SMALLFONT
+            )
+            self._placeholder.pack(expand=True)
+            return
+
+        self.view = ResumeView(self, self.future.result(), self.date_format)
+        self.view.pack(side="top", fill="both", expand=True)
+        self._mark_shown()
+
+    def _poll(self):
+        self._show_id = None
+        # A tab left while loading is built when it is selected again.
+        if self.selected:
+            self.show()
+
+    def _mark_shown(self):
+        # Drop the widgets of the least recently shown tabs.
+        for idle_tab in self.live_tabs.touch(str(self), self):
+            idle_tab.unload()
+
+    def edit(self, index: int, field: str, value: str):
+        """Changes a field of an experience entry and schedules a save.
+
+        Args:
+            index (int): Index of the experience entry.
+            field (str): One of `EDITABLE_FIELDS`.
+            value (str): New value of the field.
+        """
+        self.future.result().set_value(index, field, value)
+        if self._writer is None:
+            self._writer = ResumeWriter(self.resume_config_file)
+        self._writer.set(self.profile, "experience", index, field, value)
+
+        # Restart the delay, so typing into a field saves once it stops.
+        if self._save_id is not None:
+            self.after_cancel(self._save_id)
+        self._save_id = self.after(SAVE_DELAY_MS, self.save)
+
+    def save(self, reload: bool = True):
+        """Writes the pending edits of this tab to its resume.
+
+        Args:
+            reload (bool, optional): Reload the saved resume in the
+                background afterwards. Defaults to True.
+        """
+        if self._save_id is not None:
+            self.after_cancel(self._save_id)
+            self._save_id = None
+        if self._writer is None or not self._writer.pending:
+            return
+
+        try:
+            if self._writer.flush():
+                logger.info("Saved %s", self.resume_config_file)
+        except (OSError, LookupError) as e:
+            logger.error(
+                    "Could not save %s: %s",
+                    self.resume_config_file,
+                    e
+            )
+
+        # Edits that failed to write are kept for the next save. Otherwise the
+        # indexes, fingerprints and ranking are rebuilt from the saved file.
+        if reload and not self._writer.pending:
+            resume_data = self.future.result()
+            self._reload = self._executor.submit(
+                    load_resume_view_data,
+                    self.resume_config_file,
+                    date_format=resume_data.date_format,
+                    profile=self.profile
+            )
+            if self._reload_id is None:
+                self._reload_id = self.after(50, self._finish_reload)
+
+    def _finish_reload(self):
+        self._reload_id = None
+        if self._reload is None:
+            return
+        if not self._reload.done():
+            self._reload_id = self.after(50, self._finish_reload)
+            return
+
+        future, self._reload = self._reload, None
+        if self._writer is not None and self._writer.pending:
+            # Edited again meanwhile; the next save reloads once more.
+            return
+        error = future.exception()
+        if error is not None:
+            logger.error(
+                    "Could not reload %s: %s",
+                    self.resume_config_file,
+                    error
+            )
+            return
+        self.future.result().reload(future.result())
+
+    def unload(self):
+        """Destroys the widgets of this tab, keeping its loaded resume."""
+        if self._show_id is not None:
+            self.after_cancel(self._show_id)
+            self._show_id = None
+        self.live_tabs.discard(str(self))
+        if self.view is not None:
+            self.view.destroy()
+            self.view = None
+
+
+class ResumeView(tk.Frame):
+    """
+    Switches frames between each company of a single loaded resume.
+    """
+
+    def __init__(
+            self,
+            parent,
+            resume_data: ResumeDataGen,
+            date_format: tk.StringVar
+    ):
+        tk.Frame.__init__(self, parent)
+        self.tab = parent
+        self.resume_config_file = parent.resume_config_file
+        self.profile = resume_data.profile
+        self.resume_data = resume_data
 
         # Generate accessible data from the `resume_config_file`.
         company_list = resume_data.company_list
         location_list = resume_data.location_list
         jobtitle_list = resume_data.jobtitle_list
         description_list = resume_data.description_list
-        startdate_list = resume_data.startdate_list
-        enddate_list = resume_data.enddate_list
-
-        # Setup containers.
-        container = tk.Frame(self)
-        container.pack(side="top", fill="both", expand=True)
-        container.grid_rowconfigure(0, weight=1)
-        container.grid_columnconfigure(0, weight=1)
-
-        self.frames = {}
-        self.company_pages = []
-
-        # Create StartPage frame
-        startpage_frame = StartPage(
-                parent=container,
-                controller=self,
-                company_list=company_list
-        )
-        self.frames[0] = startpage_frame
-        startpage_frame.grid(row=0, column=0, sticky="nsew")
 
-        # Create CompanyPage frames
-        for idx, company in enumerate(company_list):
-            frame = CompanyPage(
+        # Shared by every `CompanyPage` so switching the format on one page
+        # switches it for all of them.
+        self.date_format = date_format
+
+        with memprofile.stage("gui construction"):
+            # Setup containers.
+            container = tk.Frame(self)
+            container.pack(side="top", fill="both", expand=True)
+            container.grid_rowconfigure(0, weight=1)
+            container.grid_columnconfigure(0, weight=1)
+
+            self.frames = {}
+
+            # Create StartPage frame
+            startpage_frame = StartPage(
                     parent=container,
                     controller=self,
-                    company_name=company,
-                    location=location_list[idx],
-                    startdate=startdate_list[idx],
-                    enddate=enddate_list[idx],
-                    jobtitle=jobtitle_list[idx],
-                    description=description_list[idx]
+                    company_list=company_list
             )
-            self.frames[idx + 1] = frame
-            frame.grid(row=0, column=0, sticky="nsew")
+            self.frames[0] = startpage_frame
+            startpage_frame.grid(row=0, column=0, sticky="nsew")
+
+            # Create CompanyPage frames
+            for idx, company in enumerate(company_list):
+                frame = CompanyPage(
+                        parent=container,
+                        controller=self,
+                        index=idx,
+                        company_name=company,
+                        location=location_list[idx],
+                        jobtitle=jobtitle_list[idx],
+                        description=description_list[idx]
+                )
+                self.frames[idx + 1] = frame
+                frame.grid(row=0, column=0, sticky="nsew")
 
         self.show_frame(cont=0)
 
@@ -132,8 +506,9 @@ class TkinterApp(tk.Tk):
         Args:
             cont (int): Index of the frame under `self.frames` to display.
         """
-        frame = self.frames[cont]
-        frame.tkraise()
+        with latency.measure("frame switch"):
+            frame = self.frames[cont]
+            frame.tkraise()
 
 
 class StartPage(tk.Frame):
@@ -158,6 +533,24 @@ class StartPage(tk.Frame):
         for row in range(9):
             self.grid_rowconfigure(row, weight=1)
 
+        ttk.Button(
+                self,
+                text="Rank Against Posting",
+                command=lambda: RankDialog(self, controller)
+        ).grid(row=0,
+                column=2,
+                padx=5,
+                pady=5)
+
+        ttk.Button(
+                self,
+                text="Tenure",
+                command=lambda: TenureDialog(self, controller)
+        ).grid(row=0,
+                column=0,
+                padx=5,
+                pady=5)
+
         # Company navigation buttons
         for idx, company in enumerate(company_list):
             ttk.Button(
@@ -172,6 +565,107 @@ class StartPage(tk.Frame):
                     pady=5)
 
 
+class RankDialog(tk.Toplevel):
+    """
+    Window to paste a job posting into and list the experience entries that
+        best match it.
+    """
+
+    def __init__(self, parent, controller):
+        tk.Toplevel.__init__(self, parent)
+        self.title("Rank Against Posting")
+        self.controller = controller
+
+        ttk.Label(
+                self,
+                text="Paste the job posting below.",
+                font=SMALLFONT
+        ).pack(side="top",
+                padx=5,
+                pady=5)
+
+        self.posting_text = tk.Text(self, width=80, height=15, wrap="word")
+        self.posting_text.pack(side="top", fill="both", expand=True, padx=5)
+
+        ttk.Button(
+                self,
+                text="Rank",
+                command=self.show_ranking
+        ).pack(side="top",
+                padx=5,
+                pady=5)
+
+        self.results = ttk.Frame(self)
+        self.results.pack(side="top", fill="both", expand=True, padx=5)
+
+    def show_ranking(self):
+        """Lists the best matching experience entries, best first."""
+        for child in self.results.winfo_children():
+            child.destroy()
+
+        resume_data = self.controller.resume_data
+        with latency.measure("rank"):
+            ranking = resume_data.rank(self.posting_text.get("1.0", "end"))
+        if not ranking:
+            ttk.Label(self.results, text="No matching experience.").pack()
+            return
+
+        for idx, score in ranking:
+            ttk.Button(
+                    self.results,
+                    text=f"{resume_data.company_list[idx]} - "
+                    f"{resume_data.jobtitle_list[idx]} ({score:.2f})",
+                    width=60,
+                    command=lambda idx=idx + 1: self.controller.show_frame(idx)
+            ).pack(side="top",
+                    padx=5,
+                    pady=2)
+
+
+class TenureDialog(tk.Toplevel):
+    """
+    Window listing total tenure, overlaps, gaps and tenure per job title
+        keyword, each with a button copying its value.
+    """
+
+    def __init__(self, parent, controller):
+        tk.Toplevel.__init__(self, parent)
+        self.title("Tenure")
+
+        report = controller.resume_data.tenure()
+        rows = [
+                ("Total years of experience", format_years(report.total_days)),
+                ("Years in overlapping roles",
+                    format_years(report.overlap_days)),
+        ]
+        rows.extend(
+                (f"Gap {format_interval(gap)}",
+                    format_years(gap.end - gap.start)) for gap in report.gaps
+        )
+        rows.extend(
+                (f"Years as \"{keyword}\"", format_years(days))
+                for keyword, days in report.keywords.items()
+        )
+
+        for row, (text, value) in enumerate(rows):
+            ttk.Label(self, text=text, font=SMALLFONT).grid(
+                    row=row,
+                    column=0,
+                    sticky="w",
+                    padx=5,
+                    pady=2
+            )
+            ttk.Label(self, text=value).grid(row=row, column=1, padx=5)
+            ttk.Button(
+                    self,
+                    text="Copy",
+                    command=lambda value=value: pyperclip.copy(value)
+            ).grid(row=row,
+                    column=2,
+                    padx=5,
+                    pady=2)
+
+
 class CompanyPage(tk.Frame):
     """Page showing detailed company information and copy buttons."""
 
@@ -179,10 +673,13 @@ class CompanyPage(tk.Frame):
         tk.Frame.__init__(self, parent)
 
         # Store company data as instance attributes
+        self.resume_config_file = controller.resume_config_file
+        self.profile = controller.profile
+        self.date_format = controller.date_format
+        self._index = kwargs["index"]
+        self._resume_data = controller.resume_data
         self.company_name = kwargs["company_name"]
         self.location = kwargs["location"]
-        self.startdate = kwargs["startdate"]
-        self.enddate = kwargs["enddate"]
         self.jobtitle = kwargs["jobtitle"]
         self.description = kwargs["description"]
 
@@ -228,6 +725,24 @@ class CompanyPage(tk.Frame):
             btn.bind("<Button-1>", handler)
             btn.grid(row=row, column=1, padx=5, pady=5)
 
+        # Entries editing the fields, saved back to the resume.
+        if controller.tab.editable:
+            for field, row in zip(EDITABLE_FIELDS, range(3, 8)):
+                self._add_editor(controller.tab, field, row)
+
+        # Date format used when copying the start and end dates.
+        ttk.Combobox(
+                self,
+                textvariable=self.date_format,
+                values=DATE_FORMATS,
+                state="readonly",
+                width=12
+        ).grid(row=4,
+                column=2,
+                rowspan=2,
+                padx=5,
+                pady=5)
+
         # Return to "StartPage" button.
         ttk.Button(
                 self,
@@ -238,26 +753,231 @@ class CompanyPage(tk.Frame):
                 padx=5,
                 pady=5)
 
+    def _add_editor(self, tab: ResumeTab, field: str, row: int):
+        # Dates are edited as stored in the resume, "MM/dd/yyyy".
+        if field in ("startdate", "enddate"):
+            value = self._resume_data.sections["experience"][field][self._index]
+        else:
+            value = getattr(self, field)
+        variable = tk.StringVar(self, value=value)
+
+        def on_edit(*args):  # pylint: disable=W0613
+            if field not in ("startdate", "enddate"):
+                setattr(self, field, variable.get())
+            tab.edit(self._index, field, variable.get())
+
+        variable.trace_add("write", on_edit)
+        ttk.Entry(self, textvariable=variable, width=40).grid(
+                row=row,
+                column=0,
+                sticky="ew",
+                padx=5,
+                pady=5
+        )
+
+    @property
+    def startdate(self) -> str:
+        """Start date in the currently selected date format."""
+        startdate_formats = self._resume_data.startdate_formats
+        return startdate_formats[self.date_format.get()][self._index]
+
+    @property
+    def enddate(self) -> str:
+        """End date in the currently selected date format."""
+        enddate_formats = self._resume_data.enddate_formats
+        return enddate_formats[self.date_format.get()][self._index]
+
+
+class QueueApp(tk.Tk):
+    """
+    Top-level app stepping through the prepared bundles of an application
+        queue, one posting at a time.
+    """
+
+    def __init__(
+            self,
+            *args,
+            bundles: list[dict],
+            journal_file: str | None = None,
+            **kwargs
+    ):
+        tk.Tk.__init__(self, *args, **kwargs)
+        self.title("Application Queue")
+        self.bundles = bundles
+        self.position = 0
+        self.journal = None
+        if journal_file is not None:
+            self.journal = ApplicationJournal(journal_file)
+
+        header = ttk.Frame(self)
+        header.pack(side="top", fill="x", padx=5, pady=5)
+        ttk.Button(
+                header,
+                text="Previous",
+                command=lambda: self.show_bundle(self.position - 1)
+        ).pack(side="left")
+        ttk.Button(
+                header,
+                text="Next",
+                command=lambda: self.show_bundle(self.position + 1)
+        ).pack(side="right")
+        self.heading = ttk.Label(header, font=SMALLFONT)
+        self.heading.pack(side="top")
+
+        self.bind("<Left>", lambda event: self.show_bundle(self.position - 1))
+        self.bind("<Right>", lambda event: self.show_bundle(self.position + 1))
+
+        self.view: BundleView | None = None
+        self.show_bundle(0)
+
+    def show_bundle(self, position: int):
+        """Shows the bundle at `position` in the queue.
+
+        Args:
+            position (int): Index of the bundle; out of range positions are
+                clamped to the first or last bundle.
+        """
+        if not self.bundles:
+            self.heading.configure(text="The queue is empty.")
+            return
+
+        with latency.measure("bundle switch"):
+            self.position = min(max(position, 0), len(self.bundles) - 1)
+            bundle = self.bundles[self.position]
+            self.heading.configure(
+                    text=f"{self.position + 1}/{len(self.bundles)}: "
+                    f"{bundle['title']} at {bundle['company']}"
+            )
+
+            if self.view is not None:
+                self.view.destroy()
+            self.view = BundleView(self, bundle)
+            self.view.pack(side="top", fill="both", expand=True)
+
+
+class BundleView(tk.Frame):
+    """Copy buttons for every experience entry of a prepared bundle."""
+
+    def __init__(self, parent, bundle: dict):
+        tk.Frame.__init__(self, parent)
+
+        if bundle["error"] is not None:
+            ttk.Label(
+                    self,
+                    text=f"Could not prepare {bundle['resume']}:\n"
+                    f"{bundle['error']}",
+                    font=SMALLFONT
+            ).pack(expand=True)
+            return
+
+        for row, entry in enumerate(bundle["entries"]):
+            BundleEntry(self, bundle, entry).grid(
+                    row=row,
+                    column=0,
+                    sticky="w",
+                    padx=5,
+                    pady=2
+            )
+
+
+class BundleEntry(tk.Frame):
+    """A row of copy buttons for one experience entry of a bundle."""
+
+    def __init__(self, parent, bundle: dict, entry: dict):
+        tk.Frame.__init__(self, parent)
+
+        # Read by `ClipboardHandler` when a button is clicked.
+        self.resume_config_file = bundle["resume"]
+        self.profile = bundle["profile"]
+        self.company_name = entry["name"]
+        self.location = entry["location"]
+        self.startdate = entry["startdate"]
+        self.enddate = entry["enddate"]
+        self.jobtitle = entry["jobtitle"]
+        self.description = entry["description"]
+
+        ttk.Label(self, text=self.company_name, width=40).pack(side="left")
+        buttons = [("Name", button_click_company_name),
+                    ("Location", button_click_location),
+                    ("Start", button_click_startdate),
+                    ("End", button_click_enddate),
+                    ("Title", button_click_jobtitle),
+                    ("Description", button_click_description)]
+        for text, handler in buttons:
+            btn = ttk.Button(self, text=text)
+            btn.bind("<Button-1>", handler)
+            btn.pack(side="left", padx=2)
+
+
+def run_queue_gui(bundles: list[dict], journal_file: str | None = None):
+    """Runs the GUI stepping through a prepared application queue.
+
+    Args:
+        bundles (list[dict]): Bundles saved by `queue prepare`, see
+            `load_bundles`.
+        journal_file (str | None, optional): Path to the application journal
+            every copy is recorded in. Defaults to not recording copies.
+    """
+    app = QueueApp(bundles=bundles, journal_file=journal_file)
+    app.geometry("900x450")
+    monitor = latency.active_monitor()
+    if monitor is not None:
+        monitor.attach(app)
+    try:
+        app.mainloop()
+    finally:
+        if monitor is not None:
+            monitor.detach()
+        if app.journal is not None:
+            app.journal.close()
+
 
 def run_gui(
-        resume_config_file: str = "resume.toml",
-        date_format: str | None = None
+        resume_config_file: str | list[str] = "resume.toml",
+        date_format: str | None = None,
+        profile: str = "default",
+        journal_file: str | None = None,
+        max_live_tabs: int = 8
 ):
     """Main function to run the GUI.
 
     Args:
-        resume_config_file (str, optional): Path to resume config file in TOML
-            format as a string. Defaults to "resume.toml".
-        date_format (str | None, optional): Date format. Must be "yyyy/MM",
-            "MM/yyyy", "yyyy/MM/dd", or "MM/dd/yyyy". Defaults to "MM/dd/yyyy".
+        resume_config_file (str | list[str], optional): Path to resume config
+            file in TOML format as a string, or a list of them to open each
+            in its own tab. Defaults to "resume.toml".
+        date_format (str | None, optional): Initial date format. Must be
+            "yyyy/MM", "MM/yyyy", "yyyy/MM/dd", or "MM/dd/yyyy". Defaults to
+            "MM/dd/yyyy". It can be switched from any company page while the
+            GUI is running.
+        profile (str, optional): Profile of the resume to show. Defaults to
+            "default".
+        journal_file (str | None, optional): Path to the application journal
+            every copy is recorded in. Defaults to not recording copies.
+        max_live_tabs (int, optional): Number of recently shown tabs whose
+            widgets are kept alive. Defaults to 8.
+
+    If a `LatencyMonitor` is active, its heartbeat runs on the app and F12
+    writes the latency report to stderr.
     """
 
     app = TkinterApp(
             resume_config_file=resume_config_file,
-            date_format=date_format
+            date_format=date_format,
+            profile=profile,
+            journal_file=journal_file,
+            max_live_tabs=max_live_tabs
     )
     app.geometry("900x450")
-    app.mainloop()
+    monitor = latency.active_monitor()
+    if monitor is not None:
+        monitor.attach(app)
+    try:
+        app.mainloop()
+    finally:
+        if monitor is not None:
+            monitor.detach()
+        if app.journal is not None:
+            app.journal.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,314 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Queue of job applications prepared ahead of time.
+
+A postings file lists the jobs to apply to, each with the resume, profile,
+date format and field length limits to use:
+
+    [[posting]]
+    title = "Backend Engineer"
+    company = "Acme"
+    resume = "resume.toml"       # Defaults to the resume given to `prepare`.
+    profile = "default"          # Defaults to "default".
+    datefmt = "yyyy-MM"          # Defaults to "MM/dd/yyyy".
+    text = "..."                 # Optional posting text to rank entries by.
+
+    [posting.limits]
+    description = 500            # Maximum length of each field, if any.
+
+`prepare_queue` turns every posting into a bundle holding every field ready
+to copy, in a process pool, and saves the bundles as JSON. Stepping through
+the queue later only reads that file; each bundle keeps the fingerprint of
+its resume, so bundles of resumes edited since can be told apart with
+`stale_bundles`.
+"""
+
+import json
+import os
+import re
+import tomllib
+from concurrent.futures import ProcessPoolExecutor
+
+from jobappfiller.tools.resume_data_gen import (
+        DATE_FORMATS,
+        DEFAULT_DATE_FORMAT,
+        ResumeDataGen
+)
+from jobappfiller.tools.resume_cache import file_fingerprint
+from jobappfiller.tools.schema import EXPERIENCE_FIELDS
+
+BUNDLES_SUFFIX: str = ".bundles.json"
+
+
+def truncate(text: str, limit: int | None) -> str:
+    """Shortens text to at most `limit` characters, at a word boundary.
+
+    Args:
+        text (str): Text to shorten.
+        limit (int | None): Maximum length, or None for no limit.
+
+    Returns:
+        str: `text` if it fits, otherwise its longest prefix that fits and
+            ends at the end of a word (or mid-word if no word fits). Any
+            whitespace, including line breaks, separates words.
+    """
+    if limit is None or len(text) <= limit:
+        return text
+
+    cut = text[:limit]
+    if not text[limit].isspace():
+        # Drop the word cut in half, back to the whitespace before it.
+        last_word = re.search(r"\s\S*$", cut)
+        if last_word is not None and last_word.start() > 0:
+            cut = cut[:last_word.start()]
+
+    return cut.rstrip()
+
+
+def _read_limits(number: int, limits) -> dict[str, int]:
+    if not isinstance(limits, dict):
+        raise ValueError(f"Posting {number} has limits that are not a table.")
+    for field, limit in limits.items():
+        # bool is an int subclass, but `true` is not a length.
+        if (
+                not isinstance(limit, int) or isinstance(limit, bool) or
+                limit < 0
+        ):
+            raise ValueError(
+                    f"Posting {number} has limit {limit!r} for \"{field}\", "
+                    "which is not a non-negative integer."
+            )
+
+    return dict(limits)
+
+
+def read_postings(
+        postings_file: str,
+        resume_config_file: str | None = None,
+        date_format: str | None = None,
+        profile: str = "default"
+) -> list[dict]:
+    """Reads a postings file, filling in the defaults of each posting.
+
+    Args:
+        postings_file (str): Path to the postings TOML file.
+        resume_config_file (str | None, optional): Resume of postings that
+            do not name one.
+        date_format (str | None, optional): Date format of postings that do
+            not name one. Defaults to "MM/dd/yyyy".
+        profile (str, optional): Profile of postings that do not name one.
+            Defaults to "default".
+
+    Raises:
+        ValueError: A posting names no resume and there is no default, names
+            an unsupported date format or has a limit that is not a
+            non-negative integer.
+
+    Returns:
+        list[dict]: The postings, each with "title", "company", "resume",
+            "profile", "datefmt", "text" and "limits".
+    """
+    with open(postings_file, "rb") as f:
+        data = tomllib.load(f)
+
+    base_dir = os.path.dirname(os.path.abspath(postings_file))
+    postings: list[dict] = []
+    for number, posting in enumerate(data.get("posting", []), start=1):
+        resume = posting.get("resume", resume_config_file)
+        if resume is None:
+            raise ValueError(f"Posting {number} names no resume.")
+        datefmt = posting.get("datefmt", date_format) or DEFAULT_DATE_FORMAT
+        if datefmt not in DATE_FORMATS:
+            raise ValueError(
+                    f"Posting {number} has unsupported date format "
+                    f"\"{datefmt}\"."
+            )
+
+        postings.append(
+                {
+                        "title": posting.get("title", ""),
+                        "company": posting.get("company", ""),
+                        # Resumes named in the file are relative to it.
+                        "resume": os.path.join(base_dir, resume)
+                        if "resume" in posting else os.fspath(resume),
+                        "profile": posting.get("profile", profile),
+                        "datefmt": datefmt,
+                        "text": posting.get("text", ""),
+                        "limits": _read_limits(
+                                number,
+                                posting.get("limits", {})
+                        ),
+                }
+        )
+
+    return postings
+
+
+def prepare_bundle(posting: dict) -> dict:
+    """Computes every field of a posting's application.
+
+    Runs in a worker process, so it only takes and returns plain data.
+
+    Args:
+        posting (dict): A posting from `read_postings`.
+
+    Returns:
+        dict: The posting along with "entries", one dict of ready to copy
+            fields per experience entry, best match first if the posting has
+            a text, and "fingerprint", the fingerprint of the resume file
+            the entries were read from (None for stdin). If the resume could
+            not be loaded, "entries" is empty and "error" says why.
+    """
+    bundle = dict(posting, entries=[], fingerprint=None, error=None)
+    try:
+        resume_data = ResumeDataGen(
+                posting["resume"],
+                date_format=posting["datefmt"],
+                profile=posting["profile"]
+        )
+        if resume_data.fingerprint is not None:
+            bundle["fingerprint"] = list(resume_data.fingerprint)
+        columns = {
+                "name": resume_data.company_list,
+                "location": resume_data.location_list,
+                "startdate": resume_data.startdate_list,
+                "enddate": resume_data.enddate_list,
+                "jobtitle": resume_data.jobtitle_list,
+                "description": resume_data.description_list,
+        }
+        order = list(range(len(resume_data.company_list)))
+        if posting["text"].strip():
+            ranked = [idx for idx, _ in resume_data.rank(posting["text"])]
+            matched = set(ranked)
+            order = ranked + [idx for idx in order if idx not in matched]
+    except (OSError, LookupError, ValueError, tomllib.TOMLDecodeError) as e:
+        bundle["error"] = f"{type(e).__name__}: {e}"
+        return bundle
+
+    limits = posting["limits"]
+    bundle["entries"] = [
+            {
+                    field: truncate(columns[field][idx], limits.get(field))
+                    for field in EXPERIENCE_FIELDS
+            }
+            for idx in order
+    ]
+
+    return bundle
+
+
+def prepare_queue(
+        postings: list[dict],
+        bundles_file: str,
+        max_workers: int | None = None
+) -> list[dict]:
+    """Prepares the bundles of every posting in parallel and saves them.
+
+    Args:
+        postings (list[dict]): Postings from `read_postings`.
+        bundles_file (str): Path to save the bundles to.
+        max_workers (int | None, optional): Number of worker processes.
+            Defaults to the number of CPUs. With 1, or a single posting, the
+            bundles are prepared in this process.
+
+    Returns:
+        list[dict]: The bundles, in posting order.
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(postings))
+    if workers <= 1:
+        bundles = [prepare_bundle(posting) for posting in postings]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            bundles = list(
+                    executor.map(
+                            prepare_bundle,
+                            postings,
+                            chunksize=max(len(postings) // (workers * 4), 1)
+                    )
+            )
+
+    tmp_file = f"{bundles_file}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"bundles": bundles}, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, bundles_file)
+    finally:
+        # Only left behind if writing or replacing failed.
+        if os.path.exists(tmp_file):
+            os.unlink(tmp_file)
+
+    return bundles
+
+
+def load_bundles(bundles_file: str) -> list[dict]:
+    """Reads the bundles saved by `prepare_queue`.
+
+    Args:
+        bundles_file (str): Path to the bundles file.
+
+    Raises:
+        OSError: The file could not be read.
+        ValueError: The file is not a bundles file.
+
+    Returns:
+        list[dict]: The bundles, in posting order.
+    """
+    with open(bundles_file, "r", encoding="utf-8") as f:
+        try:
+            bundles = json.load(f)["bundles"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(
+                    f"\"{bundles_file}\" is not a bundles file saved by "
+                    "`queue prepare`."
+            ) from e
+
+    if not isinstance(bundles, list) or not all(
+            isinstance(bundle, dict) and "entries" in bundle
+            for bundle in bundles
+    ):
+        raise ValueError(
+                f"\"{bundles_file}\" is not a bundles file saved by "
+                "`queue prepare`."
+        )
+
+    return bundles
+
+
+def stale_bundles(bundles: list[dict]) -> list[dict]:
+    """Finds the bundles whose resume changed since they were prepared.
+
+    Args:
+        bundles (list[dict]): Bundles from `load_bundles`.
+
+    Returns:
+        list[dict]: The bundles whose resume file now has a different
+            fingerprint, or no longer exists, in posting order.
+    """
+    stale: list[dict] = []
+    for bundle in bundles:
+        fingerprint = bundle.get("fingerprint")
+        if fingerprint is None:
+            continue
+        try:
+            changed = list(file_fingerprint(bundle["resume"])) != fingerprint
+        except OSError:
+            changed = True
+        if changed:
+            stale.append(bundle)
+
+    return stale
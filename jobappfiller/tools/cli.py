@@ -14,37 +14,77 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """Collects the functions of the `jobappfiller.tools` module to make usable
 by the click library for CLI use.
+
+Shell completion imports this module on every TAB press, so only the modules
+needed to declare the commands are imported here; each command imports what
+it runs when it is invoked.
 """
 
 import json
+from collections.abc import Mapping, Sequence
+from pathlib import Path
 
 import click
-from rich import print_json
 
-from jobappfiller.tools.app import run_gui
-from jobappfiller.tools.parse_job_config import parse_resume, list_companies
+from jobappfiller.tools.completion import (
+        complete_company,
+        complete_profile,
+        complete_resume_file
+)
+from jobappfiller.tools.journal import GROUPS, default_journal_file
+from jobappfiller.tools.schema import EXPERIENCE_FIELDS, SECTIONS
+
+# pylint: disable=C0415
+
+
+def _json_default(value):
+    """Converts the lazy mappings of a compiled resume for `json.dumps`."""
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, Sequence):
+        return list(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
 
 
 @click.command()
-@click.option("-f", "--file", type=str)
+@click.option("-f", "--file", type=str, shell_complete=complete_resume_file)
 def cli_print_resume_json(file: str):
+    from rich import print_json
+
+    from jobappfiller.tools.parse_job_config import parse_resume
+
     parsed_dictionary: dict = parse_resume(resume_config_file=file)
-    parsed_dictionary_json: str = json.dumps(parsed_dictionary)
+    parsed_dictionary_json: str = json.dumps(
+            parsed_dictionary,
+            default=_json_default
+    )
     print_json(parsed_dictionary_json)
 
 
 @click.command()
-@click.option("-f", "--file", type=str)
+@click.option("-f", "--file", type=str, shell_complete=complete_resume_file)
 def cli_print_companies(file: str):
-    parsed_dictionary: dict = parse_resume(resume_config_file=file)
-    list_of_companies: list[str] = list_companies(parsed_dictionary)
+    from jobappfiller.tools.resume_data_gen import ResumeDataGen
 
-    for company in list_of_companies:
+    # Only the company names are projected; no other column is computed.
+    resume_data = ResumeDataGen(file)
+
+    for company in resume_data.company_list:
         print(company)
 
 
 @click.command()
-@click.option("-f", "--file", type=str, help="Path to resume config file.")
+@click.option(
+        "-f",
+        "--file",
+        "files",
+        type=str,
+        multiple=True,
+        shell_complete=complete_resume_file,
+        help="Path to resume config file (may be compressed with gzip, xz "
+        "or bzip2), or \"-\" to read it from stdin. Repeat to open several "
+        "resumes, each in its own tab."
+)
 @click.option(
         "--datefmt",
         is_flag=False,
@@ -56,5 +96,462 @@ def cli_print_companies(file: str):
         "[\"MM/dd/yyyy\" | \"MM-dd-yyyy\"]. "
         "Defaults to \"MM/dd/yyyy\"."
 )
-def cli_run_gui(file: str, datefmt: str):
-    run_gui(resume_config_file=file, date_format=datefmt)
+@click.option(
+        "-p",
+        "--profile",
+        type=str,
+        shell_complete=complete_profile,
+        default="default",
+        help="Profile of the resume to show. Defaults to \"default\"."
+)
+@click.option(
+        "--journal",
+        is_flag=False,
+        flag_value="",
+        type=str,
+        default=None,
+        help="Record copied fields in the application journal at this path, "
+        "or at \"$XDG_DATA_HOME/jobappfiller/journal.jsonl\" if no path is "
+        "given. Copies are not recorded without this option."
+)
+def cli_run_gui(
+        files: tuple[str, ...],
+        datefmt: str,
+        profile: str,
+        journal: str | None
+):
+    from jobappfiller.tools.app import run_gui
+
+    if journal == "":
+        journal = default_journal_file()
+
+    run_gui(
+            resume_config_file=list(files) or "resume.toml",
+            date_format=datefmt,
+            profile=profile,
+            journal_file=journal
+    )
+
+
+@click.command()
+@click.option(
+        "-f",
+        "--file",
+        type=str,
+        shell_complete=complete_resume_file,
+        help="Path to resume config file (may be compressed with gzip, xz "
+        "or bzip2), or \"-\" to read it from stdin."
+)
+@click.option(
+        "-o",
+        "--output",
+        type=str,
+        default=None,
+        help="Path to write the compiled resume to. "
+        "Defaults to the resume config file with a \".jafc\" suffix."
+)
+def cli_compile_resume(file: str, output: str | None):
+    from jobappfiller.tools.compiled_resume import compile_resume
+    from jobappfiller.tools.resume_source import compression_suffix, is_stdin
+
+    if output is None:
+        if is_stdin(file):
+            raise click.UsageError(
+                    "--output is required when reading the resume from stdin."
+            )
+        if compression_suffix(file) is not None:
+            file_path = Path(file).with_suffix("")
+        else:
+            file_path = Path(file)
+        output = str(file_path.with_suffix(".jafc"))
+    compile_resume(resume_config_file=file, output_file=output)
+    print(output)
+
+
+@click.command()
+@click.option(
+        "-f",
+        "--file",
+        type=str,
+        shell_complete=complete_resume_file,
+        help="Path to resume config file (may be compressed with gzip, xz "
+        "or bzip2), or \"-\" to read it from stdin."
+)
+@click.option(
+        "-p",
+        "--profile",
+        type=str,
+        shell_complete=complete_profile,
+        default=None,
+        help="Only rank entries of this profile. Defaults to all profiles."
+)
+@click.option(
+        "--posting",
+        type=click.File("r"),
+        default=None,
+        help="File containing the job posting, or \"-\" for stdin."
+)
+@click.option("--text", type=str, default=None, help="Job posting text.")
+@click.option(
+        "-n",
+        "--top",
+        type=int,
+        default=None,
+        help="Number of entries to show. Defaults to all matching entries."
+)
+def cli_rank_experience(
+        file: str,
+        profile: str | None,
+        posting,
+        text: str | None,
+        top: int | None
+):
+    from jobappfiller.tools.rank import build_experience_index
+    from jobappfiller.tools.resume_cache import load_resume
+
+    if posting is None and text is None:
+        raise click.UsageError("Either --posting or --text is required.")
+    posting_text = text if text is not None else posting.read()
+
+    cached_resume = load_resume(file)
+    index = cached_resume.derive("experience_index", build_experience_index)
+
+    for entry in index.rank(posting_text, profile=profile, top=top):
+        experience = cached_resume.data[entry.profile][0]["experience"]
+        print(
+                f"{entry.score:.3f}\t{entry.profile}\t"
+                f"{experience[entry.index]['name']}\t"
+                f"{experience[entry.index]['jobtitle']}"
+        )
+
+
+@click.command()
+@click.option(
+        "--journal",
+        type=str,
+        default=None,
+        help="Path to the application journal. "
+        "Defaults to \"$XDG_DATA_HOME/jobappfiller/journal.jsonl\"."
+)
+@click.option(
+        "--by",
+        "group",
+        type=click.Choice(GROUPS),
+        default="company",
+        help="Count copies per company, field or day."
+)
+def cli_print_history(journal: str | None, group: str):
+    from jobappfiller.tools.journal import journal_history
+
+    if journal is None:
+        journal = default_journal_file()
+
+    for key, count in journal_history(journal, group):
+        print(f"{count}\t{key}")
+
+
+@click.command()
+@click.option(
+        "-f",
+        "--file",
+        type=str,
+        shell_complete=complete_resume_file,
+        help="Path to resume config file (may be compressed with gzip, xz "
+        "or bzip2), or \"-\" to read it from stdin."
+)
+@click.option(
+        "-p",
+        "--profile",
+        type=str,
+        shell_complete=complete_profile,
+        default="default",
+        help="Profile of the resume to read. Defaults to \"default\"."
+)
+@click.option(
+        "-c",
+        "--company",
+        type=str,
+        shell_complete=complete_company,
+        required=True,
+        help="Company name, or a unique prefix of it or of any word in it."
+)
+@click.option(
+        "--field",
+        type=click.Choice(EXPERIENCE_FIELDS),
+        required=True,
+        help="Field of the experience entry to print."
+)
+@click.option(
+        "-i",
+        "--index",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Which of several entries matching the company to print, "
+        "counting from 1 in resume order."
+)
+@click.option(
+        "--datefmt",
+        type=str,
+        default=None,
+        help="Date format of \"startdate\" and \"enddate\". "
+        "Defaults to \"MM/dd/yyyy\"."
+)
+def cli_get_field(
+        file: str,
+        profile: str,
+        company: str,
+        field: str,
+        index: int | None,
+        datefmt: str | None
+):
+    from jobappfiller.tools.resume_data_gen import ResumeDataGen
+
+    resume_data = ResumeDataGen(file, date_format=datefmt, profile=profile)
+    try:
+        print(resume_data.get(company, field, index=index))
+    except (KeyError, ValueError) as e:
+        raise click.ClickException(e.args[0]) from e
+
+
+@click.command()
+@click.option(
+        "-f",
+        "--file",
+        type=str,
+        shell_complete=complete_resume_file,
+        help="Path to resume config file (may be compressed with gzip, xz "
+        "or bzip2), or \"-\" to read it from stdin."
+)
+@click.option(
+        "-p",
+        "--profile",
+        type=str,
+        shell_complete=complete_profile,
+        default="default",
+        help="Profile of the resume to read. Defaults to \"default\"."
+)
+@click.option(
+        "-s",
+        "--section",
+        type=click.Choice(tuple(SECTIONS)),
+        default="experience",
+        help="Section to print. Defaults to \"experience\"."
+)
+def cli_print_section(file: str, profile: str, section: str):
+    from jobappfiller.tools.resume_data_gen import ResumeDataGen
+
+    resume_data = ResumeDataGen(file, profile=profile)
+    columns = resume_data.sections[section]
+
+    # One line per entry with its fields separated by tabs, in the order
+    # they are declared in the schema.
+    print("\t".join(columns))
+    for row in zip(*columns.values()):
+        print("\t".join(value.replace("\n", " ") for value in row))
+
+
+@click.command()
+@click.option(
+        "-f",
+        "--file",
+        type=str,
+        shell_complete=complete_resume_file,
+        help="Path to resume config file (may be compressed with gzip, xz "
+        "or bzip2), or \"-\" to read it from stdin."
+)
+@click.option(
+        "-p",
+        "--profile",
+        type=str,
+        shell_complete=complete_profile,
+        default="default",
+        help="Profile of the resume to read. Defaults to \"default\"."
+)
+@click.option(
+        "-k",
+        "--keyword",
+        "keywords",
+        type=str,
+        multiple=True,
+        help="Only show the tenure of job titles containing this keyword. "
+        "Repeat for several keywords. Defaults to every keyword."
+)
+def cli_print_tenure(file: str, profile: str, keywords: tuple[str, ...]):
+    from jobappfiller.tools.resume_data_gen import ResumeDataGen
+    from jobappfiller.tools.tenure import format_interval, format_years
+
+    report = ResumeDataGen(file, profile=profile).tenure()
+
+    print(f"total\t{format_years(report.total_days)}")
+    print(f"overlap\t{format_years(report.overlap_days)}")
+    for gap in report.gaps:
+        print(
+                f"gap\t{format_years(gap.end - gap.start)}\t"
+                f"{format_interval(gap)}"
+        )
+    wanted = {keyword.casefold() for keyword in keywords}
+    for keyword, days in report.keywords.items():
+        if not wanted or keyword in wanted:
+            print(f"title:{keyword}\t{format_years(days)}")
+
+
+@click.command()
+@click.argument("old", type=str, shell_complete=complete_resume_file)
+@click.argument("new", type=str, shell_complete=complete_resume_file)
+@click.option(
+        "-p",
+        "--profile",
+        type=str,
+        default="default",
+        help="Profile of both resumes to compare. Defaults to \"default\"."
+)
+@click.pass_context
+def cli_diff_resumes(ctx, old: str, new: str, profile: str):
+    """Shows how the experience of NEW differs from OLD.
+
+    Exits with status 1 if the resumes differ.
+    """
+    from jobappfiller.tools.resume_data_gen import ResumeDataGen
+    from jobappfiller.tools.resume_diff import diff_resumes
+
+    diff = diff_resumes(
+            ResumeDataGen(old, profile=profile),
+            ResumeDataGen(new, profile=profile)
+    )
+
+    for company in diff.removed:
+        print(f"- {company}")
+    for company in diff.added:
+        print(f"+ {company}")
+    company = None
+    for change in diff.changed:
+        if change.company != company:
+            company = change.company
+            print(f"~ {company}")
+        print(f"    {change.field}: {change.old!r} -> {change.new!r}")
+
+    if diff:
+        ctx.exit(1)
+
+
+@click.group()
+def cli_queue():
+    """Prepares a queue of job postings up front and steps through it."""
+
+
+@cli_queue.command(name="prepare")
+@click.argument("postings", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+        "-f",
+        "--file",
+        type=str,
+        default=None,
+        shell_complete=complete_resume_file,
+        help="Resume of the postings that do not name one."
+)
+@click.option(
+        "-p",
+        "--profile",
+        type=str,
+        default="default",
+        help="Profile of the postings that do not name one. "
+        "Defaults to \"default\"."
+)
+@click.option(
+        "--datefmt",
+        type=str,
+        default=None,
+        help="Date format of the postings that do not name one. "
+        "Defaults to \"MM/dd/yyyy\"."
+)
+@click.option(
+        "-o",
+        "--output",
+        type=str,
+        default=None,
+        help="Path to save the prepared bundles to. Defaults to the postings "
+        "file with a \".bundles.json\" suffix."
+)
+@click.option(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes. Defaults to the number of CPUs."
+)
+def cli_queue_prepare(
+        postings: str,
+        file: str | None,
+        profile: str,
+        datefmt: str | None,
+        output: str | None,
+        jobs: int | None
+):
+    """Prepares the field bundle of every posting in POSTINGS."""
+    from jobappfiller.tools.application_queue import (
+            BUNDLES_SUFFIX,
+            prepare_queue,
+            read_postings
+    )
+
+    try:
+        posting_list = read_postings(
+                postings,
+                resume_config_file=file,
+                date_format=datefmt,
+                profile=profile
+        )
+    except ValueError as e:
+        raise click.ClickException(e.args[0]) from e
+
+    if output is None:
+        output = str(Path(postings).with_suffix(BUNDLES_SUFFIX))
+    bundles = prepare_queue(posting_list, output, max_workers=jobs)
+
+    for bundle in bundles:
+        if bundle["error"] is not None:
+            click.echo(
+                    f"{bundle['title']} at {bundle['company']}: "
+                    f"{bundle['error']}",
+                    err=True
+            )
+    print(output)
+
+
+@cli_queue.command(name="gui")
+@click.argument("bundles", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+        "--journal",
+        is_flag=False,
+        flag_value="",
+        type=str,
+        default=None,
+        help="Record copied fields in the application journal at this path, "
+        "or at \"$XDG_DATA_HOME/jobappfiller/journal.jsonl\" if no path is "
+        "given. Copies are not recorded without this option."
+)
+def cli_queue_gui(bundles: str, journal: str | None):
+    """Steps through the bundles prepared by `queue prepare`."""
+    from jobappfiller.tools.app import run_queue_gui
+    from jobappfiller.tools.application_queue import (
+            load_bundles,
+            stale_bundles
+    )
+
+    try:
+        bundle_list = load_bundles(bundles)
+    except (OSError, ValueError) as e:
+        raise click.ClickException(str(e)) from e
+
+    for bundle in stale_bundles(bundle_list):
+        click.echo(
+                f"Warning: {bundle['resume']} changed since the bundle of "
+                f"{bundle['title']} at {bundle['company']} was prepared; "
+                "run `queue prepare` again to update it.",
+                err=True
+        )
+
+    if journal == "":
+        journal = default_journal_file()
+
+    run_queue_gui(bundle_list, journal_file=journal)
@@ -0,0 +1,519 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Compiles a resume configuration file into an indexed binary file that can
+be memory-mapped and read one field at a time.
+
+File layout (all integers are little-endian, unsigned 32-bit):
+
+    HEADER          magic, version, profile count, profile table offset,
+                    string heap offset, string heap length.
+    PROFILE TABLE   One record per profile (top-level key of the resume):
+                    name, scalar attribute table, section table.
+    ATTRIBUTES      (key, value) string references per profile.
+    SECTIONS        One record per array of tables in a profile (for example
+                    `experience`): name, field name table and entry table.
+    ENTRY TABLE     `entry_count * field_count` string references, so the
+                    reference of field `j` in entry `i` is found directly at
+                    `entries_off + (i * field_count + j) * 8`.
+    STRING HEAP     UTF-8 encoded strings.
+
+A string reference is an `(offset, length)` pair into the string heap. A
+length of `MISSING` marks a field that an entry does not define.
+"""
+
+import mmap
+import os
+import struct
+import tomllib
+from collections.abc import Mapping, Sequence
+
+from jobappfiller.tools.resume_source import open_resume_source
+
+MAGIC: bytes = b"JAFC"
+VERSION: int = 1
+MISSING: int = 0xFFFFFFFF
+
+_HEADER = struct.Struct("<4sHHIIII")
+_REF = struct.Struct("<II")
+_PROFILE = struct.Struct("<IIIIII")
+_ATTR = struct.Struct("<IIII")
+_SECTION = struct.Struct("<IIIIII")
+
+
+def is_compiled_resume(resume_file: str) -> bool:
+    """Checks whether `resume_file` is a compiled resume by its magic bytes.
+
+    Args:
+        resume_file (str): Path to the resume file.
+
+    Returns:
+        bool: True if the file starts with the compiled resume magic bytes.
+    """
+    try:
+        with open(resume_file, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+class _StringHeap:
+    """Accumulates unique strings while compiling a resume."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._refs: dict[str, tuple[int, int]] = {}
+
+    def add(self, value: str) -> tuple[int, int]:
+        ref = self._refs.get(value)
+        if ref is None:
+            encoded = value.encode("utf-8")
+            ref = (len(self._buffer), len(encoded))
+            self._buffer += encoded
+            self._refs[value] = ref
+        return ref
+
+    def getvalue(self) -> bytes:
+        return bytes(self._buffer)
+
+
+def _unsupported(path: str, value) -> ValueError:
+    return ValueError(
+            f"\"{path}\" is a {type(value).__name__}; compiled resumes only "
+            "hold strings and arrays of tables of strings."
+    )
+
+
+def _split_profile(name: str, profile_data: dict) -> tuple[dict, dict]:
+    """Splits a profile table into string attributes and sections.
+
+    Raises:
+        ValueError: A value is neither a string nor an array of tables whose
+            values are all strings.
+    """
+    attrs: dict[str, str] = {}
+    sections: dict[str, list[dict]] = {}
+    for key, value in profile_data.items():
+        if isinstance(value, str):
+            attrs[key] = value
+        elif isinstance(value, list) and all(
+                isinstance(entry, dict) for entry in value
+        ):
+            for i, entry in enumerate(value):
+                for field, field_value in entry.items():
+                    if not isinstance(field_value, str):
+                        raise _unsupported(
+                                f"{name}.{key}[{i}].{field}",
+                                field_value
+                        )
+            sections[key] = value
+        else:
+            raise _unsupported(f"{name}.{key}", value)
+
+    return attrs, sections
+
+
+def compile_resume_data(resume_data: dict) -> bytes:
+    """Serializes parsed resume data into the compiled resume format.
+
+    Every top-level key must be a profile: an array holding a single table
+    (e.g. `[[default]]`), as the rest of the package reads a resume. Values
+    must be strings or arrays of tables of strings, so that `to_dict()`
+    returns exactly the parsed resume.
+
+    Args:
+        resume_data (dict): Parsed dictionary of resume data.
+
+    Raises:
+        ValueError: `resume_data` holds a value the format can not store.
+
+    Returns:
+        bytes: The compiled resume.
+    """
+    heap = _StringHeap()
+    profiles = []
+    for name, value in resume_data.items():
+        if not (
+                isinstance(value, list) and len(value) == 1
+                and isinstance(value[0], dict)
+        ):
+            raise ValueError(
+                    f"\"{name}\" is not a profile; compiled resumes only hold "
+                    "top-level arrays with a single table."
+            )
+        profiles.append((name, value[0]))
+
+    profile_table = bytearray()
+    body = bytearray()
+    body_start = _HEADER.size + len(profiles) * _PROFILE.size
+
+    def body_offset() -> int:
+        return body_start + len(body)
+
+    for name, profile_data in profiles:
+        attrs, sections = _split_profile(name, profile_data)
+
+        attrs_off = body_offset()
+        for key, value in attrs.items():
+            body.extend(_ATTR.pack(*heap.add(key), *heap.add(value)))
+
+        section_records = bytearray()
+        for section_name, entries in sections.items():
+            fields: list[str] = []
+            for entry in entries:
+                for key in entry:
+                    if key not in fields:
+                        fields.append(key)
+
+            fields_off = body_offset()
+            for field in fields:
+                body.extend(_REF.pack(*heap.add(field)))
+
+            entries_off = body_offset()
+            for entry in entries:
+                for field in fields:
+                    if field in entry:
+                        body.extend(_REF.pack(*heap.add(entry[field])))
+                    else:
+                        body.extend(_REF.pack(0, MISSING))
+
+            section_records.extend(
+                    _SECTION.pack(
+                            *heap.add(section_name),
+                            len(fields),
+                            fields_off,
+                            len(entries),
+                            entries_off
+                    )
+            )
+
+        sections_off = body_offset()
+        body.extend(section_records)
+
+        profile_table.extend(
+                _PROFILE.pack(
+                        *heap.add(name),
+                        len(attrs),
+                        attrs_off,
+                        len(sections),
+                        sections_off
+                )
+        )
+
+    heap_bytes = heap.getvalue()
+    heap_off = body_offset()
+    header = _HEADER.pack(
+            MAGIC,
+            VERSION,
+            0,
+            len(profiles),
+            _HEADER.size,
+            heap_off,
+            len(heap_bytes)
+    )
+
+    return header + bytes(profile_table) + bytes(body) + heap_bytes
+
+
+def compile_resume(resume_config_file: str, output_file: str) -> None:
+    """Compiles a resume configuration file and writes it to `output_file`.
+
+    Args:
+        resume_config_file (str): Path to the TOML resume configuration file.
+            May be compressed, or "-" to read from stdin.
+        output_file (str): Path to write the compiled resume to. An existing
+            file is replaced rather than overwritten, so readers that still
+            map it keep its previous contents.
+    """
+    with open_resume_source(resume_config_file) as f:
+        resume_data: dict = tomllib.load(f)
+    compiled = compile_resume_data(resume_data)
+
+    tmp_file = f"{os.fspath(output_file)}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, "wb") as f:
+            f.write(compiled)
+        os.replace(tmp_file, output_file)
+    finally:
+        # Only left behind if writing or replacing failed.
+        if os.path.exists(tmp_file):
+            os.unlink(tmp_file)
+
+
+class CompiledEntry(Mapping):
+    """A single entry of a compiled section. Fields are decoded on access."""
+
+    __slots__ = ("_section", "_index")
+
+    def __init__(self, section: "CompiledSection", index: int):
+        self._section = section
+        self._index = index
+
+    def __getitem__(self, field: str) -> str:
+        value = self._section.field_value(self._index, field)
+        if value is None:
+            raise KeyError(field)
+        return value
+
+    def __iter__(self):
+        for field in self._section.fields:
+            if self._section.field_value(self._index, field) is not None:
+                yield field
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class CompiledSection(Sequence):
+    """An array of tables (e.g. `experience`) inside a compiled profile."""
+
+    def __init__(self, resume: "CompiledResume", record_off: int):
+        self._resume = resume
+        (
+                name_off,
+                name_len,
+                self._field_count,
+                self._fields_off,
+                self._entry_count,
+                self._entries_off
+        ) = _SECTION.unpack_from(resume.buffer, record_off)
+        self.name = resume.read_string(name_off, name_len)
+        self._fields: tuple[str, ...] | None = None
+        self._field_index: dict[str, int] | None = None
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Field names declared by the entries of this section."""
+        if self._fields is None:
+            self._fields = tuple(
+                    self._resume.read_string(
+                            *_REF.unpack_from(
+                                    self._resume.buffer,
+                                    self._fields_off + i * _REF.size
+                            )
+                    ) for i in range(self._field_count)
+            )
+            self._field_index = {
+                    field: i
+                    for i, field in enumerate(self._fields)
+            }
+        return self._fields
+
+    def field_value(self, index: int, field: str) -> str | None:
+        """Decodes one field of one entry.
+
+        Args:
+            index (int): Index of the entry in this section.
+            field (str): Name of the field.
+
+        Returns:
+            str | None: The field value, or None if the entry does not
+                define `field`.
+        """
+        if self._field_index is None:
+            self.fields  # pylint: disable=W0104
+        column = self._field_index.get(field)
+        if column is None:
+            return None
+
+        offset, length = _REF.unpack_from(
+                self._resume.buffer,
+                self._entries_off
+                + (index * self._field_count + column) * _REF.size
+        )
+        if length == MISSING:
+            return None
+        return self._resume.read_string(offset, length)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += self._entry_count
+        if not 0 <= index < self._entry_count:
+            raise IndexError(index)
+        return CompiledEntry(self, index)
+
+    def __len__(self) -> int:
+        return self._entry_count
+
+
+class CompiledProfile(Mapping):
+    """A profile table (e.g. `default[0]`) of a compiled resume."""
+
+    def __init__(self, resume: "CompiledResume", record_off: int):
+        self._resume = resume
+        (
+                name_off,
+                name_len,
+                attr_count,
+                attrs_off,
+                section_count,
+                sections_off
+        ) = _PROFILE.unpack_from(resume.buffer, record_off)
+        self.name = resume.read_string(name_off, name_len)
+
+        self._attrs: dict[str, tuple[int, int]] = {}
+        for i in range(attr_count):
+            key_off, key_len, value_off, value_len = _ATTR.unpack_from(
+                    resume.buffer, attrs_off + i * _ATTR.size
+            )
+            self._attrs[resume.read_string(key_off, key_len)] = (
+                    value_off,
+                    value_len
+            )
+
+        self._sections: dict[str, int] = {}
+        self._section_cache: dict[str, CompiledSection] = {}
+        for i in range(section_count):
+            section_off = sections_off + i * _SECTION.size
+            key_off, key_len = _REF.unpack_from(resume.buffer, section_off)
+            self._sections[resume.read_string(key_off, key_len)] = section_off
+
+    def __getitem__(self, key: str):
+        if key in self._attrs:
+            return self._resume.read_string(*self._attrs[key])
+        if key in self._sections:
+            section = self._section_cache.get(key)
+            if section is None:
+                section = CompiledSection(self._resume, self._sections[key])
+                self._section_cache[key] = section
+            return section
+        raise KeyError(key)
+
+    def __iter__(self):
+        yield from self._attrs
+        yield from self._sections
+
+    def __len__(self) -> int:
+        return len(self._attrs) + len(self._sections)
+
+
+class CompiledResume(Mapping):
+    """Read-only, memory-mapped view of a compiled resume.
+
+    The mapping mirrors the structure returned by `tomllib`, so
+    `compiled["default"][0]["experience"][0]["name"]` reads a single company
+    name, decoding nothing else.
+    """
+
+    def __init__(self, compiled_file: str):
+        with open(compiled_file, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._open(buffer, compiled_file)
+
+    @classmethod
+    def from_bytes(
+            cls,
+            data: bytes,
+            name: str = "<bytes>"
+    ) -> "CompiledResume":
+        """Reads a compiled resume that is already in memory, for example one
+        decompressed from a ".gz" file or read from stdin.
+
+        Args:
+            data (bytes): Contents of the compiled resume.
+            name (str, optional): Name of the source used in error messages.
+                Defaults to "<bytes>".
+
+        Returns:
+            CompiledResume: The compiled resume.
+        """
+        resume = cls.__new__(cls)
+        resume._open(data, name)  # pylint: disable=W0212
+        return resume
+
+    def _open(self, buffer: mmap.mmap | bytes, compiled_file: str) -> None:
+        self.buffer = buffer
+        (
+                magic,
+                version,
+                _,
+                profile_count,
+                profiles_off,
+                self._heap_off,
+                self._heap_len
+        ) = _HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{compiled_file} is not a compiled resume.")
+        if version != VERSION:
+            self.close()
+            raise ValueError(
+                    f"{compiled_file} has unsupported compiled resume "
+                    f"version {version}."
+            )
+
+        self._profile_offsets: dict[str, int] = {}
+        self._profiles: dict[str, CompiledProfile] = {}
+        for i in range(profile_count):
+            record_off = profiles_off + i * _PROFILE.size
+            name_off, name_len = _REF.unpack_from(self.buffer, record_off)
+            self._profile_offsets[self.read_string(name_off,
+                                                   name_len)] = record_off
+
+    def read_string(self, offset: int, length: int) -> str:
+        """Decodes a string from the string heap.
+
+        Args:
+            offset (int): Offset into the string heap.
+            length (int): Length of the encoded string in bytes.
+
+        Returns:
+            str: The decoded string.
+        """
+        start = self._heap_off + offset
+        return self.buffer[start:start + length].decode("utf-8")
+
+    def profile(self, name: str) -> CompiledProfile:
+        """Gets a profile (e.g. "default") of the compiled resume."""
+        profile = self._profiles.get(name)
+        if profile is None:
+            profile = CompiledProfile(self, self._profile_offsets[name])
+            self._profiles[name] = profile
+        return profile
+
+    def __getitem__(self, name: str) -> tuple[CompiledProfile]:
+        return (self.profile(name),)
+
+    def __iter__(self):
+        return iter(self._profile_offsets)
+
+    def __len__(self) -> int:
+        return len(self._profile_offsets)
+
+    def to_dict(self) -> dict:
+        """Decodes the entire compiled resume into plain Python objects."""
+        return {
+                name: [{
+                        key: (
+                                [dict(entry) for entry in value]
+                                if isinstance(value, CompiledSection) else value
+                        )
+                        for key, value in self.profile(name).items()
+                }]
+                for name in self
+        }
+
+    def close(self) -> None:
+        """Unmaps the compiled resume."""
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,152 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Shell completion for resume files, profiles and company names.
+
+Completion runs on every TAB press, so the profile and company names of a
+resume are kept in a small sidecar index under the user's cache directory.
+The resume is only parsed again when its fingerprint (modification time and
+size) no longer matches the one recorded in the sidecar index.
+"""
+
+import hashlib
+import json
+import os
+
+from click.shell_completion import CompletionItem
+
+
+def _sidecar_file(resume_config_file: str) -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+    )
+    # Named after a hash of the path, as no character substitution can map
+    # every path to a distinct file name.
+    digest = hashlib.blake2b(
+            os.fsencode(resume_config_file),
+            digest_size=16
+    ).hexdigest()
+    name = f"{digest}.json"
+    return os.path.join(cache_home, "jobappfiller", "completion", name)
+
+
+def _build_sidecar_index(resume_config_file: str) -> dict:
+    # Imported here so completing anything else never loads a TOML parser.
+    from jobappfiller.tools.parse_job_config import (  # pylint: disable=C0415
+            list_profiles,
+            parse_resume
+    )
+
+    resume_data = parse_resume(resume_config_file)
+    profiles: dict[str, list[str]] = {}
+    for profile in list_profiles(resume_data):
+        experience_data = resume_data[profile][0]["experience"]
+        profiles[profile] = [
+                experience_data[i]["name"]
+                for i in range(0, len(experience_data))
+        ]
+
+    return profiles
+
+
+def completion_index(resume_config_file: str) -> dict[str, list[str]]:
+    """Gets the company names of each profile, refreshing the sidecar index
+    only if the resume changed.
+
+    Args:
+        resume_config_file (str): Path to the resume file.
+
+    Returns:
+        dict[str, list[str]]: Company names keyed by profile.
+    """
+    path = os.path.realpath(resume_config_file)
+    stat = os.stat(path)
+    fingerprint = [stat.st_mtime_ns, stat.st_size]
+    sidecar_file = _sidecar_file(path)
+
+    try:
+        with open(sidecar_file, "r", encoding="utf-8") as f:
+            sidecar = json.load(f)
+        if sidecar["path"] == path and sidecar["fingerprint"] == fingerprint:
+            return sidecar["profiles"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    profiles = _build_sidecar_index(path)
+    os.makedirs(os.path.dirname(sidecar_file), exist_ok=True)
+    tmp_file = f"{sidecar_file}.{os.getpid()}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(
+                {
+                        "path": path,
+                        "fingerprint": fingerprint,
+                        "profiles": profiles
+                },
+                f
+        )
+    os.replace(tmp_file, sidecar_file)
+
+    return profiles
+
+
+def _resume_profiles(ctx) -> dict[str, list[str]]:
+    resume_config_file = ctx.params.get("file")
+    if not resume_config_file and ctx.params.get("files"):
+        # Commands opening several resumes complete from the last one.
+        resume_config_file = ctx.params["files"][-1]
+    if not resume_config_file:
+        return {}
+    try:
+        return completion_index(resume_config_file)
+    except Exception:  # pylint: disable=W0718
+        # Never let a broken resume break the user's shell.
+        return {}
+
+
+def complete_resume_file(  # pylint: disable=W0613
+        ctx,
+        param,
+        incomplete: str
+) -> list[CompletionItem]:
+    """Completes the `--file` option with paths."""
+    return [CompletionItem(incomplete, type="file")]
+
+
+def complete_profile(  # pylint: disable=W0613
+        ctx,
+        param,
+        incomplete: str
+) -> list[CompletionItem]:
+    """Completes the `--profile` option with the profiles of `--file`."""
+    return [
+            CompletionItem(profile)
+            for profile in _resume_profiles(ctx)
+            if profile.startswith(incomplete)
+    ]
+
+
+def complete_company(  # pylint: disable=W0613
+        ctx,
+        param,
+        incomplete: str
+) -> list[CompletionItem]:
+    """Completes the `--company` option with the companies of `--profile`."""
+    profile = ctx.params.get("profile") or "default"
+    key = incomplete.casefold()
+
+    return [
+            CompletionItem(name)
+            for name in _resume_profiles(ctx).get(profile, [])
+            if name.casefold().startswith(key)
+    ]
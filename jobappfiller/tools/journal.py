@@ -0,0 +1,259 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Append-only journal of the fields copied from the GUI.
+
+Every copy is appended to a JSONL file as one compact record. Records are
+fsynced in batches, or by a timer once the oldest unsynced record is a few
+seconds old, and the journal is rotated once it grows past a size limit.
+Aggregated counts live in a sidecar index next to the journal which
+remembers how far into the journal it has read, so `journal_history` only
+reads records appended since the last report.
+"""
+
+import datetime
+import json
+import os
+import threading
+import time
+
+INDEX_SUFFIX: str = ".idx"
+GROUPS: tuple[str, ...] = ("company", "field", "day")
+
+
+def default_journal_file() -> str:
+    """Gets the default journal path under the XDG data directory.
+
+    Returns:
+        str: `$XDG_DATA_HOME/jobappfiller/journal.jsonl`, where
+            `$XDG_DATA_HOME` defaults to `~/.local/share`.
+    """
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.join(
+            os.path.expanduser("~"), ".local", "share"
+    )
+    return os.path.join(data_home, "jobappfiller", "journal.jsonl")
+
+
+def _empty_index() -> dict:
+    return {
+            "inode": None,
+            "offset": 0,
+            "total": 0,
+            "counts": {group: {} for group in GROUPS},
+    }
+
+
+def _load_index(journal_file: str) -> dict:
+    try:
+        with open(journal_file + INDEX_SUFFIX, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return _empty_index()
+
+
+def _save_index(journal_file: str, index: dict) -> None:
+    index_file = journal_file + INDEX_SUFFIX
+    tmp_file = index_file + ".tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"))
+    os.replace(tmp_file, index_file)
+
+
+def update_index(journal_file: str) -> dict:
+    """Folds the records appended since the last update into the index.
+
+    Args:
+        journal_file (str): Path to the journal.
+
+    Returns:
+        dict: The updated index, with the record count in `"total"` and the
+            counts per company, field and day under `"counts"`.
+    """
+    index = _load_index(journal_file)
+
+    try:
+        stat = os.stat(journal_file)
+    except FileNotFoundError:
+        return index
+
+    if index["inode"] != stat.st_ino or stat.st_size < index["offset"]:
+        # The journal was replaced by a file the index has not seen yet.
+        index["inode"] = stat.st_ino
+        index["offset"] = 0
+
+    if stat.st_size == index["offset"]:
+        return index
+
+    counts = index["counts"]
+    with open(journal_file, "rb") as f:
+        f.seek(index["offset"])
+        for line in f:
+            if not line.endswith(b"\n"):
+                # Partially written record, read it on the next update.
+                break
+            index["offset"] += len(line)
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            index["total"] += 1
+            for group, key in (
+                    ("company", record.get("company")),
+                    ("field", record.get("field")),
+                    ("day", record.get("ts", "")[:10]),
+            ):
+                counts[group][key] = counts[group].get(key, 0) + 1
+
+    _save_index(journal_file, index)
+
+    return index
+
+
+def journal_history(journal_file: str, group: str) -> list[tuple[str, int]]:
+    """Counts the copies in the journal grouped by company, field or day.
+
+    Args:
+        journal_file (str): Path to the journal.
+        group (str): One of "company", "field" or "day".
+
+    Returns:
+        list[tuple[str, int]]: `(key, count)` pairs, most frequent first
+            (or in chronological order when grouping by day).
+    """
+    counts: dict[str, int] = update_index(journal_file)["counts"][group]
+    if group == "day":
+        return sorted(counts.items())
+    return sorted(counts.items(), key=lambda item: item[1], reverse=True)
+
+
+class ApplicationJournal:
+    """Appends copy events to the journal."""
+
+    def __init__(
+            self,
+            journal_file: str,
+            fsync_every: int = 32,
+            fsync_interval: float = 5.0,
+            max_bytes: int = 8 * 1024 * 1024
+    ):
+        """Opens the journal for appending, creating it if needed.
+
+        Args:
+            journal_file (str): Path to the journal.
+            fsync_every (int, optional): Number of records to buffer before
+                they are synced to disk. Defaults to 32.
+            fsync_interval (float, optional): Maximum number of seconds a
+                record stays buffered before it is synced. Defaults to 5.0.
+            max_bytes (int, optional): Size after which the journal is
+                rotated. Defaults to 8 MiB.
+        """
+        self.journal_file = journal_file
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.max_bytes = max_bytes
+
+        directory = os.path.dirname(journal_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._file = open(journal_file, "ab")
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        # Records may be synced from the timer thread.
+        self._lock = threading.RLock()
+        self._timer: threading.Timer | None = None
+
+    def record(self, company: str, field: str, **extra) -> None:
+        """Appends a copy event to the journal.
+
+        Args:
+            company (str): Company of the experience entry that was copied.
+            field (str): Name of the field that was copied.
+            **extra: Additional values to store with the event, for example
+                the resume file or profile.
+        """
+        event = {
+                "ts": datetime.datetime.now().astimezone().isoformat(
+                        timespec="seconds"
+                ),
+                "company": company,
+                "field": field,
+                **extra
+        }
+        line = (json.dumps(event, separators=(",", ":")) + "\n").encode()
+
+        with self._lock:
+            position = self._file.tell()
+            if position and position + len(line) > self.max_bytes:
+                self.rotate()
+
+            self._file.write(line)
+            self._pending += 1
+
+            if (
+                    self._pending >= self.fsync_every or
+                    time.monotonic() - self._last_sync >= self.fsync_interval
+            ):
+                self.sync()
+            elif self._timer is None:
+                # Sync a small batch once `fsync_interval` has passed, even if
+                # no other record arrives by then.
+                self._timer = threading.Timer(self.fsync_interval, self.sync)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def sync(self) -> None:
+        """Flushes buffered records and syncs them to disk."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._pending == 0 or self._file.closed:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._pending = 0
+            self._last_sync = time.monotonic()
+
+    def rotate(self) -> None:
+        """Moves the journal aside as `<journal>.<n>` and starts a new one.
+
+        The index is brought up to date first, so the counts of the rotated
+        records are kept.
+        """
+        with self._lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._pending = 0
+            update_index(self.journal_file)
+
+            n = 1
+            while os.path.exists(f"{self.journal_file}.{n}"):
+                n += 1
+            os.replace(self.journal_file, f"{self.journal_file}.{n}")
+
+            self._file = open(self.journal_file, "ab")
+
+    def close(self) -> None:
+        """Syncs any buffered records and closes the journal."""
+        with self._lock:
+            self.sync()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
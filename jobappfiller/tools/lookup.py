@@ -0,0 +1,236 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Finds experience entries by company name or prefix."""
+
+import abc
+from collections.abc import Mapping, Sequence
+
+from jobappfiller.tools.parse_job_config import list_profiles
+from jobappfiller.tools.schema import EXPERIENCE_FIELDS
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self):
+        self.children: dict[str, "_TrieNode"] = {}
+        self.ids: list[int] = []
+
+
+class PrefixTrie:
+    """Maps every prefix of the inserted keys to the ids stored under them."""
+
+    def __init__(self):
+        self._root = _TrieNode()
+
+    def insert(self, key: str, entry_id: int) -> None:
+        """Stores `entry_id` under `key` and each of its prefixes."""
+        node = self._root
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+            if not node.ids or node.ids[-1] != entry_id:
+                node.ids.append(entry_id)
+
+    def find(self, prefix: str) -> list[int]:
+        """Gets the ids of every key starting with `prefix`, in insert order.
+
+        Args:
+            prefix (str): Prefix to search for.
+
+        Returns:
+            list[int]: Matching ids.
+        """
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.ids
+
+
+class CompanyIndex:
+    """Case-insensitive company name index of every profile in a resume.
+
+    A company matches a query if its name equals the query, starts with it,
+    or has a word starting with it (so "express" finds "American Express").
+    """
+
+    def __init__(self, resume_data: dict):
+        """Builds the index.
+
+        Args:
+            resume_data (dict): Parsed dictionary of resume data.
+        """
+        self._exact: dict[str, dict[str, list[int]]] = {}
+        self._tries: dict[str, PrefixTrie] = {}
+        self._names: dict[str, list[str]] = {}
+
+        for profile in list_profiles(resume_data):
+            experience_data = resume_data[profile][0]["experience"]
+            exact = self._exact.setdefault(profile, {})
+            trie = self._tries.setdefault(profile, PrefixTrie())
+            names = self._names.setdefault(profile, [])
+
+            for i in range(0, len(experience_data)):
+                name = experience_data[i]["name"]
+                names.append(name)
+                key = name.casefold()
+                exact.setdefault(key, []).append(i)
+
+                # Index the name from the start of each of its words.
+                words = key.split()
+                for start in range(len(words)):
+                    trie.insert(" ".join(words[start:]), i)
+
+    def names(self, profile: str = "default") -> list[str]:
+        """Gets the company names of a profile, in resume order."""
+        return self._names.get(profile, [])
+
+    def find(self, query: str, profile: str = "default") -> list[int]:
+        """Gets the indexes of the entries whose company matches `query`.
+
+        Exact (case-insensitive) matches win over prefix matches.
+
+        Args:
+            query (str): Company name or prefix.
+            profile (str, optional): Profile to search. Defaults to "default".
+
+        Returns:
+            list[int]: Indexes into the profile's experience entries.
+        """
+        key = " ".join(query.casefold().split())
+        exact = self._exact.get(profile, {}).get(key)
+        if exact:
+            return exact
+
+        trie = self._tries.get(profile)
+        if trie is None:
+            return []
+        return trie.find(key)
+
+
+def build_company_index(resume_data: dict) -> CompanyIndex:
+    """Builds the company index of a parsed resume.
+
+    Args:
+        resume_data (dict): Parsed dictionary of resume data.
+
+    Returns:
+        CompanyIndex: The index over all profiles of `resume_data`.
+    """
+    return CompanyIndex(resume_data)
+
+
+class CompanyLookup(abc.ABC):
+    """Reads experience entries by company, for classes with a `CompanyIndex`.
+
+    Subclasses provide `company_index`, `profile`, `company_list`,
+    `date_format`, `startdate_formats`, `enddate_formats` and
+    `_field_value`.
+    """
+
+    __slots__ = ()
+
+    company_index: CompanyIndex
+    profile: str
+    company_list: Sequence[str]
+    date_format: str
+    startdate_formats: Mapping[str, Sequence[str]]
+    enddate_formats: Mapping[str, Sequence[str]]
+
+    @abc.abstractmethod
+    def _field_value(self, idx: int, field: str) -> str:
+        """Gets a field other than the dates of the entry at `idx`."""
+
+    def find_company(self, company: str, index: int | None = None) -> int:
+        """Finds the experience entry of a company by its name or a prefix.
+
+        Args:
+            company (str): Case-insensitive company name, or a prefix of the
+                name or of any word in it.
+            index (int | None, optional): Which of several matching entries
+                to pick, counting from 1 in resume order. Needed when a
+                company has more than one entry. Defaults to None.
+
+        Raises:
+            KeyError: No company matches `company`, or fewer than `index`
+                entries do.
+            ValueError: More than one entry matches `company` and `index` is
+                not given.
+
+        Returns:
+            int: Index of the entry in `company_list`.
+        """
+        matches = self.company_index.find(company, profile=self.profile)
+
+        if not matches:
+            raise KeyError(f"No company matches \"{company}\".")
+        if index is not None:
+            if not 1 <= index <= len(matches):
+                raise KeyError(
+                        f"\"{company}\" matches {len(matches)} entries, "
+                        f"there is no entry {index}."
+                )
+            return matches[index - 1]
+        if len(matches) > 1:
+            company_list = self.company_list
+            candidates = ", ".join(
+                    f"{n}: {company_list[i]}"
+                    for n, i in enumerate(matches, start=1)
+            )
+            raise ValueError(
+                    f"\"{company}\" matches more than one entry "
+                    f"({candidates}), pick one by its index."
+            )
+
+        return matches[0]
+
+    def get(
+            self,
+            company: str,
+            field: str,
+            date_format: str | None = None,
+            index: int | None = None
+    ) -> str:
+        """Gets a single field of a company's experience entry.
+
+        Args:
+            company (str): Company name or prefix, see `find_company`.
+            field (str): One of `EXPERIENCE_FIELDS`.
+            date_format (str | None, optional): Date format for "startdate"
+                and "enddate". Defaults to `date_format`.
+            index (int | None, optional): Which of several matching entries
+                to read, see `find_company`. Defaults to None.
+
+        Raises:
+            KeyError: `field` is unknown, no company matches `company` or
+                fewer than `index` entries do.
+            ValueError: More than one entry matches `company` and `index` is
+                not given.
+
+        Returns:
+            str: The value of the field.
+        """
+        if field not in EXPERIENCE_FIELDS:
+            raise KeyError(f"Unknown field \"{field}\".")
+        idx = self.find_company(company, index=index)
+
+        if field in ("startdate", "enddate"):
+            formats = getattr(self, f"{field}_formats")
+            if date_format not in formats:
+                date_format = self.date_format
+            return formats[date_format][idx]
+
+        return self._field_value(idx, field)
@@ -14,8 +14,11 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """Parses job resume configuration file."""
 
-import tomllib
+from collections.abc import Mapping
 
+from jobappfiller.tools.resume_cache import load_resume
+from jobappfiller.tools.sections import project_section
+from jobappfiller.util import memprofile
 from jobappfiller.util.logger import setup_logger
 
 logger = setup_logger(log_file=None)
@@ -24,18 +27,49 @@ logger = setup_logger(log_file=None)
 def parse_resume(resume_config_file: str) -> dict:
     """Reads the resume configuration file into a dictionary.
 
+    Compiled resumes (see `jobappfiller compile`) are returned as a
+    memory-mapped, read-only mapping with the same structure. Results are
+    cached until the file changes, so the returned data must not be modified.
+
     Args:
         resume_config_file (str): Path to configuration file as a string.
 
     Returns:
         dict: Dictionary containing the contents of the resume configuration.
     """
-    with open(resume_config_file, "rb") as f:
-        data: dict = tomllib.load(f)
+    with memprofile.stage("parse"):
+        data: dict = load_resume(resume_config_file).data
 
     return data
 
 
+def list_profiles(resume_data: dict) -> list[str]:
+    """Gets the names of the profiles (e.g. "default") in `resume_data`.
+
+    A profile is a top-level array of tables whose first table lists
+    `experience`.
+
+    Args:
+        resume_data (dict): Parsed dictionary of resume data.
+
+    Returns:
+        list[str]: List of profile names.
+    """
+    profiles: list[str] = []
+    for name, value in resume_data.items():
+        if (
+                isinstance(value, (list, tuple)) and value
+                and isinstance(value[0], Mapping) and "experience" in value[0]
+        ):
+            profiles.append(name)
+
+    return profiles
+
+
+def _list_experience_field(resume_data: dict, field: str) -> list[str]:
+    return project_section(resume_data, "experience", fields=(field,))[field]
+
+
 def list_companies(resume_data: dict) -> list[str]:
     """Gets the company names of the companies in `resume_data`
 
@@ -45,12 +79,7 @@ def list_companies(resume_data: dict) -> list[str]:
     Returns:
         list[str]: List of company names for each company in experience.
     """
-    companies: list[str] = []
-    experience_data = resume_data.get("default")[0]["experience"]
-    for i in range(0, len(experience_data)):
-        companies.append(experience_data[i]["name"])
-
-    return companies
+    return _list_experience_field(resume_data, "name")
 
 
 def list_locations(resume_data: dict) -> list[str]:
@@ -62,12 +91,7 @@ def list_locations(resume_data: dict) -> list[str]:
     Returns:
         list[str]: List of locations for each company in experience.
     """
-    locations: list[str] = []
-    experience_data = resume_data.get("default")[0]["experience"]
-    for i in range(0, len(experience_data)):
-        locations.append(experience_data[i]["location"])
-
-    return locations
+    return _list_experience_field(resume_data, "location")
 
 
 def list_startdates(resume_data: dict) -> list[str]:
@@ -79,12 +103,7 @@ def list_startdates(resume_data: dict) -> list[str]:
     Returns:
         list[str]: List of start dates for each company in experience.
     """
-    start_dates: list[str] = []
-    experience_data = resume_data.get("default")[0]["experience"]
-    for i in range(0, len(experience_data)):
-        start_dates.append(experience_data[i]["startdate"])
-
-    return start_dates
+    return _list_experience_field(resume_data, "startdate")
 
 
 def list_enddates(resume_data: dict) -> list[str]:
@@ -96,12 +115,7 @@ def list_enddates(resume_data: dict) -> list[str]:
     Returns:
         list[str]: List of end dates for each company in experience.
     """
-    end_dates: list[str] = []
-    experience_data = resume_data.get("default")[0]["experience"]
-    for i in range(0, len(experience_data)):
-        end_dates.append(experience_data[i]["enddate"])
-
-    return end_dates
+    return _list_experience_field(resume_data, "enddate")
 
 
 def list_jobtitles(resume_data: dict) -> list[str]:
@@ -113,12 +127,7 @@ def list_jobtitles(resume_data: dict) -> list[str]:
     Returns:
         list[str]: List of job titles for each company in experience.
     """
-    jobtitles: list[str] = []
-    experience_data = resume_data.get("default")[0]["experience"]
-    for i in range(0, len(experience_data)):
-        jobtitles.append(experience_data[i]["jobtitle"])
-
-    return jobtitles
+    return _list_experience_field(resume_data, "jobtitle")
 
 
 def list_descriptions(resume_data: dict) -> list[str]:
@@ -130,9 +139,4 @@ def list_descriptions(resume_data: dict) -> list[str]:
     Returns:
         list[str]: List of discriptions for each company in experience.
     """
-    descriptions: list[str] = []
-    experience_data = resume_data.get("default")[0]["experience"]
-    for i in range(0, len(experience_data)):
-        descriptions.append(experience_data[i]["description"])
-
-    return descriptions
+    return _list_experience_field(resume_data, "description")
@@ -0,0 +1,225 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Ranks experience entries against a job posting with BM25 scoring."""
+
+import heapq
+import math
+import re
+from collections import Counter
+from typing import NamedTuple
+
+from jobappfiller.tools.parse_job_config import list_profiles
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+STOPWORDS: frozenset[str] = frozenset(
+        (
+                "a",
+                "an",
+                "and",
+                "are",
+                "as",
+                "at",
+                "be",
+                "by",
+                "for",
+                "from",
+                "in",
+                "is",
+                "it",
+                "of",
+                "on",
+                "or",
+                "our",
+                "the",
+                "to",
+                "we",
+                "will",
+                "with",
+                "you",
+                "your",
+        )
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Splits text into lowercase search terms, dropping stopwords.
+
+    Args:
+        text (str): Text to tokenize.
+
+    Returns:
+        list[str]: The search terms in `text`, in order.
+    """
+    return [
+            token for token in _TOKEN_RE.findall(text.lower())
+            if token not in STOPWORDS
+    ]
+
+
+class RankedEntry(NamedTuple):
+    """An experience entry matched against a job posting."""
+
+    profile: str
+    index: int
+    score: float
+
+
+class InvertedIndex:
+    """BM25 inverted index over a fixed set of documents."""
+
+    def __init__(
+            self,
+            documents: list[Counter],
+            k1: float = 1.2,
+            b: float = 0.75
+    ):
+        """Builds the index.
+
+        Args:
+            documents (list[Counter]): Term frequencies of each document.
+            k1 (float, optional): Term frequency saturation. Defaults to 1.2.
+            b (float, optional): Document length normalization. Defaults to
+                0.75.
+        """
+        self.k1 = k1
+        self.document_count = len(documents)
+        self.postings: dict[str, list[tuple[int, int]]] = {}
+
+        lengths = [sum(terms.values()) for terms in documents]
+        average_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+        # The length-dependent part of the BM25 denominator, per document.
+        self._norms = [
+                k1 * (1 - b + b * length / average_length)
+                if average_length else k1
+                for length in lengths
+        ]
+
+        for doc_id, terms in enumerate(documents):
+            for term, frequency in terms.items():
+                self.postings.setdefault(term, []).append((doc_id, frequency))
+
+        self._idf = {
+                term: math.log(
+                        (self.document_count - len(postings) + 0.5)
+                        / (len(postings) + 0.5) + 1
+                )
+                for term, postings in self.postings.items()
+        }
+
+    def search(
+            self,
+            query: str,
+            top: int | None = None,
+            doc_filter: set[int] | None = None
+    ) -> list[tuple[int, float]]:
+        """Scores every document matching at least one query term.
+
+        Args:
+            query (str): Free text to search for.
+            top (int | None, optional): Only return the `top` best documents.
+                Defaults to returning all matches.
+            doc_filter (set[int] | None, optional): Only score these
+                documents. Defaults to scoring all documents.
+
+        Returns:
+            list[tuple[int, float]]: `(doc_id, score)` pairs, best first.
+        """
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if postings is None:
+                continue
+            idf = self._idf[term]
+            for doc_id, frequency in postings:
+                if doc_filter is not None and doc_id not in doc_filter:
+                    continue
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * (
+                        frequency * (self.k1 + 1)
+                        / (frequency + self._norms[doc_id])
+                )
+
+        if top is not None:
+            return heapq.nlargest(top, scores.items(), key=lambda x: x[1])
+        return sorted(scores.items(), key=lambda x: x[1], reverse=True)
+
+
+class ExperienceIndex:
+    """Inverted index over the experience entries of every profile."""
+
+    def __init__(self, resume_data: dict, title_weight: int = 2):
+        """Builds the index from the `jobtitle` and `description` of entries.
+
+        Args:
+            resume_data (dict): Parsed dictionary of resume data.
+            title_weight (int, optional): How many times a job title term
+                counts relative to a description term. Defaults to 2.
+        """
+        self.keys: list[tuple[str, int]] = []
+        self._profile_docs: dict[str, set[int]] = {}
+        documents: list[Counter] = []
+
+        for profile in list_profiles(resume_data):
+            experience_data = resume_data[profile][0]["experience"]
+            doc_ids = self._profile_docs.setdefault(profile, set())
+            for i in range(0, len(experience_data)):
+                entry = experience_data[i]
+                terms = Counter(tokenize(entry.get("description", "")))
+                for term in tokenize(entry.get("jobtitle", "")):
+                    terms[term] += title_weight
+                doc_ids.add(len(documents))
+                self.keys.append((profile, i))
+                documents.append(terms)
+
+        self.index = InvertedIndex(documents)
+
+    def rank(
+            self,
+            posting: str,
+            profile: str | None = None,
+            top: int | None = None
+    ) -> list[RankedEntry]:
+        """Ranks experience entries by how well they match `posting`.
+
+        Args:
+            posting (str): Text of the job posting.
+            profile (str | None, optional): Only rank entries of this
+                profile. Defaults to ranking entries of every profile.
+            top (int | None, optional): Only return the `top` best entries.
+                Defaults to returning every matching entry.
+
+        Returns:
+            list[RankedEntry]: Matching entries, best first.
+        """
+        doc_filter = None
+        if profile is not None:
+            doc_filter = self._profile_docs.get(profile, set())
+
+        return [
+                RankedEntry(*self.keys[doc_id], score)
+                for doc_id, score in self.index.search(posting, top, doc_filter)
+        ]
+
+
+def build_experience_index(resume_data: dict) -> ExperienceIndex:
+    """Builds the experience index of a parsed resume.
+
+    Args:
+        resume_data (dict): Parsed dictionary of resume data.
+
+    Returns:
+        ExperienceIndex: The index over all profiles of `resume_data`.
+    """
+    return ExperienceIndex(resume_data)
@@ -0,0 +1,169 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""In-process cache of parsed resume configuration files.
+
+A resume is parsed once per fingerprint (modification time and size) of its
+file. Structures derived from the parse result, such as search indexes, are
+cached on the same entry with `CachedResume.derive` so they are rebuilt only
+when the file changes. Resumes read from stdin are never cached.
+
+The text of every parsed resume is interned with `intern_strings`, so
+strings repeated across profiles and resumes are kept in memory once while
+any resume uses them.
+"""
+
+import os
+import threading
+import tomllib
+from typing import Any, Callable
+
+from jobappfiller.tools.compiled_resume import (
+        MAGIC,
+        CompiledResume,
+        is_compiled_resume
+)
+from jobappfiller.tools.resume_source import (
+        ResumeSourceError,
+        is_seekable_file,
+        is_stdin,
+        open_resume_source
+)
+from jobappfiller.util.string_store import intern_strings
+
+
+class CachedResume:
+    """A parsed resume and the structures derived from it."""
+
+    def __init__(self, fingerprint: tuple[int, int] | None, data: dict):
+        self.fingerprint = fingerprint
+        self.data = data
+        self._derived: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def derive(self, key: str, factory: Callable[[dict], Any]) -> Any:
+        """Gets a structure derived from the parse result, building it once.
+
+        Args:
+            key (str): Name of the derived structure.
+            factory (Callable[[dict], Any]): Builds the structure from the
+                parsed resume data.
+
+        Returns:
+            Any: The cached structure.
+        """
+        with self._lock:
+            if key not in self._derived:
+                self._derived[key] = factory(self.data)
+            return self._derived[key]
+
+
+_cache: dict[str, CachedResume] = {}
+_cache_lock = threading.Lock()
+
+
+def file_fingerprint(resume_config_file: str) -> tuple[int, int]:
+    """Gets the fingerprint used to detect changes to a resume file.
+
+    Args:
+        resume_config_file (str): Path to the resume file.
+
+    Returns:
+        tuple[int, int]: Modification time in nanoseconds and size in bytes.
+    """
+    stat = os.stat(resume_config_file)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _read_resume(resume_config_file: str) -> dict:
+    if is_seekable_file(resume_config_file):
+        if is_compiled_resume(resume_config_file):
+            return CompiledResume(resume_config_file)
+
+        with open(resume_config_file, "rb") as f:
+            data: dict = tomllib.load(f)
+
+        return intern_strings(data)
+
+    # Compressed files and stdin can not be memory-mapped or peeked at, so
+    # they are read once and the format is told apart in memory.
+    with open_resume_source(resume_config_file) as f:
+        contents = f.read()
+    if contents.startswith(MAGIC):
+        return CompiledResume.from_bytes(contents, str(resume_config_file))
+
+    try:
+        text = contents.decode("utf-8")
+    except UnicodeDecodeError as e:
+        source = "stdin" if is_stdin(resume_config_file) else resume_config_file
+        raise ResumeSourceError(
+                f"{source} is neither a TOML resume, a compiled "
+                "resume nor compressed with gzip, xz or bzip2."
+        ) from e
+
+    return intern_strings(tomllib.loads(text))
+
+
+def load_resume(resume_config_file: str) -> CachedResume:
+    """Parses a resume file, reusing the previous result if it is unchanged.
+
+    Args:
+        resume_config_file (str): Path to configuration file as a string.
+            Files ending in ".gz", ".xz" or ".bz2" are decompressed, and "-"
+            reads the resume from stdin.
+
+    Returns:
+        CachedResume: The parsed resume and its derived structures.
+    """
+    if is_stdin(resume_config_file):
+        return CachedResume(None, _read_resume(resume_config_file))
+
+    path = os.path.realpath(resume_config_file)
+    fingerprint = file_fingerprint(path)
+
+    with _cache_lock:
+        cached = _cache.get(path)
+    if cached is not None and cached.fingerprint == fingerprint:
+        return cached
+
+    # The entry of the previous contents is only dropped from the cache, not
+    # closed: other readers may still use it, and a compiled resume is
+    # unmapped once the last of them lets go of it.
+    cached = CachedResume(fingerprint, _read_resume(path))
+    with _cache_lock:
+        _cache[path] = cached
+
+    return cached
+
+
+def invalidate(resume_config_file: str) -> None:
+    """Drops the cached resume of a file, so its next load parses it again.
+
+    Used after writing a file, whose fingerprint may not change if it was
+    rewritten with the same size within the resolution of its timestamps.
+
+    Args:
+        resume_config_file (str): Path to the resume file.
+    """
+    if is_stdin(resume_config_file):
+        return
+
+    with _cache_lock:
+        _cache.pop(os.path.realpath(resume_config_file), None)
+
+
+def clear_cache() -> None:
+    """Drops every cached resume."""
+    with _cache_lock:
+        _cache.clear()
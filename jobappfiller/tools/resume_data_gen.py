@@ -14,211 +14,309 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """Handles data generation from resume configuration file."""
 
-import re
-import tomllib
-
+import datetime
+import functools
+import sys
+
+from jobappfiller.tools.lookup import (
+        CompanyIndex,
+        CompanyLookup,
+        build_company_index
+)
+from jobappfiller.tools.rank import build_experience_index
+from jobappfiller.tools.resume_cache import CachedResume, load_resume
+from jobappfiller.tools.resume_diff import EntryFingerprint, fingerprint_section
+from jobappfiller.tools.schema import EXPERIENCE_FIELDS
+from jobappfiller.tools.sections import ResumeSections
+from jobappfiller.tools.tenure import TenureReport, analyze_tenure
+from jobappfiller.util import memprofile
+
+DEFAULT_DATE_FORMAT: str = "MM/dd/yyyy"
+
+# Every date format supported by `ResumeDataGen`, as they are offered to users.
+DATE_FORMATS: tuple[str, ...] = (
+        "MM/dd/yyyy",
+        "MM-dd-yyyy",
+        "yyyy/MM/dd",
+        "yyyy-MM-dd",
+        "MM/yyyy",
+        "MM-yyyy",
+        "yyyy/MM",
+        "yyyy-MM",
+)
+
+
+def format_dates_all(list_of_dates: list[str]) -> dict[str, tuple[str, ...]]:
+    """Formats a list of dates into every supported date format at once.
+
+    Each date is split into its components a single time, then rendered into
+    every format in `DATE_FORMATS`. Dates that are not in "MM/dd/yyyy" format
+    (e.g. "Present") are kept as-is in every format. The formatted dates are
+    interned, since many of them repeat.
+
+    Args:
+        list_of_dates (list[str]): The original list of dates in
+            "MM/dd/yyyy" format.
 
-class ResumeDataGen:
+    Returns:
+        dict[str, tuple[str, ...]]: Formatted dates keyed by date format.
+    """
+    columns: dict[str, list[str]] = {fmt: [] for fmt in DATE_FORMATS}
+
+    for date_str in list_of_dates:
+        parts = date_str.split("/")
+        if len(parts) != 3:
+            for column in columns.values():
+                column.append(date_str)
+            continue
+
+        month, day, year = parts
+        for delim in ("/", "-"):
+            columns[f"MM{delim}dd{delim}yyyy"].append(
+                    f"{month}{delim}{day}{delim}{year}"
+            )
+            columns[f"yyyy{delim}MM{delim}dd"].append(
+                    f"{year}{delim}{month}{delim}{day}"
+            )
+            columns[f"MM{delim}yyyy"].append(f"{month}{delim}{year}")
+            columns[f"yyyy{delim}MM"].append(f"{year}{delim}{month}")
+
+    return {
+            fmt: tuple(sys.intern(date) for date in column)
+            for fmt, column in columns.items()
+    }
+
+
+class ResumeDataGen(CompanyLookup):
     """Portable data generation from resume config file."""
 
-    def __init__(self, resume_config_file: str, date_format: str | None = None):
-        if date_format is None:
-            self._date_format = "MM/dd/yyyy"
-        else:
+    def __init__(
+            self,
+            resume_config_file: str,
+            date_format: str | None = None,
+            profile: str = "default"
+    ):
+        self.resume_config_file = resume_config_file
+        self.profile = profile
+
+        if date_format in DATE_FORMATS:
             self._date_format = date_format
+        else:
+            self._date_format = DEFAULT_DATE_FORMAT
 
-        self.resume_data = self._parse_resume(resume_config_file)
-
-        self._experience_data = \
-            self.resume_data.get("default")[0]["experience"]
-
-        self.company_list = self._generate_company_list(self._experience_data)
-
-        self.location_list = self._generate_location_list(self._experience_data)
-
-        self._startdate_list = self._generate_startdate_list(
-                self._experience_data
-        )
-        self.startdate_list = self._format_dates(
-                self._startdate_list,
-                self._date_format
-        )
-
-        self._enddate_list = self._generate_enddate_list(self._experience_data)
-        self.enddate_list = self._format_dates(
-                self._enddate_list,
-                self._date_format
-        )
-
-        self.jobtitle_list = self._generate_jobtitle_list(self._experience_data)
+        with memprofile.stage("parse"):
+            self._cached_resume = self._parse_resume(resume_config_file)
+            self.resume_data = self._cached_resume.data
 
-        self.description_list = self._generate_description_list(
-                self._experience_data
-        )
+    @functools.cached_property
+    def sections(self) -> ResumeSections:
+        """ResumeSections: Columns of every section of the profile.
 
-    def _parse_resume(self, resume_config_file: str) -> dict:
-        """Reads the resume configuration file into a dictionary.
+        Each section is projected the first time it is read, so sections the
+        caller never uses cost nothing.
+        """
+        return ResumeSections(self.resume_data, self.profile)
+
+    @functools.cached_property
+    def company_list(self) -> list[str]:
+        """list[str]: Company name of each experience entry."""
+        return self.sections["experience"]["name"]
+
+    @functools.cached_property
+    def location_list(self) -> list[str]:
+        """list[str]: Location of each experience entry."""
+        return self.sections["experience"]["location"]
+
+    @functools.cached_property
+    def jobtitle_list(self) -> list[str]:
+        """list[str]: Job title of each experience entry."""
+        return self.sections["experience"]["jobtitle"]
+
+    @functools.cached_property
+    def description_list(self) -> list[str]:
+        """list[str]: Description of each experience entry."""
+        return self.sections["experience"]["description"]
+
+    @functools.cached_property
+    def startdate_formats(self) -> dict[str, tuple[str, ...]]:
+        """dict[str, tuple[str, ...]]: Start dates keyed by date format."""
+        with memprofile.stage("date formatting"):
+            return format_dates_all(self.sections["experience"]["startdate"])
+
+    @functools.cached_property
+    def enddate_formats(self) -> dict[str, tuple[str, ...]]:
+        """dict[str, tuple[str, ...]]: End dates keyed by date format."""
+        with memprofile.stage("date formatting"):
+            return format_dates_all(self.sections["experience"]["enddate"])
+
+    @functools.cached_property
+    def startdate_list(self) -> list[str]:
+        """list[str]: Start dates in the instance's date format."""
+        return list(self.startdate_formats[self._date_format])
+
+    @functools.cached_property
+    def enddate_list(self) -> list[str]:
+        """list[str]: End dates in the instance's date format."""
+        return list(self.enddate_formats[self._date_format])
+
+    def _parse_resume(self, resume_config_file: str) -> CachedResume:
+        """Reads the resume configuration file through the resume cache.
 
         Args:
             resume_config_file (str): Path to configuration file as a string.
+                May also be a compiled resume, which is memory-mapped instead
+                of parsed.
 
         Returns:
-            dict: Dictionary containing the contents of the resume
-                configuration.
+            CachedResume: The parsed resume configuration along with the
+                structures derived from it.
         """
+        return load_resume(resume_config_file)
 
-        with open(resume_config_file, "rb") as f:
-            data: dict = tomllib.load(f)
+    @property
+    def date_format(self) -> str:
+        """The date format used for `startdate_list` and `enddate_list`."""
+        return self._date_format
 
-        return data
+    def set_value(self, index: int, field: str, value: str) -> None:
+        """Changes a field of an experience entry in the loaded columns.
 
-    def _generate_company_list(self, experience_data: dict | None) -> list[str]:
-        """Gets the company names of the companies in experience_data.
+        Only this instance sees the change; the resume file and the parse
+        cache are left untouched (see `ResumeWriter` to save it).
 
         Args:
-            experience_data (dict, optional): Parsed dictionary of
-                ONLY experience from the resume data. Defaults to
-                `self._experience_data`.
+            index (int): Index of the experience entry.
+            field (str): One of `EXPERIENCE_FIELDS`.
+            value (str): New value of the field.
 
-        Returns:
-            list[str]: List of company names for each company in experience.
+        Raises:
+            KeyError: `field` is unknown.
         """
-        if experience_data is not None:
-            pass
-        else:
-            experience_data = self._experience_data
-
-        companies: list[str] = []
+        if field not in EXPERIENCE_FIELDS:
+            raise KeyError(f"Unknown field \"{field}\".")
+        self.sections["experience"][field][index] = value
+        self.__dict__.pop("_fingerprints", None)
 
-        for i in range(0, len(experience_data)):
-            companies.append(experience_data[i]["name"])
+        # The formatted dates are computed again on their next use.
+        if field in ("startdate", "enddate"):
+            self.__dict__.pop(f"{field}_formats", None)
+            self.__dict__.pop(f"{field}_list", None)
 
-        return companies
+    def reload(self, fresh: "ResumeDataGen | None" = None) -> None:
+        """Reads the resume file again, e.g. after edits were saved to it.
 
-    def _generate_location_list(self,
-                                experience_data: dict | None) -> list[str]:
-        """Gets the locations of the companies in experience_data.
+        The columns, fingerprints and edits made with `set_value` are dropped,
+        as are the company and ranking indexes of the previous contents. All
+        of them are computed again on their next use.
 
         Args:
-            experience_data (dict, optional): Parsed dictionary of
-                ONLY experience from the resume data. Defaults to
-                `self._experience_data`.
-
-        Returns:
-            list[str]: List of company locations for each company in experience.
+            fresh (ResumeDataGen | None, optional): Instance of the same file
+                and profile that was already loaded, e.g. in a worker thread.
+                Its parse and the columns it computed are taken over instead
+                of reading the file here. Defaults to None.
         """
-        if experience_data is not None:
-            pass
+        if fresh is None:
+            with memprofile.stage("parse"):
+                fresh_resume = self._parse_resume(self.resume_config_file)
+            computed = {}
         else:
-            experience_data = self._experience_data
-
-        locations: list[str] = []
-
-        for i in range(0, len(experience_data)):
-            locations.append(experience_data[i]["location"])
-
-        return locations
-
-    def _generate_startdate_list(self,
-                                    experience_data: dict | None) -> list[str]:
-        """Gets the startdates of the companies in experience_data.
-
-        Args:
-            experience_data (dict, optional): Parsed dictionary of
-                ONLY experience from the resume data. Defaults to
-                `self._experience_data`.
-
-        Returns:
-            list[str]: List of **UNFORMATTED** startdates for each company
-                in experience.
+            fresh_resume = fresh._cached_resume  # pylint: disable=W0212
+            computed = vars(fresh)
+
+        self._cached_resume = fresh_resume
+        self.resume_data = fresh_resume.data
+        for name, attribute in vars(ResumeDataGen).items():
+            if not isinstance(attribute, functools.cached_property):
+                continue
+            self.__dict__.pop(name, None)
+            # Columns in other date formats would not match this instance.
+            if name in computed and fresh.date_format == self._date_format:
+                self.__dict__[name] = computed[name]
+
+    @property
+    def fingerprint(self) -> tuple[int, int] | None:
+        """tuple[int, int] | None: Fingerprint of the resume file when it was
+        read, see `file_fingerprint`. None for resumes read from stdin."""
+        return self._cached_resume.fingerprint
+
+    @property
+    def company_index(self) -> CompanyIndex:
+        """CompanyIndex: Lookup index of the company names.
+
+        The index is built once per parsed resume and cached with the parse
+        result for the rest of the process. It is not stored on disk, so each
+        `jobappfiller get` builds it again.
         """
+        return self._cached_resume.derive("company_index", build_company_index)
 
-        if experience_data is not None:
-            pass
-        else:
-            experience_data = self._experience_data
-
-        startdates: list[str] = []
-
-        for i in range(0, len(experience_data)):
-            startdates.append(experience_data[i]["startdate"])
+    def _field_value(self, idx: int, field: str) -> str:
+        return self.sections["experience"][field][idx]
 
-        return startdates
-
-    def _generate_enddate_list(self, experience_data: dict | None) -> list[str]:
-        """Gets the enddates of the companies in experience_data.
+    def tenure(self, today: datetime.date | None = None) -> TenureReport:
+        """Computes the tenure of the experience entries.
 
         Args:
-            experience_data (dict, optional): Parsed dictionary of
-                ONLY experience from the resume data. Defaults to
-                `self._experience_data`.
+            today (datetime.date | None, optional): Date entries ending
+                "Present" end on. Defaults to the current date.
 
         Returns:
-            list[str]: List of **UNFORMATTED** enddates for each company
-                in experience.
+            TenureReport: Total tenure, overlaps, gaps and tenure per job
+                title keyword.
         """
+        experience = self.sections["experience"]
+        return analyze_tenure(
+                experience["startdate"],
+                experience["enddate"],
+                experience["jobtitle"],
+                today=today
+        )
 
-        if experience_data is not None:
-            pass
-        else:
-            experience_data = self._experience_data
-
-        enddates: list[str] = []
-
-        for i in range(0, len(experience_data)):
-            enddates.append(experience_data[i]["enddate"])
+    @functools.cached_property
+    def _fingerprints(self) -> list[EntryFingerprint]:
+        return fingerprint_section(self.sections["experience"])
 
-        return enddates
+    def fingerprints(self) -> list[EntryFingerprint]:
+        """Gets the content hashes of the experience entries.
 
-    def _generate_jobtitle_list(self,
-                                experience_data: dict | None) -> list[str]:
-        """Gets the jobtitles of the companies in experience_data.
-
-        Args:
-            experience_data (dict, optional): Parsed dictionary of
-                ONLY experience from the resume data. Defaults to
-                `self._experience_data`.
+        The hashes are computed from the same columns as `company_list` and
+        the other lists, including edits made with `set_value`, once per
+        instance.
 
         Returns:
-            list[str]: List of jobtitles for each company in experience.
+            list[EntryFingerprint]: Fingerprint of each entry, in the order of
+                `company_list`.
         """
+        return self._fingerprints
 
-        if experience_data is not None:
-            pass
-        else:
-            experience_data = self._experience_data
-
-        jobtitles: list[str] = []
-
-        for i in range(0, len(experience_data)):
-            jobtitles.append(experience_data[i]["jobtitle"])
-
-        return jobtitles
+    def rank(
+            self,
+            posting: str,
+            top: int | None = None
+    ) -> list[tuple[int, float]]:
+        """Ranks the experience entries by how well they match a job posting.
 
-    def _generate_description_list(self,
-                                    experience_data: dict | None) -> list[str]:
-        """Gets the descriptions of the companies in experience_data.
+        The inverted index is built once per parsed resume and cached with
+        the parse result.
 
         Args:
-            experience_data (dict, optional): Parsed dictionary of
-                ONLY experience from the resume data. Defaults to
-                `self._experience_data`.
+            posting (str): Text of the job posting.
+            top (int | None, optional): Only return the `top` best entries.
+                Defaults to returning every matching entry.
 
         Returns:
-            list[str]: List of descriptions for each company in experience.
+            list[tuple[int, float]]: `(index, score)` pairs, best first, where
+                `index` indexes `company_list` and the other lists.
         """
+        index = self._cached_resume.derive(
+                "experience_index",
+                build_experience_index
+        )
 
-        if experience_data is not None:
-            pass
-        else:
-            experience_data = self._experience_data
-
-        descriptions: list[str] = []
-
-        for i in range(0, len(experience_data)):
-            descriptions.append(experience_data[i]["description"])
-
-        return descriptions
+        return [(entry.index, entry.score) for entry in index.rank(
+                posting,
+                profile=self.profile,
+                top=top
+        )]
 
     def _format_dates(
             self,
@@ -236,29 +334,7 @@ class ResumeDataGen:
         Returns:
             list[str]: Formatted list of dates.
         """
-        if date_format is not None:
-            pass
-        else:
+        if date_format not in DATE_FORMATS:
             date_format = self._date_format
 
-        dates = list_of_dates
-
-        date_delim = \
-            "/" if "/" in date_format else "-" if "-" in date_format else "/"
-        modified_dates = []
-
-        for date_str in dates:
-            if date_format in ["yyyy/MM", "yyyy-MM"]:
-                modified = f"{date_str[-4:]}{date_delim}{date_str[:2]}"
-            elif date_format in ["MM/yyyy", "MM-yyyy"]:
-                modified = f"{date_str[:2]}{date_delim}{date_str[-4:]}"
-            elif date_format in ["yyyy/MM/dd", "yyyy-MM-dd"]:
-                day = re.search(r"\/(.*?)\/", date_str).group(1)
-                modified = \
-                    f"{date_str[-4:]}{date_delim}" \
-                    f"{date_str[:2]}{date_delim}{day}"
-            else:
-                modified = date_str
-            modified_dates.append(modified)
-
-        return modified_dates
+        return list(format_dates_all(list_of_dates)[date_format])
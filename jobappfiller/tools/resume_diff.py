@@ -0,0 +1,190 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Fingerprint-based comparison of the experience of two resumes.
+
+Every experience entry gets a content hash of each of its fields and one of
+the whole entry. Entries are first matched by their entry hash, which pairs
+the unchanged ones without looking at their fields, and the rest are matched
+by company name. Only the fields of entries matched by name are compared,
+hash against hash. Each step is a dictionary lookup per entry, so comparing
+two resumes takes time linear in their number of entries.
+"""
+
+import dataclasses
+import hashlib
+from collections import defaultdict
+from typing import NamedTuple
+
+from jobappfiller.tools.schema import EXPERIENCE_FIELDS
+
+DIGEST_SIZE: int = 16
+
+
+class EntryFingerprint(NamedTuple):
+    """Content hashes of an experience entry.
+
+    Attributes:
+        key (tuple[str, int]): Case-insensitive company name and how many
+            earlier entries have the same name, to tell repeated names apart.
+        digest (bytes): Hash of every field of the entry.
+        fields (dict[str, bytes]): Hash of each field.
+    """
+
+    key: tuple[str, int]
+    digest: bytes
+    fields: dict[str, bytes]
+
+
+def _hash(value: str) -> bytes:
+    return hashlib.blake2b(
+            value.encode("utf-8"),
+            digest_size=DIGEST_SIZE
+    ).digest()
+
+
+def fingerprint_section(
+        columns: dict[str, list[str]]
+) -> list[EntryFingerprint]:
+    """Hashes the entries of a projected experience section.
+
+    Args:
+        columns (dict[str, list[str]]): Column of each field in
+            `EXPERIENCE_FIELDS`, see `sections.project_section`.
+
+    Returns:
+        list[EntryFingerprint]: Fingerprint of each entry, in entry order.
+    """
+    seen: defaultdict[str, int] = defaultdict(int)
+    fingerprints: list[EntryFingerprint] = []
+
+    for row in zip(*(columns[field] for field in EXPERIENCE_FIELDS)):
+        fields = {
+                field: _hash(value)
+                for field, value in zip(EXPERIENCE_FIELDS, row)
+        }
+        name = row[0].casefold()
+        fingerprints.append(
+                EntryFingerprint(
+                        key=(name, seen[name]),
+                        digest=hashlib.blake2b(
+                                b"".join(fields.values()),
+                                digest_size=DIGEST_SIZE
+                        ).digest(),
+                        fields=fields
+                )
+        )
+        seen[name] += 1
+
+    return fingerprints
+
+
+class FieldChange(NamedTuple):
+    """A field whose value differs between two matched entries."""
+
+    company: str
+    field: str
+    old: str
+    new: str
+
+
+@dataclasses.dataclass
+class ResumeDiff:
+    """Differences between the experience of two resumes.
+
+    Attributes:
+        added (list[str]): Companies only in the new resume.
+        removed (list[str]): Companies only in the old resume.
+        changed (list[FieldChange]): Fields changed in entries of both.
+        unchanged (int): Number of identical entries.
+    """
+
+    added: list[str]
+    removed: list[str]
+    changed: list[FieldChange]
+    unchanged: int
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def diff_resumes(old, new) -> ResumeDiff:
+    """Compares the experience of two resumes.
+
+    Both the hashes and the reported values come from the columns of each
+    `ResumeDataGen`, so edits made with `set_value` are compared as well.
+
+    Args:
+        old (ResumeDataGen): The resume compared against, e.g. the master.
+        new (ResumeDataGen): The resume to compare, e.g. a tailored copy.
+
+    Returns:
+        ResumeDiff: Added, removed and changed entries, in entry order.
+    """
+    old_fingerprints = old.fingerprints()
+    new_fingerprints = new.fingerprints()
+    old_columns = old.sections["experience"]
+    new_columns = new.sections["experience"]
+
+    # Identical entries are paired by their hash, whatever their position.
+    unmatched_old: defaultdict[bytes, list[int]] = defaultdict(list)
+    for idx, fingerprint in enumerate(old_fingerprints):
+        unmatched_old[fingerprint.digest].append(idx)
+
+    old_matched = [False] * len(old_fingerprints)
+    remaining_new: list[int] = []
+    for idx, fingerprint in enumerate(new_fingerprints):
+        candidates = unmatched_old.get(fingerprint.digest)
+        if candidates:
+            old_matched[candidates.pop()] = True
+        else:
+            remaining_new.append(idx)
+    unchanged = len(new_fingerprints) - len(remaining_new)
+
+    # The other entries are paired by company name.
+    old_by_key = {
+            old_fingerprints[idx].key: idx
+            for idx, matched in enumerate(old_matched) if not matched
+    }
+
+    added: list[str] = []
+    changed: list[FieldChange] = []
+    for new_idx in remaining_new:
+        new_fingerprint = new_fingerprints[new_idx]
+        old_idx = old_by_key.pop(new_fingerprint.key, None)
+        if old_idx is None:
+            added.append(new_columns["name"][new_idx])
+            continue
+
+        old_fields = old_fingerprints[old_idx].fields
+        for field, digest in new_fingerprint.fields.items():
+            if old_fields[field] != digest:
+                changed.append(
+                        FieldChange(
+                                company=new_columns["name"][new_idx],
+                                field=field,
+                                old=old_columns[field][old_idx],
+                                new=new_columns[field][new_idx]
+                        )
+                )
+
+    removed = [old_columns["name"][idx] for idx in sorted(old_by_key.values())]
+
+    return ResumeDiff(
+            added=added,
+            removed=removed,
+            changed=changed,
+            unchanged=unchanged
+    )
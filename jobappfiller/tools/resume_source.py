@@ -0,0 +1,125 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Opens resume sources: plain files, compressed files and stdin.
+
+A source of "-" reads from stdin. Files ending in ".gz", ".xz" or ".bz2" are
+decompressed while they are read, without writing temporary files. Stdin has
+no file name, so its compression is told from the magic bytes it starts
+with.
+"""
+
+import bz2
+import contextlib
+import gzip
+import io
+import lzma
+import os
+import sys
+from typing import BinaryIO, Callable
+
+STDIN: str = "-"
+
+COMPRESSED_SUFFIXES: dict[str, Callable] = {
+        ".gz": gzip.open,
+        ".xz": lzma.open,
+        ".bz2": bz2.open,
+}
+
+# Magic bytes each compression format starts with.
+COMPRESSION_MAGIC: dict[bytes, str] = {
+        b"\x1f\x8b": ".gz",
+        b"\xfd7zXZ\x00": ".xz",
+        b"BZh": ".bz2",
+}
+
+# Read size used for compressed sources, larger than `io.DEFAULT_BUFFER_SIZE`
+# so the decompressors are fed in big chunks.
+BUFFER_SIZE: int = 1024 * 1024
+
+
+class ResumeSourceError(ValueError):
+    """A resume source holds data that is not a resume in any known format."""
+
+
+def is_stdin(resume_config_file: str) -> bool:
+    """Checks whether `resume_config_file` refers to stdin."""
+    return os.fspath(resume_config_file) == STDIN
+
+
+def compression_suffix(resume_config_file: str) -> str | None:
+    """Gets the compression suffix of `resume_config_file`, if it has one.
+
+    Args:
+        resume_config_file (str): Path to the resume file.
+
+    Returns:
+        str | None: ".gz", ".xz", ".bz2" or None for uncompressed files.
+    """
+    _, suffix = os.path.splitext(os.fspath(resume_config_file))
+    suffix = suffix.lower()
+    return suffix if suffix in COMPRESSED_SUFFIXES else None
+
+
+def is_seekable_file(resume_config_file: str) -> bool:
+    """Checks whether `resume_config_file` is a plain, uncompressed file."""
+    return (
+            not is_stdin(resume_config_file)
+            and compression_suffix(resume_config_file) is None
+    )
+
+
+@contextlib.contextmanager
+def open_resume_source(resume_config_file: str):
+    """Opens a resume source for reading as a binary stream.
+
+    Args:
+        resume_config_file (str): Path to the resume file, or "-" for stdin.
+
+    Yields:
+        BinaryIO: The (decompressed) contents of the resume file.
+    """
+    if is_stdin(resume_config_file):
+        # Peeking at the magic bytes needs a buffered reader of its own.
+        stdin = io.BufferedReader(sys.stdin.buffer, buffer_size=BUFFER_SIZE)
+        try:
+            suffix = _sniff_compression(stdin)
+            if suffix is None:
+                yield stdin
+            else:
+                with COMPRESSED_SUFFIXES[suffix](stdin, "rb") as f:
+                    yield io.BufferedReader(f, buffer_size=BUFFER_SIZE)
+        finally:
+            # Detached rather than closed, so stdin itself stays open.
+            stdin.detach()
+        return
+
+    suffix = compression_suffix(resume_config_file)
+    if suffix is None:
+        with open(resume_config_file, "rb") as f:
+            yield f
+        return
+
+    with open(resume_config_file, "rb", buffering=BUFFER_SIZE) as raw:
+        with COMPRESSED_SUFFIXES[suffix](raw, "rb") as f:
+            stream: BinaryIO = io.BufferedReader(f, buffer_size=BUFFER_SIZE)
+            yield stream
+
+
+def _sniff_compression(stream: io.BufferedReader) -> str | None:
+    head = stream.peek(max(len(magic) for magic in COMPRESSION_MAGIC))
+    for magic, suffix in COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return suffix
+    return None
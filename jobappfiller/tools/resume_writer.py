@@ -0,0 +1,179 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Writes edits of resume fields back to the resume configuration file.
+
+Edits are collected as patches of single values and applied to a `tomlkit`
+document of the resume, which keeps the comments, ordering and formatting of
+everything that was not edited. Callers debounce `flush()`, so a burst of
+edits (e.g. typing into a field) results in a single write, and every write
+goes to a temporary file that atomically replaces the resume. Edits of entries
+that do not exist are dropped and reported by the flush that finds them.
+"""
+
+import os
+
+import tomlkit
+import tomlkit.exceptions
+from tomlkit.items import String
+
+from jobappfiller.tools.compiled_resume import is_compiled_resume
+from jobappfiller.tools.resume_cache import file_fingerprint, invalidate
+from jobappfiller.tools.resume_source import is_seekable_file
+
+# Key of a single value: profile, section, entry index and field.
+FieldKey = tuple[str, str, int, str]
+
+
+def is_editable(resume_config_file: str) -> bool:
+    """Checks whether edits can be written back to `resume_config_file`.
+
+    Compressed files, stdin and compiled resumes are read-only.
+    """
+    return (
+            is_seekable_file(resume_config_file)
+            and not is_compiled_resume(resume_config_file)
+    )
+
+
+def _string_like(old, value: str):
+    # Keep the quoting of the edited string, e.g. multi-line descriptions.
+    if not isinstance(old, String):
+        return value
+    try:
+        return tomlkit.string(
+                value,
+                literal=old.type.is_literal(),
+                multiline=old.type.is_multiline()
+        )
+    except tomlkit.exceptions.TOMLKitError:
+        # e.g. a literal string can not hold the new value.
+        return value
+
+
+class ResumeWriter:
+    """Collects field edits and writes them back to a TOML resume."""
+
+    def __init__(self, resume_config_file: str):
+        """Creates the writer. The resume is only read on the first flush.
+
+        Args:
+            resume_config_file (str): Path to the TOML resume.
+
+        Raises:
+            ValueError: The resume is compressed, stdin or compiled.
+        """
+        if not is_editable(resume_config_file):
+            raise ValueError(
+                    f"\"{resume_config_file}\" can not be edited; only "
+                    "uncompressed TOML resumes can."
+            )
+        self.resume_config_file = os.fspath(resume_config_file)
+        self.pending: dict[FieldKey, str] = {}
+        self._document: tomlkit.TOMLDocument | None = None
+        self._fingerprint: tuple[int, int] | None = None
+
+    def set(
+            self,
+            profile: str,
+            section: str,
+            index: int,
+            field: str,
+            value: str
+    ) -> None:
+        """Records an edit to be written on the next `flush()`.
+
+        Args:
+            profile (str): Name of the profile, e.g. "default".
+            section (str): Name of the section, e.g. "experience".
+            index (int): Index of the entry in the section.
+            field (str): Name of the field, e.g. "jobtitle".
+            value (str): New value of the field.
+        """
+        self.pending[(profile, section, index, field)] = value
+
+    def _load(self) -> tomlkit.TOMLDocument:
+        # The document is kept between flushes and only read again if the
+        # file was changed by something else in the meantime.
+        fingerprint = file_fingerprint(self.resume_config_file)
+        if self._document is None or fingerprint != self._fingerprint:
+            with open(self.resume_config_file, "r", encoding="utf-8") as f:
+                self._document = tomlkit.load(f)
+            self._fingerprint = fingerprint
+
+        return self._document
+
+    def _write(self, document: tomlkit.TOMLDocument) -> None:
+        tmp_file = f"{self.resume_config_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, "w", encoding="utf-8", newline="") as f:
+                f.write(document.as_string())
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_file, os.stat(self.resume_config_file).st_mode)
+            os.replace(tmp_file, self.resume_config_file)
+        finally:
+            # Only left behind if writing or replacing failed.
+            if os.path.exists(tmp_file):
+                os.unlink(tmp_file)
+
+        self._fingerprint = file_fingerprint(self.resume_config_file)
+        invalidate(self.resume_config_file)
+
+    def flush(self) -> bool:
+        """Writes the recorded edits to the resume.
+
+        Edits of profiles, sections or entries that do not exist are dropped
+        and the remaining edits are written before the error is raised, so
+        each missing entry is reported once. Edits that could not be written
+        because of an `OSError` are kept for the next flush.
+
+        Raises:
+            LookupError: An edited profile, section or entry does not exist.
+            OSError: The resume could not be read or written.
+
+        Returns:
+            bool: True if anything was written.
+        """
+        if not self.pending:
+            return False
+
+        document = self._load()
+        missing: list[FieldKey] = []
+        for key, value in self.pending.items():
+            profile, section, index, field = key
+            try:
+                entry = document[profile][0][section][index]
+            except LookupError:
+                missing.append(key)
+                continue
+            entry[field] = _string_like(entry.get(field), value)
+
+        for key in missing:
+            del self.pending[key]
+
+        written = False
+        if self.pending:
+            self._write(document)
+            self.pending.clear()
+            written = True
+
+        if missing:
+            names = ", ".join(
+                    "/".join(str(part) for part in key) for key in missing
+            )
+            raise LookupError(f"Dropped edits of missing entries: {names}")
+
+        return written
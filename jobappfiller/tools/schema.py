@@ -0,0 +1,73 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Names of the sections and fields in the resume configuration file.
+
+Kept free of imports so the CLI can declare its options without loading the
+rest of the package.
+"""
+
+# Fields of each experience entry in the resume configuration.
+EXPERIENCE_FIELDS: tuple[str, ...] = (
+        "name",
+        "location",
+        "startdate",
+        "enddate",
+        "jobtitle",
+        "description",
+)
+
+# Fields of each education entry in the resume configuration.
+EDUCATION_FIELDS: tuple[str, ...] = (
+        "name",
+        "location",
+        "startdate",
+        "enddate",
+        "degree",
+        "description",
+)
+
+# Fields of each skill entry in the resume configuration.
+SKILL_FIELDS: tuple[str, ...] = (
+        "name",
+        "level",
+        "description",
+)
+
+# Fields of each certification entry in the resume configuration.
+CERTIFICATION_FIELDS: tuple[str, ...] = (
+        "name",
+        "issuer",
+        "date",
+        "credentialid",
+)
+
+# Fields of each reference entry in the resume configuration.
+REFERENCE_FIELDS: tuple[str, ...] = (
+        "name",
+        "jobtitle",
+        "company",
+        "email",
+        "phone",
+)
+
+# Every section of a profile, mapped to the fields of its entries. Adding a
+# section here is all the section engine needs to project it.
+SECTIONS: dict[str, tuple[str, ...]] = {
+        "experience": EXPERIENCE_FIELDS,
+        "education": EDUCATION_FIELDS,
+        "skills": SKILL_FIELDS,
+        "certifications": CERTIFICATION_FIELDS,
+        "references": REFERENCE_FIELDS,
+}
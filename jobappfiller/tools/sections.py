@@ -0,0 +1,128 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Schema-driven projection of the sections of a resume profile.
+
+Each section declared in `jobappfiller.tools.schema.SECTIONS` (e.g.
+`experience` or `education`) is an array of tables inside a profile. The
+projector turns a section into one column per field in a single pass over its
+entries. `ResumeSections` projects each section the first time it is read, so
+sections a caller never touches cost nothing.
+"""
+
+import threading
+from collections.abc import Mapping
+
+from jobappfiller.tools.schema import SECTIONS
+from jobappfiller.util import memprofile
+
+
+def section_entries(
+        resume_data: dict,
+        section: str,
+        profile: str = "default"
+) -> list[Mapping]:
+    """Gets the entries of a section of a profile.
+
+    Args:
+        resume_data (dict): Parsed dictionary of resume data.
+        section (str): Name of the section, e.g. "education".
+        profile (str, optional): Name of the profile. Defaults to "default".
+
+    Raises:
+        KeyError: `profile` is not in `resume_data`.
+
+    Returns:
+        list[Mapping]: The entries, or an empty list if the profile has no
+            such section.
+    """
+    profile_data = resume_data.get(profile)
+    if not profile_data:
+        raise KeyError(f"No profile named \"{profile}\".")
+
+    return profile_data[0].get(section, [])
+
+
+def project_section(
+        resume_data: dict,
+        section: str,
+        profile: str = "default",
+        fields: tuple[str, ...] | None = None
+) -> dict[str, list[str]]:
+    """Projects the entries of a section into one column per field.
+
+    Args:
+        resume_data (dict): Parsed dictionary of resume data.
+        section (str): Name of the section, e.g. "education".
+        profile (str, optional): Name of the profile. Defaults to "default".
+        fields (tuple[str, ...] | None, optional): Fields to project.
+            Defaults to the fields declared for `section` in `SECTIONS`.
+
+    Raises:
+        KeyError: `section` is not declared and no `fields` were given, or
+            `profile` is not in `resume_data`.
+
+    Returns:
+        dict[str, list[str]]: Column of each field, in entry order. Fields an
+            entry leaves out are empty strings.
+    """
+    if fields is None:
+        fields = SECTIONS[section]
+
+    columns: dict[str, list[str]] = {field: [] for field in fields}
+    appends = [(field, columns[field].append) for field in fields]
+    for entry in section_entries(resume_data, section, profile):
+        for field, append in appends:
+            append(entry.get(field, ""))
+
+    return columns
+
+
+class ResumeSections(Mapping):
+    """Columns of every declared section of a profile, projected lazily.
+
+    `sections["education"]["degree"]` projects the education section on
+    first use and then returns its cached column.
+    """
+
+    def __init__(self, resume_data: dict, profile: str = "default"):
+        self.resume_data = resume_data
+        self.profile = profile
+        self._columns: dict[str, dict[str, list[str]]] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, section: str) -> dict[str, list[str]]:
+        if section not in SECTIONS:
+            raise KeyError(section)
+
+        with self._lock:
+            if section not in self._columns:
+                with memprofile.stage("projection"):
+                    self._columns[section] = project_section(
+                            self.resume_data,
+                            section,
+                            self.profile
+                    )
+            return self._columns[section]
+
+    def __iter__(self):
+        return iter(SECTIONS)
+
+    def __len__(self) -> int:
+        return len(SECTIONS)
+
+    def is_loaded(self, section: str) -> bool:
+        """Checks whether `section` was already projected."""
+        return section in self._columns
@@ -0,0 +1,204 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Immutable resume snapshots that can be shared between threads.
+
+A `ResumeSnapshot` copies the experience of a `ResumeDataGen` into frozen
+records and tuples, so any number of threads can read it without locks.
+A `SnapshotHolder` serves the current snapshot of a resume file. Reloading
+builds a complete new snapshot first and then replaces the holder's
+reference in a single assignment, so readers see either the old or the new
+resume, never a mix of both.
+"""
+
+import dataclasses
+import threading
+import types
+from collections.abc import Mapping
+
+from jobappfiller.tools.lookup import CompanyIndex, CompanyLookup
+from jobappfiller.tools.resume_cache import file_fingerprint, invalidate
+from jobappfiller.tools.resume_data_gen import (
+        DATE_FORMATS,
+        DEFAULT_DATE_FORMAT,
+        ResumeDataGen
+)
+from jobappfiller.tools.resume_source import is_seekable_file
+from jobappfiller.tools.schema import EXPERIENCE_FIELDS
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ExperienceRecord:
+    """A single experience entry, with dates as stored in the resume."""
+
+    name: str
+    location: str
+    startdate: str
+    enddate: str
+    jobtitle: str
+    description: str
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ResumeSnapshot(CompanyLookup):
+    """Read-only copy of the experience of one profile of a resume.
+
+    Attributes:
+        resume_config_file (str): Path of the resume the snapshot was taken
+            from.
+        profile (str): Profile the snapshot was taken from.
+        fingerprint (tuple[int, int] | None): Fingerprint of the resume file
+            when it was read, or None for stdin.
+        date_format (str): Default date format of `get`.
+        entries (tuple[ExperienceRecord, ...]): The experience entries.
+        company_list (tuple[str, ...]): Company name of each entry.
+        startdate_formats (Mapping[str, tuple[str, ...]]): Start dates keyed
+            by date format.
+        enddate_formats (Mapping[str, tuple[str, ...]]): End dates keyed by
+            date format.
+    """
+
+    resume_config_file: str
+    profile: str
+    fingerprint: tuple[int, int] | None
+    date_format: str
+    entries: tuple[ExperienceRecord, ...]
+    company_list: tuple[str, ...]
+    startdate_formats: Mapping[str, tuple[str, ...]]
+    enddate_formats: Mapping[str, tuple[str, ...]]
+    _company_index: CompanyIndex = dataclasses.field(repr=False)
+
+    @classmethod
+    def from_resume(
+            cls,
+            resume_config_file: str,
+            resume_data: ResumeDataGen
+    ) -> "ResumeSnapshot":
+        """Takes a snapshot of a loaded resume.
+
+        Args:
+            resume_config_file (str): Path the resume was loaded from.
+            resume_data (ResumeDataGen): The loaded resume.
+
+        Returns:
+            ResumeSnapshot: The snapshot.
+        """
+        experience = resume_data.sections["experience"]
+        entries = tuple(
+                ExperienceRecord(*row)
+                for row in zip(*(experience[field]
+                                 for field in EXPERIENCE_FIELDS))
+        )
+
+        return cls(
+                resume_config_file=resume_config_file,
+                profile=resume_data.profile,
+                fingerprint=resume_data.fingerprint,
+                date_format=resume_data.date_format,
+                entries=entries,
+                company_list=tuple(entry.name for entry in entries),
+                # The tables hold tuples, so read-only views make them fully
+                # immutable.
+                startdate_formats=types.MappingProxyType(
+                        dict(resume_data.startdate_formats)
+                ),
+                enddate_formats=types.MappingProxyType(
+                        dict(resume_data.enddate_formats)
+                ),
+                _company_index=resume_data.company_index
+        )
+
+    @property
+    def company_index(self) -> CompanyIndex:
+        """CompanyIndex: Lookup index of the company names."""
+        return self._company_index
+
+    def _field_value(self, idx: int, field: str) -> str:
+        return getattr(self.entries[idx], field)
+
+
+class SnapshotHolder:
+    """Serves the current snapshot of a resume, swapping it on reload.
+
+    Reading `current` takes no lock. Reloads are serialized with a lock so
+    two reloads never race, but readers are never blocked by them.
+    """
+
+    def __init__(
+            self,
+            resume_config_file: str,
+            date_format: str | None = None,
+            profile: str = "default"
+    ):
+        """Loads the first snapshot.
+
+        Args:
+            resume_config_file (str): Path to the resume.
+            date_format (str | None, optional): Default date format of the
+                snapshots. Defaults to "MM/dd/yyyy".
+            profile (str, optional): Profile to serve. Defaults to "default".
+        """
+        self.resume_config_file = resume_config_file
+        self.date_format = (
+                date_format
+                if date_format in DATE_FORMATS else DEFAULT_DATE_FORMAT
+        )
+        self.profile = profile
+        self._reload_lock = threading.Lock()
+        self._current = self._load()
+
+    @property
+    def current(self) -> ResumeSnapshot:
+        """ResumeSnapshot: The latest loaded snapshot."""
+        return self._current
+
+    def _load(self) -> ResumeSnapshot:
+        resume_data = ResumeDataGen(
+                self.resume_config_file,
+                date_format=self.date_format,
+                profile=self.profile
+        )
+        return ResumeSnapshot.from_resume(self.resume_config_file, resume_data)
+
+    def reload(self) -> ResumeSnapshot:
+        """Loads a new snapshot and makes it the current one.
+
+        The resume is always read again, even if its fingerprint did not
+        change. Readers holding the previous snapshot keep using it unchanged.
+
+        Returns:
+            ResumeSnapshot: The new snapshot.
+        """
+        with self._reload_lock:
+            invalidate(self.resume_config_file)
+            snapshot = self._load()
+            self._current = snapshot
+
+        return snapshot
+
+    def reload_if_changed(self) -> bool:
+        """Reloads the snapshot if the resume file changed since it was read.
+
+        Returns:
+            bool: True if a new snapshot was loaded.
+        """
+        if not is_seekable_file(self.resume_config_file):
+            return False
+        if file_fingerprint(self.resume_config_file) == \
+                self._current.fingerprint:
+            return False
+
+        self.reload()
+        return True
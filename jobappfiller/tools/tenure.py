@@ -0,0 +1,248 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tenure analytics over the date ranges of resume entries.
+
+Entries are turned into day intervals, then a single sort-and-sweep over
+their start and end points yields the total non-overlapping tenure, the time
+covered by more than one entry, and the gaps between entries, in
+O(n log n) for n entries. Tenure per job title keyword merges the intervals
+of the entries whose title contains the keyword the same way.
+"""
+
+import dataclasses
+import datetime
+from collections import defaultdict
+from typing import NamedTuple
+
+from jobappfiller.tools.rank import tokenize
+
+DAYS_PER_YEAR: float = 365.2425
+
+
+class Interval(NamedTuple):
+    """Days covered by an entry, from `start` up to but excluding `end`.
+
+    Days are proleptic Gregorian ordinals, see `datetime.date.toordinal`.
+    """
+
+    start: int
+    end: int
+
+
+def parse_date(date_str: str) -> int | None:
+    """Parses a "MM/dd/yyyy" date into a day ordinal.
+
+    Args:
+        date_str (str): Date from the resume configuration.
+
+    Returns:
+        int | None: The day ordinal, or None if `date_str` is not a date
+            (e.g. "Present").
+    """
+    parts = date_str.split("/")
+    if len(parts) != 3:
+        return None
+    try:
+        month, day, year = (int(part) for part in parts)
+        return datetime.date(year, month, day).toordinal()
+    except ValueError:
+        return None
+
+
+def entry_intervals(
+        startdates: list[str],
+        enddates: list[str],
+        today: datetime.date | None = None
+) -> list[Interval | None]:
+    """Turns the start and end dates of entries into intervals.
+
+    Args:
+        startdates (list[str]): Start date of each entry, "MM/dd/yyyy".
+        enddates (list[str]): End date of each entry, "MM/dd/yyyy". End dates
+            that are not dates, such as "Present", mean `today`.
+        today (datetime.date | None, optional): Date open-ended entries end
+            on. Defaults to the current date.
+
+    Returns:
+        list[Interval | None]: Interval of each entry, or None for entries
+            without a valid start date or ending before they start.
+    """
+    today_ordinal = (today or datetime.date.today()).toordinal()
+
+    intervals: list[Interval | None] = []
+    for startdate, enddate in zip(startdates, enddates):
+        start = parse_date(startdate)
+        end = parse_date(enddate)
+        if end is None:
+            end = today_ordinal
+        intervals.append(
+                Interval(start, end)
+                if start is not None and start <= end else None
+        )
+
+    return intervals
+
+
+def sweep(intervals: list[Interval]) -> tuple[list[Interval], list[Interval]]:
+    """Merges intervals and finds where they overlap in one sweep.
+
+    Args:
+        intervals (list[Interval]): Intervals in any order.
+
+    Returns:
+        tuple[list[Interval], list[Interval]]: The merged intervals covered
+            by at least one interval, and those covered by at least two, both
+            sorted and non-overlapping.
+    """
+    # Ends sort before starts on the same day, so back-to-back entries are
+    # neither merged into an overlap nor split by a zero-day gap.
+    events = sorted(
+            [(interval.start, 1) for interval in intervals]
+            + [(interval.end, -1) for interval in intervals]
+    )
+
+    covered: list[Interval] = []
+    overlaps: list[Interval] = []
+    depth = 0
+    covered_start = overlap_start = 0
+    for day, change in events:
+        if change > 0:
+            if depth == 0:
+                covered_start = day
+            elif depth == 1:
+                overlap_start = day
+        depth += change
+        if change < 0:
+            if depth == 1 and day > overlap_start:
+                _append_merged(overlaps, Interval(overlap_start, day))
+            elif depth == 0 and day > covered_start:
+                _append_merged(covered, Interval(covered_start, day))
+
+    return covered, overlaps
+
+
+def _append_merged(intervals: list[Interval], interval: Interval) -> None:
+    if intervals and intervals[-1].end >= interval.start:
+        intervals[-1] = Interval(intervals[-1].start, interval.end)
+    else:
+        intervals.append(interval)
+
+
+def total_days(intervals: list[Interval]) -> int:
+    """Gets the number of days covered by non-overlapping intervals."""
+    return sum(interval.end - interval.start for interval in intervals)
+
+
+def gaps(covered: list[Interval]) -> list[Interval]:
+    """Gets the gaps between sorted, non-overlapping intervals."""
+    return [
+            Interval(before.end, after.start)
+            for before, after in zip(covered, covered[1:])
+            if after.start > before.end
+    ]
+
+
+@dataclasses.dataclass
+class TenureReport:
+    """Tenure of a set of resume entries.
+
+    Attributes:
+        covered (list[Interval]): Merged intervals covered by any entry.
+        overlaps (list[Interval]): Merged intervals covered by more than one
+            entry.
+        gaps (list[Interval]): Intervals between entries.
+        keywords (dict[str, int]): Days covered by the entries whose job title
+            contains each keyword, longest first.
+    """
+
+    covered: list[Interval]
+    overlaps: list[Interval]
+    gaps: list[Interval]
+    keywords: dict[str, int]
+
+    @property
+    def total_days(self) -> int:
+        """int: Days covered by any entry, counting overlaps once."""
+        return total_days(self.covered)
+
+    @property
+    def overlap_days(self) -> int:
+        """int: Days covered by more than one entry."""
+        return total_days(self.overlaps)
+
+    @property
+    def gap_days(self) -> int:
+        """int: Days between the first and last entry not covered by any."""
+        return total_days(self.gaps)
+
+
+def analyze_tenure(
+        startdates: list[str],
+        enddates: list[str],
+        jobtitles: list[str],
+        today: datetime.date | None = None
+) -> TenureReport:
+    """Computes total tenure, overlaps, gaps and tenure per title keyword.
+
+    Args:
+        startdates (list[str]): Start date of each entry, "MM/dd/yyyy".
+        enddates (list[str]): End date of each entry, "MM/dd/yyyy", or e.g.
+            "Present" for current entries.
+        jobtitles (list[str]): Job title of each entry.
+        today (datetime.date | None, optional): Date open-ended entries end
+            on. Defaults to the current date.
+
+    Returns:
+        TenureReport: The tenure of the entries.
+    """
+    intervals = entry_intervals(startdates, enddates, today)
+
+    by_keyword: defaultdict[str, list[Interval]] = defaultdict(list)
+    for interval, jobtitle in zip(intervals, jobtitles):
+        if interval is None:
+            continue
+        for keyword in set(tokenize(jobtitle)):
+            by_keyword[keyword].append(interval)
+
+    covered, overlaps = sweep(
+            [interval for interval in intervals if interval is not None]
+    )
+    keywords = sorted(
+            (
+                    (keyword, total_days(sweep(keyword_intervals)[0]))
+                    for keyword, keyword_intervals in by_keyword.items()
+            ),
+            key=lambda item: (-item[1], item[0])
+    )
+
+    return TenureReport(
+            covered=covered,
+            overlaps=overlaps,
+            gaps=gaps(covered),
+            keywords=dict(keywords)
+    )
+
+
+def format_years(days: int) -> str:
+    """Formats a number of days as years with one decimal, e.g. "2.5"."""
+    return f"{days / DAYS_PER_YEAR:.1f}"
+
+
+def format_interval(interval: Interval) -> str:
+    """Formats an interval as "MM/dd/yyyy - MM/dd/yyyy"."""
+    start = datetime.date.fromordinal(interval.start)
+    end = datetime.date.fromordinal(interval.end)
+    return f"{start:%m/%d/%Y} - {end:%m/%d/%Y}"
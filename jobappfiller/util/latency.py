@@ -0,0 +1,282 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Event-loop latency monitoring for the Tk GUI.
+
+An `after()` heartbeat measures how late the Tk event loop runs its timers,
+and code that handles user input wraps its work in `measure()`, which does
+nothing unless a `LatencyMonitor` is active. The last samples of each
+measurement are kept in a fixed-size ring buffer, so the statistics are
+rolling and the monitor uses constant memory however long the GUI runs.
+
+The monitor also works under Xvfb for automated GUI performance tests:
+
+    with LatencyMonitor() as monitor:
+        app = TkinterApp(resume_config_file="resume.toml")
+        monitor.attach(app)
+        for _ in range(100):
+            app.update()
+        app.destroy()
+
+    assert monitor.stats("event loop lag").p99 < 0.05
+"""
+
+import array
+import contextlib
+import dataclasses
+import math
+import sys
+import time
+
+_active_monitor: "LatencyMonitor | None" = None
+
+HEARTBEAT: str = "event loop lag"
+
+
+class RingBuffer:
+    """Fixed-size buffer of the most recent float samples."""
+
+    def __init__(self, capacity: int):
+        self.capacity = max(capacity, 1)
+        self._samples = array.array("d", bytes(8 * self.capacity))
+        self._next = 0
+        self._count = 0
+        self.total = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, sample: float) -> None:
+        """Adds a sample, overwriting the oldest one once the buffer is full."""
+        self._samples[self._next] = sample
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self.total += 1
+
+    def samples(self) -> list[float]:
+        """Gets the samples in the buffer, oldest first."""
+        if self._count < self.capacity:
+            return self._samples[:self._count].tolist()
+        return (
+                self._samples[self._next:].tolist()
+                + self._samples[:self._next].tolist()
+        )
+
+
+@dataclasses.dataclass
+class LatencyStats:
+    """Rolling latency statistics of a single measurement, in seconds.
+
+    Attributes:
+        name (str): Name of the measurement.
+        count (int): Number of samples recorded since the monitor started.
+        p50 (float): Median of the samples in the ring buffer.
+        p95 (float): 95th percentile of the samples in the ring buffer.
+        p99 (float): 99th percentile of the samples in the ring buffer.
+        max (float): Largest sample in the ring buffer.
+    """
+
+    name: str
+    count: int
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+def percentile(sorted_samples: list[float], p: float) -> float:
+    """Gets the nearest-rank percentile of sorted samples.
+
+    Args:
+        sorted_samples (list[float]): Samples in ascending order.
+        p (float): Percentile between 0 and 100.
+
+    Returns:
+        float: The percentile, or 0.0 if there are no samples.
+    """
+    if not sorted_samples:
+        return 0.0
+    rank = max(math.ceil(p / 100 * len(sorted_samples)), 1)
+    return sorted_samples[rank - 1]
+
+
+class LatencyMonitor:
+    """Records event-loop lag and the duration of each `measure()`."""
+
+    def __init__(self, capacity: int = 1024, interval_ms: int = 50):
+        """Creates the monitor.
+
+        Args:
+            capacity (int, optional): Number of samples kept per measurement.
+                Defaults to 1024.
+            interval_ms (int, optional): Period of the heartbeat, in
+                milliseconds. Defaults to 50.
+        """
+        self.capacity = capacity
+        self.interval_ms = interval_ms
+        self.buffers: dict[str, RingBuffer] = {}
+        self._root = None
+        self._after_id: str | None = None
+        self._expected: float = 0.0
+
+    def start(self) -> None:
+        """Makes this the active monitor."""
+        global _active_monitor
+        _active_monitor = self
+
+    def stop(self) -> None:
+        """Stops the heartbeat and deactivates this monitor."""
+        global _active_monitor
+        if _active_monitor is self:
+            _active_monitor = None
+        self.detach()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def record(self, name: str, seconds: float) -> None:
+        """Adds a latency sample.
+
+        Args:
+            name (str): Name of the measurement, e.g. "frame switch".
+            seconds (float): Measured latency in seconds.
+        """
+        if name not in self.buffers:
+            self.buffers[name] = RingBuffer(self.capacity)
+        self.buffers[name].append(seconds)
+
+    @contextlib.contextmanager
+    def measure(self, name: str):
+        """Records how long the body of the `with` block takes.
+
+        Args:
+            name (str): Name of the measurement, e.g. "frame switch".
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def attach(self, root, hotkey: str | None = "<F12>") -> None:
+        """Starts the heartbeat on a Tk window.
+
+        Args:
+            root: Tk window whose event loop is measured.
+            hotkey (str | None, optional): Key sequence that writes the report
+                to stderr. Defaults to "<F12>"; None binds no key.
+        """
+        self.detach()
+        self._root = root
+        if hotkey is not None:
+            root.bind_all(hotkey, lambda event: self.dump())
+        self._schedule()
+
+    def detach(self) -> None:
+        """Stops the heartbeat."""
+        if self._root is not None and self._after_id is not None:
+            try:
+                self._root.after_cancel(self._after_id)
+            except Exception:  # pylint: disable=W0718
+                # The window may already be destroyed.
+                pass
+        self._root = None
+        self._after_id = None
+
+    def _schedule(self) -> None:
+        self._expected = time.perf_counter() + self.interval_ms / 1000
+        self._after_id = self._root.after(self.interval_ms, self._beat)
+
+    def _beat(self) -> None:
+        # A timer can never fire early, so any delay is time the event loop
+        # spent busy with something else.
+        self.record(HEARTBEAT, max(time.perf_counter() - self._expected, 0.0))
+        if self._root is not None:
+            self._schedule()
+
+    def stats(self, name: str) -> LatencyStats:
+        """Gets the rolling statistics of a measurement.
+
+        Args:
+            name (str): Name of the measurement.
+
+        Raises:
+            KeyError: Nothing was recorded under `name`.
+
+        Returns:
+            LatencyStats: Percentiles of the samples in the ring buffer.
+        """
+        buffer = self.buffers[name]
+        samples = sorted(buffer.samples())
+        return LatencyStats(
+                name=name,
+                count=buffer.total,
+                p50=percentile(samples, 50),
+                p95=percentile(samples, 95),
+                p99=percentile(samples, 99),
+                max=samples[-1] if samples else 0.0
+        )
+
+    def report(self) -> str:
+        """Formats the statistics of every measurement.
+
+        Returns:
+            str: A human-readable report.
+        """
+        lines: list[str] = []
+        for name in self.buffers:
+            stats = self.stats(name)
+            lines.append(
+                    f"[{name}] n={stats.count} "
+                    f"p50={_format_ms(stats.p50)} "
+                    f"p95={_format_ms(stats.p95)} "
+                    f"p99={_format_ms(stats.p99)} "
+                    f"max={_format_ms(stats.max)}"
+            )
+
+        if not lines:
+            return "No latency samples were recorded."
+        return "\n".join(lines)
+
+    def dump(self) -> None:
+        """Writes the report to stderr."""
+        print(self.report(), file=sys.stderr, flush=True)
+
+
+def _format_ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f}ms"
+
+
+def active_monitor() -> LatencyMonitor | None:
+    """Gets the active monitor, if there is one."""
+    return _active_monitor
+
+
+def measure(name: str):
+    """Times a block with the active monitor, if there is one.
+
+    Args:
+        name (str): Name of the measurement, e.g. "frame switch".
+
+    Returns:
+        A context manager timing the body of the `with` block.
+    """
+    if _active_monitor is None:
+        return contextlib.nullcontext()
+    return _active_monitor.measure(name)
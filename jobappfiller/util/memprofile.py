@@ -0,0 +1,256 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Per-stage memory profiling built on `tracemalloc`.
+
+Code that wants to be measured wraps its work in `stage()`, which does
+nothing unless a `MemoryProfiler` is active:
+
+    with MemoryProfiler() as profiler:
+        ResumeDataGen("resume.toml")
+
+    assert profiler.stages["parse"].peak < 10 * 1024 * 1024
+    print(profiler.report())
+
+`tracemalloc` traces the whole process, so only one stage is measured at a
+time: a stage started by another thread while one is running is not
+measured, and allocations other threads make during a stage are counted in
+it. Run the code under test from a single thread for exact figures.
+"""
+
+import contextlib
+import dataclasses
+import threading
+import tracemalloc
+
+_active_profiler: "MemoryProfiler | None" = None
+
+_IGNORED_FILES = (
+        __file__,
+        tracemalloc.__file__,
+        "<frozen importlib._bootstrap>",
+        "<frozen importlib._bootstrap_external>",
+        "<unknown>",
+)
+
+
+@dataclasses.dataclass
+class AllocationSite:
+    """Memory allocated at a single source line during a stage."""
+
+    location: str
+    size: int
+    count: int
+
+
+@dataclasses.dataclass
+class StageStats:
+    """Memory usage of a single profiled stage.
+
+    Attributes:
+        name (str): Name of the stage.
+        peak (int): Peak traced memory while the stage ran, in bytes.
+        retained (int): Memory still allocated by the stage once it ended,
+            in bytes.
+        sites (list[AllocationSite]): Allocation sites ranked by the memory
+            they retained.
+    """
+
+    name: str
+    peak: int = 0
+    retained: int = 0
+    sites: list[AllocationSite] = dataclasses.field(default_factory=list)
+
+    def merge(self, other: "StageStats", top: int) -> None:
+        """Folds another run of the same stage into these statistics."""
+        self.peak = max(self.peak, other.peak)
+        self.retained += other.retained
+
+        merged: dict[str, AllocationSite] = {
+                site.location: dataclasses.replace(site)
+                for site in self.sites
+        }
+        for site in other.sites:
+            if site.location in merged:
+                merged[site.location].size += site.size
+                merged[site.location].count += site.count
+            else:
+                merged[site.location] = dataclasses.replace(site)
+        self.sites = sorted(
+                merged.values(),
+                key=lambda site: site.size,
+                reverse=True
+        )[:top]
+
+
+class MemoryProfiler:
+    """Records peak and retained memory for each `stage()`."""
+
+    def __init__(self, top: int = 10):
+        """Creates the profiler.
+
+        Args:
+            top (int, optional): Number of allocation sites kept per stage.
+                Defaults to 10.
+        """
+        self.top = top
+        self.stages: dict[str, StageStats] = {}
+        self._started_tracing = False
+        # Nesting depth per thread, and held by the one measured stage.
+        self._local = threading.local()
+        self._measuring = threading.Lock()
+
+    def start(self) -> None:
+        """Starts tracing allocations and makes this the active profiler."""
+        global _active_profiler
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        _active_profiler = self
+
+    def stop(self) -> None:
+        """Stops tracing allocations if this profiler started it."""
+        global _active_profiler
+        if _active_profiler is self:
+            _active_profiler = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """Measures the memory used by the body of the `with` block.
+
+        Nested stages are folded into the outermost one, since resetting the
+        peak inside a running stage would lose the outer measurement. For the
+        same reason, a stage is not measured while another thread's stage is
+        running.
+
+        Args:
+            name (str): Name of the stage, e.g. "parse".
+        """
+        depth = getattr(self._local, "depth", 0)
+        if depth > 0 or not tracemalloc.is_tracing():
+            yield
+            return
+        if not self._measuring.acquire(blocking=False):
+            yield
+            return
+
+        try:
+            self._local.depth = 1
+            try:
+                before = tracemalloc.take_snapshot()
+                start_current, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                yield
+            finally:
+                self._local.depth = 0
+
+            current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            stats = StageStats(
+                    name=name,
+                    peak=max(peak - start_current, 0),
+                    retained=current - start_current,
+                    sites=self._rank_sites(after, before)
+            )
+            if name in self.stages:
+                self.stages[name].merge(stats, self.top)
+            else:
+                self.stages[name] = stats
+        finally:
+            self._measuring.release()
+
+    def _rank_sites(
+            self,
+            after: tracemalloc.Snapshot,
+            before: tracemalloc.Snapshot
+    ) -> list[AllocationSite]:
+        filters = [
+                tracemalloc.Filter(False, filename)
+                for filename in _IGNORED_FILES
+        ]
+        differences = after.filter_traces(filters).compare_to(
+                before.filter_traces(filters),
+                "lineno"
+        )
+
+        sites: list[AllocationSite] = []
+        for difference in differences:
+            if difference.size_diff <= 0:
+                continue
+            frame = difference.traceback[0]
+            sites.append(
+                    AllocationSite(
+                            location=f"{frame.filename}:{frame.lineno}",
+                            size=difference.size_diff,
+                            count=difference.count_diff
+                    )
+            )
+            if len(sites) >= self.top:
+                break
+
+        return sites
+
+    def report(self) -> str:
+        """Formats the recorded stages and their top allocation sites.
+
+        Returns:
+            str: A human-readable report.
+        """
+        lines: list[str] = []
+        for stats in self.stages.values():
+            lines.append(
+                    f"[{stats.name}] peak={_format_size(stats.peak)} "
+                    f"retained={_format_size(stats.retained)}"
+            )
+            for rank, site in enumerate(stats.sites, start=1):
+                lines.append(
+                        f"  {rank:>2}. {_format_size(site.size):>10} "
+                        f"{site.count:>7} blocks  {site.location}"
+                )
+
+        if not lines:
+            return "No profiled stages were run."
+        return "\n".join(lines)
+
+
+def _format_size(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} B"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def stage(name: str):
+    """Profiles a stage with the active profiler, if there is one.
+
+    Args:
+        name (str): Name of the stage, e.g. "parse".
+
+    Returns:
+        A context manager measuring the body of the `with` block.
+    """
+    if _active_profiler is None:
+        return contextlib.nullcontext()
+    return _active_profiler.stage(name)
@@ -0,0 +1,54 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Interning of the strings of parsed resumes.
+
+Tailored profiles and similar resumes repeat the same company names,
+locations and description paragraphs. `intern_strings` passes every string
+of a parsed resume through `sys.intern`, so each occurrence of the same
+content references a single string object and memory scales with the unique
+text loaded rather than the total text. The interpreter's table does not
+keep strings alive, so the text of a resume is released with the last
+structure referencing it.
+"""
+
+import sys
+from typing import Any
+
+
+def intern_strings(data: Any) -> Any:
+    """Interns every string of a parsed resume, including table keys.
+
+    Dictionaries and lists are updated in place; other values, including
+    the read-only mappings of compiled resumes, are returned unchanged.
+
+    Args:
+        data (Any): Parsed resume data.
+
+    Returns:
+        Any: `data` with its strings replaced by the interned strings.
+    """
+    if isinstance(data, str):
+        return sys.intern(data)
+    if isinstance(data, dict):
+        items = [
+                (sys.intern(key), intern_strings(value))
+                for key, value in data.items()
+        ]
+        data.clear()
+        data.update(items)
+    elif isinstance(data, list):
+        data[:] = [intern_strings(value) for value in data]
+
+    return data
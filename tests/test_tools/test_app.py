@@ -0,0 +1,59 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+from jobappfiller.tools.app import LiveTabs, load_resume_view_data
+
+
+def test_least_recently_shown_tab_is_evicted():
+    live_tabs = LiveTabs(2)
+
+    assert not live_tabs.touch("a", "tab a")
+    assert not live_tabs.touch("b", "tab b")
+    # Showing "a" again makes "b" the least recently shown tab.
+    assert not live_tabs.touch("a", "tab a")
+    assert live_tabs.touch("c", "tab c") == ["tab b"]
+    assert "b" not in live_tabs
+    assert "a" in live_tabs and "c" in live_tabs
+
+    live_tabs.discard("a")
+    assert not live_tabs.touch("d", "tab d")
+    assert len(live_tabs) == 2
+
+
+def test_resumes_load_concurrently(conf_file, tmp_path):
+    resume_files = []
+    for i in range(4):
+        resume_file = tmp_path / f"resume{i}.toml"
+        shutil.copy(conf_file, resume_file)
+        resume_files.append(resume_file)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+                executor.submit(
+                        load_resume_view_data,
+                        resume_file,
+                        date_format="yyyy-MM"
+                ) for resume_file in resume_files
+        ]
+        loaded = [future.result() for future in futures]
+
+    for resume_data in loaded:
+        # Every column shown by the view was computed by the worker.
+        assert "company_list" in vars(resume_data)
+        assert "startdate_formats" in vars(resume_data)
+        assert resume_data.company_list[1] == "American Express"
+        assert resume_data.startdate_list == ["2023-09", "2022-07"]
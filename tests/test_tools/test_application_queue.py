@@ -0,0 +1,145 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from jobappfiller.tools.application_queue import (
+        load_bundles,
+        prepare_queue,
+        read_postings,
+        stale_bundles,
+        truncate
+)
+
+POSTINGS_STR: str = """
+[[posting]]
+title = "Data Engineer"
+company = "Acme"
+datefmt = "yyyy-MM"
+text = "Migrate Teradata to Hive"
+
+[posting.limits]
+description = 40
+
+[[posting]]
+title = "Cloud Developer"
+company = "Globex"
+resume = "missing.toml"
+"""
+
+
+def test_truncate_at_word_boundary():
+    assert truncate("Migrate massive", None) == "Migrate massive"
+    assert truncate("Migrate massive dataset", 18) == "Migrate massive"
+    assert truncate("Migrate massive dataset", 15) == "Migrate massive"
+    assert truncate("Supercalifragilistic", 5) == "Super"
+
+
+def test_truncate_multi_line_text():
+    assert truncate("Led the\nmigration of data", 12) == "Led the"
+    assert truncate("Led the\tmigration", 9) == "Led the"
+    assert truncate("Led the\n\nmigration", 9) == "Led the"
+
+
+def test_prepare_queue(conf_file, tmp_path):
+    postings_file = tmp_path / "postings.toml"
+    postings_file.write_text(POSTINGS_STR, encoding="utf-8")
+    bundles_file = str(tmp_path / "postings.bundles.json")
+
+    postings = read_postings(str(postings_file), resume_config_file=conf_file)
+    bundles = prepare_queue(postings, bundles_file, max_workers=2)
+
+    assert load_bundles(bundles_file) == bundles
+    first, second = bundles
+    assert first["error"] is None
+    assert [entry["name"] for entry in first["entries"]] == [
+            "American Express",
+            "TAKKION (TP&L Management Solutions)",
+    ]
+    assert first["entries"][0]["startdate"] == "2022-07"
+    assert all(len(entry["description"]) <= 40 for entry in first["entries"])
+    assert second["entries"] == []
+    assert second["error"].startswith("FileNotFoundError")
+
+
+def test_postings_need_a_resume(tmp_path):
+    postings_file = tmp_path / "postings.toml"
+    postings_file.write_text(POSTINGS_STR, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        read_postings(str(postings_file))
+
+
+def test_postings_limits_must_be_non_negative_integers(tmp_path):
+    postings_file = tmp_path / "postings.toml"
+    for limit in ("-1", "\"500\"", "12.5", "true"):
+        postings_file.write_text(
+                POSTINGS_STR.replace("description = 40",
+                                     f"description = {limit}"),
+                encoding="utf-8"
+        )
+
+        with pytest.raises(ValueError, match="Posting 1"):
+            read_postings(str(postings_file), resume_config_file="r.toml")
+
+
+def test_prepare_queue_removes_temporary_file_on_failure(
+        conf_file,
+        tmp_path,
+        monkeypatch
+):
+    postings_file = tmp_path / "postings.toml"
+    postings_file.write_text(POSTINGS_STR, encoding="utf-8")
+    postings = read_postings(str(postings_file), resume_config_file=conf_file)
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("os.replace", fail_replace)
+    with pytest.raises(OSError):
+        prepare_queue(postings, str(tmp_path / "out.json"), max_workers=1)
+
+    assert not list(tmp_path.glob("*.tmp"))
+    assert not (tmp_path / "out.json").exists()
+
+
+def test_bundles_of_edited_resumes_are_stale(conf_file, tmp_path):
+    resume_file = tmp_path / "resume.toml"
+    resume_file.write_bytes(conf_file.read_bytes())
+    postings_file = tmp_path / "postings.toml"
+    postings_file.write_text(POSTINGS_STR, encoding="utf-8")
+    bundles_file = str(tmp_path / "postings.bundles.json")
+
+    postings = read_postings(
+            str(postings_file),
+            resume_config_file=str(resume_file)
+    )
+    prepare_queue(postings, bundles_file, max_workers=1)
+    bundles = load_bundles(bundles_file)
+    assert not stale_bundles(bundles)
+
+    with open(resume_file, "a", encoding="utf-8") as f:
+        f.write("\n# Edited.\n")
+
+    assert stale_bundles(bundles) == [bundles[0]]
+
+
+def test_load_bundles_rejects_other_files(tmp_path):
+    bundles_file = tmp_path / "postings.bundles.json"
+    for contents in ("not json", "{}", "{\"bundles\": [1]}"):
+        bundles_file.write_text(contents, encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            load_bundles(str(bundles_file))
@@ -0,0 +1,93 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import gc
+import weakref
+
+import tomlkit
+
+import pytest
+
+from jobappfiller.tools.compiled_resume import (
+        CompiledResume,
+        compile_resume,
+        compile_resume_data
+)
+from jobappfiller.tools.parse_job_config import list_companies, parse_resume
+from jobappfiller.tools.resume_cache import load_resume
+from jobappfiller.tools.resume_data_gen import ResumeDataGen
+
+
+def test_compiled_resume_roundtrip(conf_file, tmp_path):
+    compiled_file = tmp_path / "resume.jafc"
+    compile_resume(conf_file, compiled_file)
+
+    with CompiledResume(compiled_file) as compiled:
+        experience = compiled["default"][0]["experience"]
+        assert len(experience) == 2
+        assert experience[1]["name"] == "American Express"
+        assert compiled.to_dict() == parse_resume(conf_file)
+
+
+def test_compiled_resume_as_config_file(conf_file, tmp_path):
+    compiled_file = tmp_path / "resume.jafc"
+    compile_resume(conf_file, compiled_file)
+
+    resume_data = ResumeDataGen(compiled_file, date_format="yyyy-MM")
+
+    assert resume_data.company_list == list_companies(parse_resume(conf_file))
+    assert resume_data.startdate_list[1] == "2022-07"
+    assert list_companies(parse_resume(compiled_file)) == [
+            "TAKKION (TP&L Management Solutions)",
+            "American Express"
+    ]
+
+
+def test_compile_rejects_values_it_can_not_store():
+    with pytest.raises(ValueError, match="default.experience\\[0\\].years"):
+        compile_resume_data(
+                {"default": [{"experience": [{"name": "A", "years": 2}]}]}
+        )
+    with pytest.raises(ValueError, match="default.links"):
+        compile_resume_data({"default": [{"links": ["a", "b"]}]})
+    with pytest.raises(ValueError, match="title"):
+        compile_resume_data({"title": "Resume", "default": [{}]})
+
+
+def test_replaced_compiled_resume_stays_readable(conf_file, tmp_path):
+    compiled_file = tmp_path / "resume.jafc"
+    compile_resume(conf_file, compiled_file)
+    reader = ResumeDataGen(str(compiled_file))
+    old = load_resume(str(compiled_file))
+
+    # Recompile from a resume without its first entry.
+    with open(conf_file, "r", encoding="utf-8") as f:
+        document = tomlkit.load(f)
+    del document["default"][0]["experience"][0]
+    shorter_file = tmp_path / "shorter.toml"
+    shorter_file.write_text(tomlkit.dumps(document), encoding="utf-8")
+    compile_resume(shorter_file, compiled_file)
+    new = load_resume(str(compiled_file))
+
+    assert new is not old
+    assert new.data["default"][0]["experience"][0]["name"] == "American Express"
+    # Readers of the previous contents keep their mapping until they let go.
+    assert reader.company_list[1] == "American Express"
+    assert not old.data.buffer.closed
+
+    mapping = weakref.ref(old.data)
+    del reader, old
+    gc.collect()
+    assert mapping() is None
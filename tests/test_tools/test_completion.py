@@ -0,0 +1,70 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from click.shell_completion import ShellComplete
+
+from jobappfiller import cli as jaf_cli
+from jobappfiller.tools import completion
+
+
+def _complete(args: list[str], incomplete: str) -> list[str]:
+    shell_complete = ShellComplete(jaf_cli.cli, {}, "jobappfiller", "_JAF")
+    return [
+            item.value
+            for item in shell_complete.get_completions(args, incomplete)
+    ]
+
+
+def test_complete_company(conf_file, tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert _complete(["get", "-f", str(conf_file), "-c"], "am") == [
+            "American Express"
+    ]
+    assert _complete(["get", "-f", str(conf_file), "-p"], "") == ["default"]
+    assert "description" in _complete(["get", "--field"], "d")
+
+
+def test_sidecar_index_reused_until_resume_changes(
+        conf_file,
+        tmp_path,
+        monkeypatch
+):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    profiles = completion.completion_index(conf_file)
+
+    def fail(resume_config_file):
+        raise AssertionError(f"{resume_config_file} was parsed again.")
+
+    monkeypatch.setattr(completion, "_build_sidecar_index", fail)
+    assert completion.completion_index(conf_file) == profiles
+
+
+def test_sidecar_files_of_similar_paths_differ(
+        conf_file,
+        tmp_path,
+        monkeypatch
+):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    first = tmp_path / "a" / "b%c.toml"
+    second = tmp_path / "a%b" / "c.toml"
+    for resume_file in (first, second):
+        resume_file.parent.mkdir()
+        resume_file.write_bytes(conf_file.read_bytes())
+
+    completion.completion_index(str(first))
+    completion.completion_index(str(second))
+
+    assert len(list((tmp_path / "cache").rglob("*.json"))) == 2
@@ -0,0 +1,74 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import os
+import threading
+
+from jobappfiller.tools.journal import (
+        INDEX_SUFFIX,
+        ApplicationJournal,
+        journal_history
+)
+
+
+def test_journal_history(tmp_path):
+    journal_file = str(tmp_path / "journal.jsonl")
+
+    with ApplicationJournal(journal_file) as journal:
+        journal.record("American Express", "description")
+        journal.record("American Express", "jobtitle")
+        journal.record("TAKKION", "description")
+
+    assert journal_history(journal_file, "company") == [
+            ("American Express", 2),
+            ("TAKKION", 1)
+    ]
+    assert journal_history(journal_file, "field")[0] == ("description", 2)
+    assert sum(count for _, count in journal_history(journal_file, "day")) == 3
+
+
+def test_journal_index_is_incremental_across_rotation(tmp_path):
+    journal_file = str(tmp_path / "journal.jsonl")
+
+    with ApplicationJournal(journal_file, max_bytes=200) as journal:
+        for _ in range(3):
+            journal.record("American Express", "location")
+        journal_history(journal_file, "company")
+        for _ in range(3):
+            journal.record("American Express", "location")
+
+    assert (tmp_path / "journal.jsonl.1").exists()
+    assert journal_history(journal_file, "company") == [("American Express", 6)]
+
+    with open(journal_file + INDEX_SUFFIX, "r", encoding="utf-8") as f:
+        index = json.load(f)
+    assert index["total"] == 6
+
+
+def test_small_batch_is_synced_by_timer(tmp_path, monkeypatch):
+    journal_file = str(tmp_path / "journal.jsonl")
+    synced = threading.Event()
+    fsync = os.fsync
+
+    def record_fsync(fd):
+        fsync(fd)
+        synced.set()
+
+    monkeypatch.setattr(os, "fsync", record_fsync)
+    with ApplicationJournal(journal_file, fsync_interval=0.05) as journal:
+        journal.record("American Express", "location")
+        assert synced.wait(5)
+        assert journal_history(journal_file, "field") == [("location", 1)]
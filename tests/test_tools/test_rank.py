@@ -0,0 +1,39 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from jobappfiller.tools.rank import tokenize
+from jobappfiller.tools.resume_cache import load_resume
+from jobappfiller.tools.resume_data_gen import ResumeDataGen
+
+
+def test_tokenize():
+    assert tokenize("The C# and Python developer") == ["c#", "python", "developer"]
+
+
+def test_rank_experience(conf_file):
+    resume_data = ResumeDataGen(conf_file)
+
+    ranking = resume_data.rank("Python SQL developer with Hive experience")
+    assert [idx for idx, _ in ranking] == [1, 0]
+    assert resume_data.rank("serverless webhooks", top=1)[0][0] == 0
+    assert resume_data.rank("kubernetes") == []
+
+
+def test_rank_index_cached_with_parse_result(conf_file):
+    ResumeDataGen(conf_file).rank("python")
+    cached_resume = load_resume(conf_file)
+
+    assert cached_resume is load_resume(conf_file)
+    assert cached_resume.derive("experience_index", None) is not None
@@ -13,6 +13,10 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import tomlkit
+
+import pytest
+
 from jobappfiller.tools.resume_data_gen import ResumeDataGen
 
 
@@ -21,3 +25,61 @@ def test_company_list(conf_file):
 
     assert resume_data.company_list[0] == "TAKKION (TP&L Management Solutions)"
     assert resume_data.company_list[1] == "American Express"
+
+
+def test_all_date_formats_precomputed(conf_file):
+    resume_data = ResumeDataGen(conf_file, date_format="yyyy/MM")
+
+    assert resume_data.startdate_list == ["2023/09", "2022/07"]
+    assert resume_data.startdate_formats["MM-dd-yyyy"][0] == "09-01-2023"
+    assert resume_data.enddate_formats["yyyy-MM-dd"][1] == "2023-09-01"
+    assert resume_data.enddate_formats["MM/yyyy"][0] == "03/2025"
+
+
+def test_get_field_by_company_prefix(conf_file):
+    resume_data = ResumeDataGen(conf_file)
+
+    assert resume_data.get("american express", "location") == "Phoenix, AZ"
+    assert resume_data.get("Express", "startdate", "yyyy-MM") == "2022-07"
+    assert resume_data.get("takk", "jobtitle") == "IT Cloud Developer"
+    with pytest.raises(KeyError):
+        resume_data.get("Google", "jobtitle")
+
+
+def test_get_field_of_repeated_company(conf_file, tmp_path):
+    with open(conf_file, "r", encoding="utf-8") as f:
+        document = tomlkit.load(f)
+    experience = document["default"][0]["experience"]
+    second_role = dict(experience[1])
+    second_role["jobtitle"] = "Senior Python Developer"
+    experience.append(second_role)
+    resume_file = tmp_path / "resume.toml"
+    resume_file.write_text(tomlkit.dumps(document), encoding="utf-8")
+
+    resume_data = ResumeDataGen(resume_file)
+
+    with pytest.raises(ValueError):
+        resume_data.get("American Express", "jobtitle")
+    assert resume_data.get(
+            "American Express",
+            "jobtitle",
+            index=1
+    ) == "Python & SQL Developer"
+    assert resume_data.get(
+            "express",
+            "jobtitle",
+            index=2
+    ) == "Senior Python Developer"
+    with pytest.raises(KeyError):
+        resume_data.get("American Express", "jobtitle", index=3)
+
+
+def test_columns_computed_on_first_access(conf_file):
+    resume_data = ResumeDataGen(conf_file)
+
+    assert "company_list" not in vars(resume_data)
+    assert "startdate_formats" not in vars(resume_data)
+    assert resume_data.company_list[1] == "American Express"
+    assert "company_list" in vars(resume_data)
+    assert "startdate_formats" not in vars(resume_data)
+    assert resume_data.enddate_list == ["03/01/2025", "09/01/2023"]
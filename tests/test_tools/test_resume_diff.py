@@ -0,0 +1,71 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from jobappfiller.tools.resume_data_gen import ResumeDataGen
+from jobappfiller.tools.resume_diff import FieldChange, diff_resumes
+
+
+def test_diff_identical_resumes(conf_file):
+    diff = diff_resumes(ResumeDataGen(conf_file), ResumeDataGen(conf_file))
+
+    assert not diff
+    assert diff.unchanged == 2
+
+
+def test_diff_reports_added_removed_and_changed(conf_file, tmp_path):
+    tailored = conf_file.read_text(encoding="utf-8").replace(
+            "Phoenix, AZ",
+            "Tempe, AZ"
+    ).replace(
+            "TAKKION (TP&L Management Solutions)",
+            "Takkion"
+    )
+    tailored_file = tmp_path / "tailored.toml"
+    tailored_file.write_text(tailored, encoding="utf-8")
+
+    master = ResumeDataGen(conf_file)
+    diff = diff_resumes(master, ResumeDataGen(str(tailored_file)))
+
+    assert diff.removed == ["TAKKION (TP&L Management Solutions)"]
+    assert diff.added == ["Takkion"]
+    assert diff.changed == [
+            FieldChange(
+                    "American Express",
+                    "location",
+                    "Phoenix, AZ",
+                    "Tempe, AZ"
+            )
+    ]
+    assert diff.unchanged == 0
+
+
+def test_diff_compares_edited_columns(conf_file):
+    master = ResumeDataGen(conf_file)
+    tailored = ResumeDataGen(conf_file)
+    assert not diff_resumes(master, tailored)
+
+    tailored.set_value(0, "jobtitle", "Cloud Developer")
+    diff = diff_resumes(master, tailored)
+
+    assert diff.changed == [
+            FieldChange(
+                    "TAKKION (TP&L Management Solutions)",
+                    "jobtitle",
+                    "IT Cloud Developer",
+                    "Cloud Developer"
+            )
+    ]
+    assert diff.unchanged == 1
+    assert not diff_resumes(master, ResumeDataGen(conf_file))
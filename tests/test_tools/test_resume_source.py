@@ -0,0 +1,70 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import bz2
+import gzip
+import io
+import lzma
+import sys
+
+import pytest
+
+from jobappfiller.tools.parse_job_config import parse_resume
+from jobappfiller.tools.resume_data_gen import ResumeDataGen
+from jobappfiller.tools.resume_source import ResumeSourceError
+
+
+@pytest.mark.parametrize(
+        "suffix, module",
+        [(".gz", gzip), (".xz", lzma), (".bz2", bz2)]
+)
+def test_compressed_resume(conf_file, tmp_path, suffix, module):
+    compressed_file = tmp_path / f"resume.toml{suffix}"
+    compressed_file.write_bytes(module.compress(conf_file.read_bytes()))
+
+    assert parse_resume(compressed_file) == parse_resume(conf_file)
+
+
+def test_stdin_resume(conf_file, monkeypatch):
+    monkeypatch.setattr(
+            sys,
+            "stdin",
+            io.TextIOWrapper(io.BytesIO(conf_file.read_bytes()))
+    )
+    resume_data = ResumeDataGen("-")
+
+    assert resume_data.company_list[1] == "American Express"
+
+
+@pytest.mark.parametrize("module", [gzip, lzma, bz2])
+def test_compressed_stdin_resume(conf_file, monkeypatch, module):
+    monkeypatch.setattr(
+            sys,
+            "stdin",
+            io.TextIOWrapper(io.BytesIO(module.compress(conf_file.read_bytes())))
+    )
+
+    assert parse_resume("-") == parse_resume(conf_file)
+
+
+def test_binary_stdin_resume_is_rejected(monkeypatch):
+    monkeypatch.setattr(
+            sys,
+            "stdin",
+            io.TextIOWrapper(io.BytesIO(b"\x00\xff\xfe"))
+    )
+
+    with pytest.raises(ResumeSourceError):
+        parse_resume("-")
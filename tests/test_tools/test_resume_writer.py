@@ -0,0 +1,151 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import gzip
+
+import pytest
+
+from jobappfiller.tools.parse_job_config import parse_resume
+from jobappfiller.tools.resume_data_gen import ResumeDataGen
+from jobappfiller.tools.resume_writer import ResumeWriter
+
+RESUME_STR: str = """# My resume.
+[[default]]
+
+[[default.experience]]
+name = "American Express"  # Current job.
+location = "Phoenix, AZ"
+startdate = "07/01/2022"
+enddate = "09/01/2023"
+jobtitle = "Python & SQL Developer"
+description = \"\"\"\\
+    Migrate massive dataset from Teradata to Hive.\\
+    \"\"\"
+"""
+
+
+def test_writer_patches_only_edited_values(tmp_path):
+    resume_file = tmp_path / "resume.toml"
+    resume_file.write_text(RESUME_STR, encoding="utf-8")
+
+    writer = ResumeWriter(str(resume_file))
+    assert not writer.flush()
+    writer.set("default", "experience", 0, "location", "Tempe, AZ")
+    writer.set("default", "experience", 0, "location", "Mesa, AZ")
+    writer.set("default", "experience", 0, "description", "Line one.\nTwo.")
+    assert writer.flush()
+
+    contents = resume_file.read_text(encoding="utf-8")
+    assert contents.startswith("# My resume.\n")
+    assert 'name = "American Express"  # Current job.\n' in contents
+    assert 'location = "Mesa, AZ"\n' in contents
+    assert 'description = """Line one.\nTwo."""\n' in contents
+    assert not list(tmp_path.glob("*.tmp"))
+
+    entry = parse_resume(str(resume_file))["default"][0]["experience"][0]
+    assert entry["location"] == "Mesa, AZ"
+    assert entry["jobtitle"] == "Python & SQL Developer"
+
+
+def test_writer_rejects_compressed_resumes(tmp_path):
+    resume_file = tmp_path / "resume.toml.gz"
+    resume_file.write_bytes(gzip.compress(RESUME_STR.encode("utf-8")))
+
+    with pytest.raises(ValueError):
+        ResumeWriter(str(resume_file))
+
+
+def test_set_value_refreshes_dates(conf_file):
+    resume_data = ResumeDataGen(conf_file, date_format="yyyy-MM")
+    assert resume_data.startdate_list[1] == "2022-07"
+
+    resume_data.set_value(1, "startdate", "08/01/2022")
+    resume_data.set_value(1, "jobtitle", "SQL Developer")
+
+    assert resume_data.startdate_list[1] == "2022-08"
+    assert resume_data.get("express", "jobtitle") == "SQL Developer"
+    assert ResumeDataGen(conf_file).jobtitle_list[1] == "Python & SQL Developer"
+
+
+def test_writer_reports_missing_entries_once(tmp_path):
+    resume_file = tmp_path / "resume.toml"
+    resume_file.write_text(RESUME_STR, encoding="utf-8")
+
+    writer = ResumeWriter(str(resume_file))
+    writer.set("default", "experience", 5, "location", "Tempe, AZ")
+    writer.set("default", "experience", 0, "location", "Mesa, AZ")
+    with pytest.raises(LookupError):
+        writer.flush()
+
+    assert not writer.pending
+    assert not writer.flush()
+    entry = parse_resume(str(resume_file))["default"][0]["experience"][0]
+    assert entry["location"] == "Mesa, AZ"
+
+
+def test_writer_removes_temporary_file_on_failure(tmp_path, monkeypatch):
+    resume_file = tmp_path / "resume.toml"
+    resume_file.write_text(RESUME_STR, encoding="utf-8")
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("os.replace", fail_replace)
+    writer = ResumeWriter(str(resume_file))
+    writer.set("default", "experience", 0, "location", "Mesa, AZ")
+    with pytest.raises(OSError):
+        writer.flush()
+
+    assert not list(tmp_path.glob("*.tmp"))
+    assert writer.pending
+    assert resume_file.read_text(encoding="utf-8") == RESUME_STR
+
+
+def test_reload_after_save_refreshes_derived_structures(tmp_path):
+    resume_file = tmp_path / "resume.toml"
+    resume_file.write_text(RESUME_STR, encoding="utf-8")
+    resume_data = ResumeDataGen(str(resume_file))
+    assert resume_data.find_company("express") == 0
+    fingerprints = resume_data.fingerprints()
+
+    writer = ResumeWriter(str(resume_file))
+    writer.set("default", "experience", 0, "name", "Amex")
+    writer.set("default", "experience", 0, "jobtitle", "Data Engineer")
+    assert writer.flush()
+    resume_data.reload()
+
+    assert resume_data.company_list == ["Amex"]
+    assert resume_data.find_company("amex") == 0
+    with pytest.raises(KeyError):
+        resume_data.find_company("express")
+    assert resume_data.rank("data engineer")[0][0] == 0
+    assert resume_data.fingerprints() != fingerprints
+
+
+def test_reload_takes_over_resume_loaded_elsewhere(tmp_path):
+    resume_file = tmp_path / "resume.toml"
+    resume_file.write_text(RESUME_STR, encoding="utf-8")
+    resume_data = ResumeDataGen(str(resume_file), date_format="yyyy-MM")
+    assert resume_data.startdate_list == ["2022-07"]
+
+    writer = ResumeWriter(str(resume_file))
+    writer.set("default", "experience", 0, "startdate", "08/01/2022")
+    assert writer.flush()
+    fresh = ResumeDataGen(str(resume_file), date_format="yyyy-MM")
+    assert fresh.startdate_list == ["2022-08"]
+    resume_data.reload(fresh)
+
+    assert resume_data.startdate_list is fresh.startdate_list
+    assert resume_data.get("express", "startdate") == "2022-08"
@@ -0,0 +1,64 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import tomllib
+
+import pytest
+
+from jobappfiller.tools.parse_job_config import list_companies
+from jobappfiller.tools.schema import EDUCATION_FIELDS
+from jobappfiller.tools.sections import ResumeSections, project_section
+
+RESUME_DATA: dict = tomllib.loads(
+        """
+[[default]]
+
+[[default.experience]]
+name = "American Express"
+jobtitle = "Python & SQL Developer"
+
+[[default.education]]
+name = "Arizona State University"
+degree = "B.S. Computer Science"
+
+[[default.education]]
+name = "Mesa Community College"
+degree = "A.S. Mathematics"
+"""
+)
+
+
+def test_project_section_columns():
+    columns = project_section(RESUME_DATA, "education")
+
+    assert tuple(columns) == EDUCATION_FIELDS
+    assert columns["degree"] == ["B.S. Computer Science", "A.S. Mathematics"]
+    assert columns["location"] == ["", ""]
+    assert project_section(RESUME_DATA, "references")["email"] == []
+    assert list_companies(RESUME_DATA) == ["American Express"]
+
+
+def test_sections_are_projected_on_first_access():
+    sections = ResumeSections(RESUME_DATA)
+
+    assert sections["experience"]["jobtitle"] == ["Python & SQL Developer"]
+    assert sections.is_loaded("experience")
+    assert not sections.is_loaded("education")
+    assert sections["education"]["name"][1] == "Mesa Community College"
+    with pytest.raises(KeyError):
+        sections["hobbies"]  # pylint: disable=W0104
+    tailored = ResumeSections(RESUME_DATA, profile="tailored")
+    with pytest.raises(KeyError):
+        tailored["experience"]  # pylint: disable=W0104
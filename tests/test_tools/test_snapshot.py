@@ -0,0 +1,103 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import dataclasses
+import os
+import shutil
+import threading
+
+import pytest
+
+from jobappfiller.tools.snapshot import SnapshotHolder
+
+
+@pytest.fixture
+def resume_file(conf_file, tmp_path):
+    copy_file = tmp_path / "resume.toml"
+    shutil.copy(conf_file, copy_file)
+    return copy_file
+
+
+def test_snapshot_is_immutable(conf_file):
+    snapshot = SnapshotHolder(conf_file, date_format="yyyy-MM").current
+
+    assert snapshot.company_list[1] == "American Express"
+    assert snapshot.company_list is snapshot.company_list
+    assert snapshot.get("express", "startdate") == "2022-07"
+    assert snapshot.get("takk", "enddate", "MM/yyyy") == "03/2025"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.entries[0].location = "Denver, CO"
+    with pytest.raises(TypeError):
+        snapshot.startdate_formats["yyyy-MM"] = ()
+
+
+def test_reload_swaps_snapshot(resume_file):
+    contents = resume_file.read_text(encoding="utf-8")
+    holder = SnapshotHolder(str(resume_file))
+    old = holder.current
+
+    assert not holder.reload_if_changed()
+    resume_file.write_text(
+            contents.replace("Phoenix, AZ", "Tempe, AZ"),
+            encoding="utf-8"
+    )
+
+    assert holder.reload_if_changed()
+    assert holder.current.get("express", "location") == "Tempe, AZ"
+    assert old.get("express", "location") == "Phoenix, AZ"
+
+
+def test_reload_reads_resume_with_unchanged_fingerprint(resume_file):
+    contents = resume_file.read_text(encoding="utf-8")
+    stat = os.stat(resume_file)
+    holder = SnapshotHolder(str(resume_file))
+
+    # A rewrite of the same size within the timestamp resolution.
+    resume_file.write_text(
+            contents.replace("Phoenix, AZ", "Phoenix, CA"),
+            encoding="utf-8"
+    )
+    os.utime(resume_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert holder.reload().get("express", "location") == "Phoenix, CA"
+
+
+def test_readers_never_see_half_updated_resume(resume_file):
+    original = resume_file.read_text(encoding="utf-8")
+    holder = SnapshotHolder(str(resume_file))
+    locations = {("Broomfield, CO", "Phoenix, AZ"), ("Boulder, CO", "Mesa, AZ")}
+    seen = set()
+    done = threading.Event()
+
+    def read():
+        while not done.is_set():
+            snapshot = holder.current
+            seen.add(tuple(entry.location for entry in snapshot.entries))
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for i in range(20):
+        contents = original
+        if i % 2 == 0:
+            contents = contents.replace("Broomfield, CO", "Boulder, CO")
+            contents = contents.replace("Phoenix, AZ", "Mesa, AZ")
+        resume_file.write_text(contents, encoding="utf-8")
+        holder.reload()
+    done.set()
+    for reader in readers:
+        reader.join()
+
+    assert seen <= locations
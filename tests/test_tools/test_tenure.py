@@ -0,0 +1,78 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import datetime
+import random
+
+from jobappfiller.tools.resume_data_gen import ResumeDataGen
+from jobappfiller.tools.tenure import (
+        Interval,
+        analyze_tenure,
+        format_years,
+        sweep
+)
+
+
+def test_sweep_merges_and_finds_overlaps():
+    covered, overlaps = sweep(
+            [Interval(10, 20), Interval(1, 5), Interval(5, 8), Interval(12, 15)]
+    )
+
+    assert covered == [Interval(1, 8), Interval(10, 20)]
+    assert overlaps == [Interval(12, 15)]
+
+
+def test_tenure_overlaps_gaps_and_keywords():
+    report = analyze_tenure(
+            ["01/01/2018", "01/01/2019", "01/01/2021", "Unknown"],
+            ["01/01/2020", "Present", "01/01/2022", "Present"],
+            ["Python Developer", "Senior Developer", "Engineer", "Intern"],
+            today=datetime.date(2020, 1, 1)
+    )
+
+    assert report.total_days == 730 + 365
+    assert report.overlap_days == 365
+    assert report.gaps == [
+            Interval(
+                    datetime.date(2020, 1, 1).toordinal(),
+                    datetime.date(2021, 1, 1).toordinal()
+            )
+    ]
+    assert list(report.keywords)[0] == "developer"
+    assert report.keywords["developer"] == 730
+    assert "intern" not in report.keywords
+
+
+def test_tenure_of_many_entries_matches_day_count():
+    rng = random.Random(0)
+    startdates, enddates, covered_days = [], [], set()
+    for _ in range(5000):
+        start = rng.randrange(730000, 740000)
+        end = start + rng.randrange(1, 400)
+        covered_days.update(range(start, end))
+        startdates.append(f"{datetime.date.fromordinal(start):%m/%d/%Y}")
+        enddates.append(f"{datetime.date.fromordinal(end):%m/%d/%Y}")
+
+    report = analyze_tenure(startdates, enddates, ["Developer"] * 5000)
+
+    assert report.total_days == len(covered_days)
+    assert report.keywords == {"developer": len(covered_days)}
+
+
+def test_resume_tenure(conf_file):
+    report = ResumeDataGen(conf_file).tenure()
+
+    assert format_years(report.total_days) == "2.7"
+    assert report.overlap_days == 0 and not report.gaps
@@ -0,0 +1,91 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import time
+
+from jobappfiller.util import latency
+from jobappfiller.util.latency import LatencyMonitor, RingBuffer, percentile
+
+
+class FakeRoot:
+    """Stands in for a Tk window, running timers only when asked to."""
+
+    def __init__(self):
+        self.timers = []
+        self.bindings = {}
+
+    def after(self, delay_ms, callback):  # pylint: disable=W0613
+        self.timers.append(callback)
+        return f"after#{len(self.timers)}"
+
+    def after_cancel(self, after_id):  # pylint: disable=W0613
+        self.timers.clear()
+
+    def bind_all(self, sequence, callback):
+        self.bindings[sequence] = callback
+
+    def run_timers(self):
+        timers, self.timers = self.timers, []
+        for callback in timers:
+            callback()
+
+
+def test_ring_buffer_keeps_most_recent_samples():
+    buffer = RingBuffer(3)
+    for sample in range(5):
+        buffer.append(float(sample))
+
+    assert buffer.samples() == [2.0, 3.0, 4.0]
+    assert len(buffer) == 3 and buffer.total == 5
+
+
+def test_percentiles():
+    samples = [float(sample) for sample in range(1, 101)]
+
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 95) == 0.0
+
+
+def test_measure_only_records_with_active_monitor():
+    with latency.measure("frame switch"):
+        pass
+
+    with LatencyMonitor(capacity=4) as monitor:
+        for _ in range(6):
+            with latency.measure("frame switch"):
+                pass
+
+    stats = monitor.stats("frame switch")
+    assert stats.count == 6
+    assert 0 <= stats.p50 <= stats.p95 <= stats.p99 <= stats.max
+    assert latency.active_monitor() is None
+    assert "[frame switch] n=6" in monitor.report()
+
+
+def test_heartbeat_records_event_loop_lag():
+    root = FakeRoot()
+    monitor = LatencyMonitor(interval_ms=1)
+    monitor.attach(root)
+
+    time.sleep(0.02)
+    root.run_timers()
+    root.run_timers()
+    monitor.detach()
+
+    stats = monitor.stats(latency.HEARTBEAT)
+    assert stats.count == 2
+    assert stats.max >= 0.01
+    assert "<F12>" in root.bindings and not root.timers
@@ -0,0 +1,56 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import threading
+
+from jobappfiller.tools.resume_cache import clear_cache
+from jobappfiller.tools.resume_data_gen import ResumeDataGen
+from jobappfiller.util.memprofile import MemoryProfiler
+
+
+def test_resume_load_memory_budget(conf_file):
+    # Earlier tests parsed the session's resume; measure a real parse.
+    clear_cache()
+    with MemoryProfiler() as profiler:
+        resume_data = ResumeDataGen(conf_file)
+        assert resume_data.company_list and resume_data.startdate_list
+
+    assert set(profiler.stages) == {"parse", "projection", "date formatting"}
+    assert profiler.stages["parse"].peak < 1024 * 1024
+    assert "[parse]" in profiler.report()
+
+
+def test_stages_of_other_threads_are_not_measured():
+    running = threading.Event()
+    release = threading.Event()
+
+    with MemoryProfiler() as profiler:
+
+        def outer():
+            with profiler.stage("outer"):
+                running.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=outer)
+        thread.start()
+        running.wait(5)
+        with profiler.stage("concurrent"):
+            data = [str(i) for i in range(1000)]
+        release.set()
+        thread.join()
+        with profiler.stage("after"):
+            data += [str(i) for i in range(1000)]
+
+    assert set(profiler.stages) == {"outer", "after"}
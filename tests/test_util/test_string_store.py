@@ -0,0 +1,45 @@
+# Copyright (C) 2025 Ash Hellwig <ahellwig.dev@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import sys
+
+from jobappfiller.tools.parse_job_config import parse_resume
+from jobappfiller.tools.resume_cache import clear_cache
+from jobappfiller.util.string_store import intern_strings
+
+
+def test_intern_strings_uses_interpreter_table():
+    name = "".join(["American", " Express"])
+    data = {"default": [{"experience": [{"name": name}]}]}
+
+    intern_strings(data)
+
+    assert data["default"][0]["experience"][0]["name"] is sys.intern(
+            "American Express"
+    )
+
+
+def test_parsed_resumes_share_strings(conf_file, tmp_path):
+    copy_file = tmp_path / "copy.toml"
+    with open(conf_file, "rb") as f:
+        copy_file.write_bytes(f.read())
+
+    clear_cache()
+    original = parse_resume(conf_file)["default"][0]["experience"]
+    copy = parse_resume(str(copy_file))["default"][0]["experience"]
+
+    assert original is not copy
+    assert original[0]["name"] is copy[0]["name"]
+    assert original[0]["description"] is copy[0]["description"]